@@ -0,0 +1,172 @@
+#!/usr/bin/env python3
+
+import argparse
+import asyncio
+import os
+import statistics
+import sys
+import time
+
+_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, _ROOT)
+
+from ezconsole import Choice, Console, GUI
+from ezconsole.abstract.headless import HeadlessConsole
+from ezconsole.abstract._vtinput import ESCAPE_TIMEOUT, VTInputParser
+
+
+_DOWN = b'\x1b[B'
+_QUIT = b'\x1b'
+
+
+class _PipeConsole(HeadlessConsole):
+
+    def __init__(self, rows: int, cols: int) -> None:
+
+        super().__init__(rows, cols)
+
+        self.frames = []
+        self._read_fd, self.write_fd = os.pipe()
+        self._parser = VTInputParser()
+        self._loop = None
+
+    def close(self, timeout: float = 0.1) -> None:
+
+        super().close(timeout)
+
+        if self._loop is not None:
+            self._loop.remove_reader(self._read_fd)
+            self._loop = None
+
+        for fd in (self._read_fd, self.write_fd):
+            os.close(fd)
+
+    def end_frame(self) -> None:
+
+        self.frames.append(time.perf_counter())
+
+    def _on_readable(self) -> None:
+
+        for event in self._parser.feed(os.read(self._read_fd, 4096)):
+            self.dispatch(event)
+
+        if self._parser.has_escape():
+            self._loop.call_later(ESCAPE_TIMEOUT, self._on_escape_timeout)
+
+    def _on_escape_timeout(self) -> None:
+
+        for event in self._parser.flush():
+            self.dispatch(event)
+
+    def register_input_callback(self, callback):
+
+        token = super().register_input_callback(callback)
+
+        self._loop = asyncio.get_running_loop()
+        self._loop.add_reader(self._read_fd, self._on_readable)
+
+        return token
+
+
+class _TimedChoice(Choice):
+
+    def __init__(self, items, handled) -> None:
+
+        super().__init__(items)
+        self._handled = handled
+
+    def handle_event(self, event) -> bool:
+
+        self._handled.append(time.perf_counter())
+        return super().handle_event(event)
+
+
+def _percentiles(samples):
+
+    samples = sorted(samples)
+
+    def at(fraction):
+        return samples[min(int(fraction * len(samples)), len(samples) - 1)]
+
+    return (statistics.mean(samples) * 1e6, at(0.5) * 1e6, at(0.99) * 1e6)
+
+
+async def _measure(rounds: int, rows: int):
+
+    backend = _PipeConsole(rows, 80)
+    handled = []
+    element = _TimedChoice([f"item {i}" for i in range(rows)], handled)
+    gui = GUI(element, console=Console('numpy', backend=backend),
+              frame_rate=0)
+
+    task = asyncio.ensure_future(gui.handle())
+    await asyncio.sleep(0.01)
+
+    sent = []
+    frame_latency = []
+
+    for _ in range(rounds):
+
+        frames = len(backend.frames)
+
+        sent.append(time.perf_counter())
+        os.write(backend.write_fd, _DOWN)
+
+        while len(backend.frames) == frames:
+            await asyncio.sleep(0)
+
+        frame_latency.append(backend.frames[-1] - handled[-1])
+
+    os.write(backend.write_fd, _QUIT)
+    await task
+
+    backend.close()
+
+    input_latency = [done - start for start, done in zip(sent, handled)]
+    return _percentiles(input_latency), _percentiles(frame_latency)
+
+
+def _loops():
+
+    yield 'asyncio', asyncio.new_event_loop
+
+    try:
+        import uvloop
+
+    except ImportError:
+        print("uvloop is not installed; skipping", file=sys.stderr)
+
+    else:
+        yield 'uvloop', uvloop.new_event_loop
+
+
+def main() -> None:
+
+    parser = argparse.ArgumentParser(
+        description="compare input and frame latency across event loops"
+    )
+    parser.add_argument('--rounds', type=int, default=2000)
+    parser.add_argument('--rows', type=int, default=40)
+    args = parser.parse_args()
+
+    print(f"{'loop':<10} {'metric':<8} {'mean us':>10} {'p50 us':>10} "
+          f"{'p99 us':>10}")
+
+    for name, factory in _loops():
+
+        loop = factory()
+
+        try:
+            results = loop.run_until_complete(_measure(args.rounds,
+                                                       args.rows))
+
+        finally:
+            loop.close()
+
+        for metric, (mean, p50, p99) in zip(('input', 'frame'), results):
+            print(f"{name:<10} {metric:<8} {mean:>10.1f} {p50:>10.1f} "
+                  f"{p99:>10.1f}")
+
+
+if __name__ == '__main__':
+    main()
@@ -3,12 +3,85 @@
 __all__ = [
     'Console',
     'ez_dialog',
+    'Bindings',
+    'Canvas',
+    'Chart',
     'Choice',
     'GUI',
+    'LogView',
+    'MultiProgress',
+    'Offload',
+    'PlainConsole',
+    'Player',
+    'Recorder',
+    'Server',
+    'Stack',
+    'Table',
+    'TextArea',
+    'TextInput',
 ]
 
 
-from .console import Console
-from .dialog import ez_dialog
-from .elements import Choice
-from .gui import GUI
+from typing import TYPE_CHECKING as _TYPE_CHECKING
+
+import importlib as _importlib
+
+
+_LAZY = {
+    'Console': '.console',
+    'ez_dialog': '.dialog',
+    'Bindings': '.bindings',
+    'Canvas': '.canvas',
+    'Chart': '.chart',
+    'Choice': '.elements',
+    'GUI': '.gui',
+    'LogView': '.logview',
+    'MultiProgress': '.progress',
+    'Offload': '.offload',
+    'PlainConsole': '.console',
+    'Player': '.recorder',
+    'Recorder': '.recorder',
+    'Server': '.server',
+    'Stack': '.elements',
+    'Table': '.table',
+    'TextArea': '.textinput',
+    'TextInput': '.textinput',
+}
+
+
+if _TYPE_CHECKING:
+    from .console import Console, PlainConsole
+    from .bindings import Bindings
+    from .canvas import Canvas
+    from .chart import Chart
+    from .dialog import ez_dialog
+    from .elements import Choice, Stack
+    from .gui import GUI
+    from .logview import LogView
+    from .offload import Offload
+    from .progress import MultiProgress
+    from .recorder import Player, Recorder
+    from .server import Server
+    from .table import Table
+    from .textinput import TextArea, TextInput
+
+
+def __getattr__(name: str):
+
+    try:
+        module = _LAZY[name]
+
+    except KeyError:
+        raise AttributeError(
+            f"module {__name__!r} has no attribute {name!r}"
+        ) from None
+
+    value = getattr(_importlib.import_module(module, __name__), name)
+    globals()[name] = value
+
+    return value
+
+
+def __dir__():
+
+    return sorted(set(globals()) | set(__all__))
@@ -0,0 +1,39 @@
+#!/usr/bin/env python3
+
+import numpy as _np
+
+
+_DIGITS = _np.array(list('0123456789'), dtype='=U1')
+
+
+def text_block(strings, width: int, fill: str = ' ') -> _np.ndarray:
+
+    strings = _np.asarray(strings)
+    n = len(strings)
+
+    if width <= 0:
+        return _np.zeros((n, 0), dtype='=U1')
+
+    block = strings.astype(f'=U{width}').view('=U1').reshape(n, width)
+
+    if fill:
+        block[block == ''] = fill
+
+    return block
+
+
+def number_block(values, width: int, fill: str = ' ') -> _np.ndarray:
+
+    values = _np.asarray(values, dtype=_np.int64)
+    n = len(values)
+
+    if width <= 0:
+        return _np.zeros((n, 0), dtype='=U1')
+
+    powers = 10 ** _np.arange(width - 1, -1, -1, dtype=_np.int64)
+    values = _np.clip(values, 0, 10 ** width - 1)[:, None]
+
+    block = _DIGITS[values // powers % 10]
+    block[(values < powers) & (powers > 1)] = fill
+
+    return block
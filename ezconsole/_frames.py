@@ -0,0 +1,87 @@
+#!/usr/bin/env python3
+
+from typing import (
+    Optional as _Optional,
+)
+
+from abc import abstractmethod as _abstractmethod
+
+import asyncio as _asyncio
+
+from .elements import (
+    _Container,
+    _Element,
+)
+
+
+class _FrameRoot(_Container):
+
+    def __init__(self, *, frame_rate: float,
+                 loop: _Optional[_asyncio.AbstractEventLoop] = None,
+                 **kwargs) -> None:
+
+        if frame_rate < 0:
+            raise ValueError("frame_rate cannot be negative")
+
+        super().__init__(**kwargs)
+
+        self._frame_interval = 1.0 / frame_rate if frame_rate else 0.0
+        self._next_frame = 0.0
+        self._frame_handle = None
+
+        self._loop = loop if loop is not None else _asyncio.get_running_loop()
+
+    def _wake(self) -> None:
+
+        loop = self._loop
+
+        if loop.is_closed():
+            return
+
+        try:
+            running = _asyncio.get_running_loop()
+
+        except RuntimeError:
+            running = None
+
+        if running is loop:
+            self._schedule_refresh()
+
+        else:
+            loop.call_soon_threadsafe(self._schedule_refresh)
+
+    def _schedule_at(self, when: float) -> None:
+
+        handle = self._frame_handle
+        loop = self._loop
+
+        if handle is not None:
+
+            if (not isinstance(handle, _asyncio.TimerHandle) or
+                    handle.when() <= max(when, loop.time())):
+                return
+
+            handle.cancel()
+
+        if loop.time() >= when:
+            self._frame_handle = loop.call_soon(self._refresh)
+
+        else:
+            self._frame_handle = loop.call_at(when, self._refresh)
+
+    def _schedule_refresh(self) -> None:
+
+        self._schedule_at(self._next_frame)
+
+    @_abstractmethod
+    def _refresh(self) -> None:
+
+        raise NotImplementedError
+
+    def invalidate_child(self, child: _Element) -> bool:
+
+        if not super().invalidate_child(child):
+            return False
+
+        self._schedule_refresh()
+        return True
@@ -0,0 +1,216 @@
+#!/usr/bin/env python3
+
+from typing import (
+    List as _List,
+    Optional as _Optional,
+    Sequence as _Sequence,
+    Tuple as _Tuple,
+)
+
+import numpy as _np
+
+from .buffer import Buffer as _Buffer
+
+
+def _resized(array: _np.ndarray, rows: int, cols: int) -> _np.ndarray:
+
+    try:
+        array.resize((rows, cols))
+
+    except ValueError:
+        pass
+
+    else:
+        return array
+
+    old_rows, old_cols = array.shape
+
+    if rows <= old_rows and cols == old_cols:
+        return array[:rows]
+
+    if rows <= old_rows and cols < old_cols:
+        return _np.ascontiguousarray(array[:rows, :cols])
+
+    new_array = _np.zeros((rows, cols), dtype=array.dtype)
+    new_array[:old_rows, :old_cols] = array[:rows, :cols]
+    return new_array
+
+
+def _styled_len(styles: _np.ndarray) -> _np.ndarray:
+
+    cols = styles.shape[1]
+    styled = styles[:, ::-1] != 0
+
+    return _np.where(styled.any(axis=1), cols - styled.argmax(axis=1), 0)
+
+
+def _line_view(cells: _np.ndarray) -> _np.ndarray:
+
+    rows, cols = cells.shape
+    return _np.ndarray((rows,), dtype=f'=U{cols}', buffer=cells)
+
+
+class NumpyBuffer(_Buffer):
+
+    kind = 'numpy'
+
+    def __init__(self, rows: int = 0, cols: int = 0) -> None:
+
+        self._cells = _np.zeros((rows, cols), dtype='=U1')
+        self._styles = None
+
+    @property
+    def shape(self) -> _Tuple[int, int]:
+
+        return self._cells.shape
+
+    def resize(self, rows: int, cols: int) -> None:
+
+        if (rows, cols) == self._cells.shape:
+            return
+
+        self._cells = _resized(self._cells, rows, cols)
+
+        if self._styles is not None:
+            self._styles = _resized(self._styles, rows, cols)
+
+    def get_cells(self) -> _np.ndarray:
+
+        return self._cells
+
+    def get_style_plane(self) -> _np.ndarray:
+
+        if self._styles is None:
+            self._styles = _np.zeros(self._cells.shape, dtype=_np.uint32)
+
+        return self._styles
+
+    def get_styles(self, y: int) -> _Optional[_np.ndarray]:
+
+        if self._styles is None:
+            return None
+
+        return self._styles[y]
+
+    def _styles_or_zeros(self) -> _np.ndarray:
+
+        if self._styles is None:
+            return _np.zeros(self._cells.shape, dtype=_np.uint32)
+
+        return self._styles
+
+    def get_line(self, y: int) -> str:
+
+        return str(_line_view(self._cells)[y])
+
+    def set_line(self, y: int, text: str) -> None:
+
+        _line_view(self._cells)[y] = text
+
+    def equals(self, other: _Buffer) -> bool:
+
+        if not (isinstance(other, NumpyBuffer) and
+                _np.array_equal(self._cells, other._cells)):
+            return False
+
+        if self._styles is None and other._styles is None:
+            return True
+
+        return _np.array_equal(self._styles_or_zeros(),
+                               other._styles_or_zeros())
+
+    def diff(self, prev: _Buffer) -> _List[_Tuple[int, str, int]]:
+
+        rows = self._cells.shape[0]
+        prev_rows = prev.shape[0]
+
+        if not isinstance(prev, NumpyBuffer):
+            prev = prev.convert(self.kind)
+
+        prev_lines = _line_view(prev._cells)
+        lines = _line_view(self._cells)
+        changed = lines[:prev_rows] != prev_lines[:rows]
+
+        styled = self._styles is not None or prev._styles is not None
+
+        if styled:
+            common = len(changed)
+            styles = self._styles_or_zeros()[:common]
+            prev_styles = prev._styles_or_zeros()[:common]
+
+            if styles.shape == prev_styles.shape:
+                changed |= (styles != prev_styles).any(axis=1)
+
+            else:
+                changed[:] = True
+
+        indices, = changed.nonzero()
+
+        if not len(indices):
+            return []
+
+        old_lens = _np.char.str_len(prev_lines[indices])
+
+        if prev._styles is not None:
+            old_lens = _np.maximum(old_lens,
+                                   _styled_len(prev._styles[indices]))
+
+        return list(zip(indices.tolist(), lines[indices].tolist(),
+                        old_lens.tolist()))
+
+    def copy(self, into: _Optional[_Buffer] = None) -> _Buffer:
+
+        if (isinstance(into, NumpyBuffer) and
+                into._cells.shape == self._cells.shape):
+            into._cells[:] = self._cells
+
+        else:
+            into = NumpyBuffer()
+            into._cells = self._cells.copy()
+
+        if self._styles is None:
+            into._styles = None
+
+        elif into._styles is not None and into._styles.shape == self.shape:
+            into._styles[:] = self._styles
+
+        else:
+            into._styles = self._styles.copy()
+
+        return into
+
+
+def empty_like(cells: _np.ndarray) -> _np.ndarray:
+
+    return _np.zeros(cells.shape, dtype=cells.dtype)
+
+
+def write_lines(cells: _np.ndarray, texts: _Sequence[str]) -> None:
+
+    rows, cols = cells.shape
+    count = min(len(texts), rows)
+
+    if cells.flags.c_contiguous:
+        lines = _line_view(cells)
+        lines[:count] = texts[:count]
+        lines[count:] = ''
+        return
+
+    if cols:
+        block = _np.asarray(texts[:count], dtype=f'=U{cols}')
+        cells[:count] = block.view('=U1').reshape(count, cols)
+
+    cells[count:] = ''
+
+
+def write_line(cells: _np.ndarray, row: int, text: str) -> None:
+
+    text = text[:cells.shape[1]]
+    n = len(text)
+
+    if n:
+        cells[row, :n] = _np.asarray(text, dtype=f'=U{n}').reshape(1).view(
+            '=U1'
+        )
+
+    cells[row, n:] = ''
@@ -6,8 +6,19 @@ __all__ = ['Console']
 import sys as _sys
 
 
-if _sys.platform == 'win32':
-    from .win32 import Win32Console as Console
+def __getattr__(name: str):
 
-else:
-    from .posix import POSIXConsole as Console
+    if name != 'Console':
+        raise AttributeError(
+            f"module {__name__!r} has no attribute {name!r}"
+        )
+
+    if _sys.platform == 'win32':
+        from .win32 import Win32Console as Console
+
+    else:
+        from .posix import POSIXConsole as Console
+
+    globals()['Console'] = Console
+
+    return Console
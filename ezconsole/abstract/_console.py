@@ -40,6 +40,16 @@ class _Console(metaclass=_ABCMeta):
     def line_at(self, y: int, text: str, tail: int = 0) -> None:
         raise NotImplementedError
 
+    def styled_line_at(self, y: int, text: str, styles: _Any,
+                       tail: int = 0) -> None:
+        self.line_at(y, text, tail)
+
+    def begin_frame(self) -> None:
+        pass
+
+    def end_frame(self) -> None:
+        pass
+
     @_abstractmethod
     def register_input_callback(self, callback: _Callable) -> _Any:
         raise NotImplementedError
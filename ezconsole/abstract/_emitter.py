@@ -0,0 +1,208 @@
+#!/usr/bin/env python3
+
+from typing import (
+    Any as _Any,
+    Callable as _Callable,
+    List as _List,
+    Optional as _Optional,
+)
+
+from .. import styles as _styles
+
+from ._terminfo import TermInfo as _TermInfo
+
+
+_FLAG_ON = (
+    (_styles.BOLD, '1'),
+    (_styles.DIM, '2'),
+    (_styles.ITALIC, '3'),
+    (_styles.UNDERLINE, '4'),
+    (_styles.BLINK, '5'),
+    (_styles.REVERSE, '7'),
+)
+
+_FLAG_OFF = (
+    (_styles.ITALIC, '23'),
+    (_styles.UNDERLINE, '24'),
+    (_styles.BLINK, '25'),
+    (_styles.REVERSE, '27'),
+)
+
+_INTENSITY = _styles.BOLD | _styles.DIM
+
+_MAX_CACHED_DELTAS = 4096
+
+_deltas = {}
+
+
+def _color(index: int, normal: int, bright: int, extended: int) -> str:
+
+    if index < 8:
+        return str(normal + index)
+
+    if index < 16:
+        return str(bright + index - 8)
+
+    return f'{extended};5;{index}'
+
+
+def _params(word: int) -> _List[str]:
+
+    fg, bg, flags = _styles.unpack(word)
+
+    params = [code for flag, code in _FLAG_ON if flags & flag]
+
+    if fg is not None:
+        params.append(_color(fg, 30, 90, 38))
+
+    if bg is not None:
+        params.append(_color(bg, 40, 100, 48))
+
+    return params
+
+
+def _delta_params(old: int, new: int) -> _List[str]:
+
+    old_fg, old_bg, old_flags = _styles.unpack(old)
+    fg, bg, flags = _styles.unpack(new)
+
+    params = []
+
+    # SGR 22 clears bold and dim together, so any intensity that should
+    # survive has to be switched on again afterwards.
+    if old_flags & ~flags & _INTENSITY:
+        params.append('22')
+        old_flags &= ~_INTENSITY
+
+    params.extend(code for flag, code in _FLAG_OFF
+                  if old_flags & ~flags & flag)
+
+    params.extend(code for flag, code in _FLAG_ON
+                  if flags & ~old_flags & flag)
+
+    if fg != old_fg:
+        params.append('39' if fg is None else _color(fg, 30, 90, 38))
+
+    if bg != old_bg:
+        params.append('49' if bg is None else _color(bg, 40, 100, 48))
+
+    return params
+
+
+def sgr(old: _Optional[int], new: int) -> str:
+
+    if old == new:
+        return ''
+
+    key = old, new
+
+    try:
+        return _deltas[key]
+
+    except KeyError:
+        pass
+
+    reset = ';'.join(['0'] + _params(new)) if new else '0'
+
+    if old is None:
+        sequence = reset
+
+    else:
+        delta = ';'.join(_delta_params(old, new))
+        sequence = delta if len(delta) < len(reset) else reset
+
+    if len(_deltas) >= _MAX_CACHED_DELTAS:
+        _deltas.clear()
+
+    result = _deltas[key] = f'\x1b[{sequence}m'
+    return result
+
+
+def runs(styles: _Any, n: int) -> _List[int]:
+
+    row = styles[:n]
+
+    if n <= 1:
+        return [0, n] if n else [0]
+
+    boundaries, = (row[1:] != row[:-1]).nonzero()
+
+    return [0] + (boundaries + 1).tolist() + [n]
+
+
+class Emitter:
+
+    def __init__(self, terminfo: _TermInfo,
+                 write: _Callable[[bytes], None]) -> None:
+
+        self._terminfo = terminfo
+        self._write = write
+        self._out = []
+        self._sgr = None
+        self._held = 0
+
+    def invalidate(self) -> None:
+
+        self._sgr = None
+
+    def raw(self, data: bytes) -> None:
+
+        self._out.append(data)
+
+    def cap(self, name: str, *params: int) -> None:
+
+        if params:
+            self._out.append(self._terminfo.param(name, *params))
+
+        else:
+            self._out.append(self._terminfo.get(name) or b'')
+
+    def style(self, word: int) -> None:
+
+        delta = sgr(self._sgr, word)
+
+        if delta:
+            self._out.append(delta.encode('ascii'))
+            self._sgr = word
+
+    def text(self, text: str) -> None:
+
+        self._out.append(text.replace('\0', ' ').encode('utf-8', 'replace'))
+
+    def styled(self, text: str, styles: _Any) -> None:
+
+        n = len(styles)
+
+        if n > len(text):
+            styled, = styles[len(text):].nonzero()
+            if len(styled):
+                text = text.ljust(len(text) + int(styled[-1]) + 1)
+
+        n = min(n, len(text))
+        bounds = runs(styles, n)
+
+        for start, stop in zip(bounds, bounds[1:]):
+            self.style(int(styles[start]))
+            self.text(text[start:stop])
+
+        if n < len(text):
+            self.style(_styles.DEFAULT)
+            self.text(text[n:])
+
+    def hold(self) -> None:
+
+        self._held += 1
+
+    def release(self) -> None:
+
+        self._held -= 1
+        self.flush()
+
+    def flush(self) -> None:
+
+        if self._held or not self._out:
+            return
+
+        data = b''.join(self._out)
+        self._out.clear()
+        self._write(data)
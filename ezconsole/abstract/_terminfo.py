@@ -0,0 +1,390 @@
+#!/usr/bin/env python3
+
+from typing import (
+    Dict as _Dict,
+    List as _List,
+    Optional as _Optional,
+    Tuple as _Tuple,
+)
+
+import json as _json
+import logging as _logging
+import os as _os
+
+
+_log = _logging.getLogger(__name__)
+
+_FORMAT_VERSION = 1
+
+STRINGS = (
+    'bel', 'blink', 'bold', 'civis', 'clear', 'cnorm', 'cr', 'csr', 'cub',
+    'cub1', 'cud', 'cud1', 'cuf', 'cuf1', 'cup', 'cuu', 'cuu1', 'dim', 'dl',
+    'dl1', 'ech', 'ed', 'el', 'home', 'hpa', 'il', 'il1', 'ind', 'invis',
+    'kbs', 'kcub1', 'kcud1', 'kcuf1', 'kcuu1', 'kdch1', 'kend', 'khome',
+    'kich1', 'knp', 'kpp', 'op', 'rc', 'rev', 'ri', 'ritm', 'rmcup', 'rmkx',
+    'rmso', 'rmul', 'sc', 'setab', 'setaf', 'sgr', 'sgr0', 'sitm', 'smcup',
+    'smkx', 'smso', 'smul', 'vpa',
+)
+
+NUMBERS = ('colors', 'cols', 'it', 'lines', 'pairs')
+
+FLAGS = ('am', 'bce', 'xenl')
+
+_DEFAULT_DIRS = ('/etc/terminfo', '/lib/terminfo', '/usr/share/terminfo',
+                 '/usr/lib/terminfo')
+
+_PARAM_CACHE_SIZE = 1024
+
+_loaded = {}
+
+
+class TermInfo:
+
+    def __init__(self, term: str, strings: _Dict[str, _Optional[bytes]],
+                 numbers: _Dict[str, int], flags: _Dict[str, bool]) -> None:
+
+        self.term = term
+        self._strings = strings
+        self._numbers = numbers
+        self._flags = flags
+        self._params = {}
+
+    def get(self, name: str) -> _Optional[bytes]:
+
+        return self._strings.get(name)
+
+    def has(self, name: str) -> bool:
+
+        return self._strings.get(name) is not None
+
+    def num(self, name: str) -> int:
+
+        return self._numbers.get(name, -1)
+
+    def flag(self, name: str) -> bool:
+
+        return self._flags.get(name, False)
+
+    def param(self, name: str, *params: int) -> bytes:
+
+        key = name, params
+
+        try:
+            return self._params[key]
+
+        except KeyError:
+            pass
+
+        template = self._strings.get(name)
+        result = b'' if template is None else tparm(template, *params)
+
+        if len(self._params) >= _PARAM_CACHE_SIZE:
+            del self._params[next(iter(self._params))]
+
+        self._params[key] = result
+        return result
+
+    def to_json(self) -> dict:
+
+        strings = {name: None if value is None else value.decode('latin-1')
+                   for name, value in self._strings.items()}
+
+        return {
+            'term': self.term,
+            'strings': strings,
+            'numbers': self._numbers,
+            'flags': self._flags,
+        }
+
+    @classmethod
+    def from_json(cls, data: dict) -> 'TermInfo':
+
+        return cls(data['term'],
+                   {name: None if value is None else value.encode('latin-1')
+                    for name, value in data['strings'].items()},
+                   dict(data['numbers']), dict(data['flags']))
+
+
+def _search_dirs() -> _List[str]:
+
+    dirs = []
+
+    terminfo = _os.environ.get('TERMINFO')
+    if terminfo:
+        dirs.append(terminfo)
+
+    dirs.append(_os.path.expanduser('~/.terminfo'))
+
+    for entry in _os.environ.get('TERMINFO_DIRS', '').split(':'):
+        if entry:
+            dirs.append(entry)
+
+    dirs.extend(_DEFAULT_DIRS)
+    return dirs
+
+
+def find_source(term: str) -> _Optional[_Tuple[str, int]]:
+
+    if not term or '/' in term:
+        return None
+
+    for directory in _search_dirs():
+
+        for initial in (term[0], f'{ord(term[0]):02x}'):
+
+            path = _os.path.join(directory, initial, term)
+
+            try:
+                return path, _os.stat(path).st_mtime_ns
+
+            except OSError:
+                continue
+
+    return None
+
+
+def _cache_path(term: str) -> str:
+
+    root = (_os.environ.get('XDG_CACHE_HOME') or
+            _os.path.expanduser('~/.cache'))
+
+    return _os.path.join(root, 'ezconsole', 'terminfo', f'{term}.json')
+
+
+def _read_cache(term: str, source: _Tuple[str, int]) -> _Optional[TermInfo]:
+
+    try:
+        with open(_cache_path(term), encoding='utf-8') as f:
+            data = _json.load(f)
+
+    except (OSError, ValueError):
+        return None
+
+    if (data.get('version') != _FORMAT_VERSION or
+            data.get('source') != list(source)):
+        return None
+
+    try:
+        return TermInfo.from_json(data)
+
+    except (KeyError, TypeError, AttributeError):
+        return None
+
+
+def _write_cache(info: TermInfo, source: _Tuple[str, int]) -> None:
+
+    path = _cache_path(info.term)
+    data = dict(info.to_json(), version=_FORMAT_VERSION, source=list(source))
+
+    try:
+        _os.makedirs(_os.path.dirname(path), exist_ok=True)
+
+        temp = f'{path}.{_os.getpid()}.tmp'
+        with open(temp, 'w', encoding='utf-8') as f:
+            _json.dump(data, f)
+
+        _os.replace(temp, path)
+
+    except OSError:
+        _log.debug("unable to persist terminfo cache %s", path, exc_info=True)
+
+
+def _compile(term: str, fd: int) -> TermInfo:
+
+    import curses
+
+    curses.setupterm(term=term, fd=fd)
+
+    return TermInfo(
+        term,
+        {name: curses.tigetstr(name) for name in STRINGS},
+        {name: curses.tigetnum(name) for name in NUMBERS},
+        {name: curses.tigetflag(name) > 0 for name in FLAGS},
+    )
+
+
+def load(term: str, fd: int = -1, persist: bool = False) -> TermInfo:
+
+    try:
+        return _loaded[term]
+
+    except KeyError:
+        pass
+
+    source = find_source(term) if persist else None
+
+    info = _read_cache(term, source) if source is not None else None
+
+    if info is None:
+        info = _compile(term, fd)
+
+        if source is not None:
+            _write_cache(info, source)
+
+    _loaded[term] = info
+    return info
+
+
+def _skip(template: bytes, i: int, stop_at_else: bool) -> int:
+
+    n = len(template)
+    level = 0
+
+    while i < n:
+
+        if template[i] != 0x25:
+            i += 1
+            continue
+
+        code = template[i + 1:i + 2]
+        i += 2
+
+        if code == b'?':
+            level += 1
+
+        elif code == b';':
+            if not level:
+                return i
+            level -= 1
+
+        elif code == b'e' and stop_at_else and not level:
+            return i
+
+    return i
+
+
+def _binary(code: str, a: int, b: int) -> int:
+
+    if code == '+':
+        return a + b
+    if code == '-':
+        return a - b
+    if code == '*':
+        return a * b
+    if code == '/':
+        return int(a / b) if b else 0
+    if code == 'm':
+        return a - b * int(a / b) if b else 0
+    if code == '&':
+        return a & b
+    if code == '|':
+        return a | b
+    if code == '^':
+        return a ^ b
+    if code == '=':
+        return int(a == b)
+    if code == '<':
+        return int(a < b)
+    if code == '>':
+        return int(a > b)
+    if code == 'A':
+        return int(bool(a and b))
+    if code == 'O':
+        return int(bool(a or b))
+
+    raise ValueError(f"unknown operator %{code}")
+
+
+_static_variables = {}
+
+
+def tparm(template: bytes, *params: int) -> bytes:
+
+    params = list(params[:9]) + [0] * (9 - min(len(params), 9))
+    dynamic = {}
+    stack = []
+    out = bytearray()
+
+    def pop() -> int:
+        return stack.pop() if stack else 0
+
+    n = len(template)
+    i = 0
+
+    while i < n:
+
+        byte = template[i]
+        i += 1
+
+        if byte != 0x25 or i >= n:
+            out.append(byte)
+            continue
+
+        code = chr(template[i])
+        i += 1
+
+        if code == '%':
+            out.append(0x25)
+
+        elif code == 'c':
+            out.append(pop() & 0xff)
+
+        elif code == 'p':
+            stack.append(params[template[i] - 0x31])
+            i += 1
+
+        elif code == 'P':
+            name = chr(template[i])
+            i += 1
+            (dynamic if name.islower() else _static_variables)[name] = pop()
+
+        elif code == 'g':
+            name = chr(template[i])
+            i += 1
+            stack.append((dynamic if name.islower() else
+                          _static_variables).get(name, 0))
+
+        elif code == "'":
+            stack.append(template[i])
+            i += 2
+
+        elif code == '{':
+            end = template.index(b'}', i)
+            stack.append(int(template[i:end]))
+            i = end + 1
+
+        elif code == 'l':
+            stack.append(len(str(pop())))
+
+        elif code in '+-*/m&|^=<>AO':
+            b = pop()
+            a = pop()
+            stack.append(_binary(code, a, b))
+
+        elif code == '!':
+            stack.append(int(not pop()))
+
+        elif code == '~':
+            stack.append(~pop())
+
+        elif code == 'i':
+            params[0] += 1
+            params[1] += 1
+
+        elif code == '?' or code == ';':
+            pass
+
+        elif code == 't':
+            if not pop():
+                i = _skip(template, i, stop_at_else=True)
+
+        elif code == 'e':
+            i = _skip(template, i, stop_at_else=False)
+
+        else:
+            start = i - 1
+            if code == ':':
+                start += 1
+                i += 1
+
+            while i <= n and chr(template[i - 1]) not in 'doxXs':
+                i += 1
+
+            spec = template[start:i].decode('ascii')
+            value = pop()
+            if spec.endswith('s'):
+                value = str(value)
+
+            out += (('%' + spec) % (value,)).encode('latin-1')
+
+    return bytes(out)
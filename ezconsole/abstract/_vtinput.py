@@ -0,0 +1,227 @@
+#!/usr/bin/env python3
+
+from typing import (
+    List as _List,
+    Optional as _Optional,
+)
+
+import codecs as _codecs
+
+from .. import events as _events
+
+
+_ESC = 0x1b
+
+_FINAL_KEYS = {
+    ord('A'): _events.UpNavEvent,
+    ord('B'): _events.DownNavEvent,
+    ord('C'): _events.RightNavEvent,
+    ord('D'): _events.LeftNavEvent,
+}
+
+_CONTROL_KEYS = {
+    0x00: 'ctrl-space',
+    0x08: 'backspace',
+    0x09: 'tab',
+    0x0a: 'enter',
+    0x0d: 'enter',
+    0x1b: 'escape',
+    0x7f: 'backspace',
+}
+
+_TILDE_KEYS = {
+    b'1': 'home',
+    b'2': 'insert',
+    b'3': 'delete',
+    b'4': 'end',
+    b'5': 'pageup',
+    b'6': 'pagedown',
+    b'7': 'home',
+    b'8': 'end',
+}
+
+_FINAL_NAMES = {
+    ord('H'): 'home',
+    ord('F'): 'end',
+}
+
+BRACKETED_PASTE_ON = b'\x1b[?2004h'
+BRACKETED_PASTE_OFF = b'\x1b[?2004l'
+
+SYNC_QUERY = b'\x1b[?2026$p'
+SYNC_BEGIN = b'\x1b[?2026h'
+SYNC_END = b'\x1b[?2026l'
+SYNC_MODE = 2026
+
+DEVICE_ATTRIBUTES = b'\x1b[c'
+
+_PASTE_START = b'\x1b[200~'
+_PASTE_END = b'\x1b[201~'
+
+PASTE_CHUNK = 1 << 16
+
+ESCAPE_TIMEOUT = 0.05
+
+
+def control_key(code: int) -> str:
+
+    return _CONTROL_KEYS.get(code, f'ctrl-{chr(0x60 + code)}')
+
+
+def _report(final: int, body: bytes) -> _Optional[_events.Event]:
+
+    if final == ord('c'):
+        return _events.DeviceAttributesEvent()
+
+    if final != ord('y') or not body.endswith(b'$'):
+        return None
+
+    mode, _, state = body[:-1].partition(b';')
+
+    try:
+        return _events.ModeReportEvent(int(mode), int(state))
+
+    except ValueError:
+        return None
+
+
+class VTInputParser:
+
+    def __init__(self) -> None:
+
+        self._pending = b''
+        self._paste = None
+        self._decoder = _codecs.getincrementaldecoder('utf-8')('replace')
+        self._text_decoder = _codecs.getincrementaldecoder('utf-8')('replace')
+
+    def _paste_event(self, final: bool) -> _events.PasteEvent:
+
+        text = self._decoder.decode(bytes(self._paste), final=final)
+        self._paste.clear()
+
+        if final:
+            self._paste = None
+            self._decoder.reset()
+
+        return _events.PasteEvent(text, final=final)
+
+    def _feed_paste(self, data: bytes, i: int,
+                    events: _List[_events.Event]) -> int:
+
+        end = data.find(_PASTE_END, i)
+
+        if end >= 0:
+            self._paste += data[i:end]
+            events.append(self._paste_event(final=True))
+            return end + len(_PASTE_END)
+
+        keep = len(_PASTE_END) - 1
+        stop = max(len(data) - keep, i)
+
+        while stop < len(data) and not _PASTE_END.startswith(data[stop:]):
+            stop += 1
+
+        self._paste += data[i:stop]
+        self._pending = data[stop:]
+
+        if len(self._paste) >= PASTE_CHUNK:
+            events.append(self._paste_event(final=False))
+
+        return len(data)
+
+    def has_escape(self) -> bool:
+
+        return self._paste is None and self._pending == b'\x1b'
+
+    def flush(self) -> _List[_events.Event]:
+
+        if not self.has_escape():
+            return []
+
+        self._pending = b''
+        return [_events.QuitEvent()]
+
+    def feed(self, data: bytes) -> _List[_events.Event]:
+
+        data = self._pending + data
+        self._pending = b''
+
+        events = []
+        n = len(data)
+        i = 0
+
+        while i < n:
+
+            if self._paste is not None:
+                i = self._feed_paste(data, i, events)
+                continue
+
+            byte = data[i]
+
+            if byte >= 0x20 and byte != 0x7f:
+                end = i + 1
+                while end < n and data[end] >= 0x20 and data[end] != 0x7f:
+                    end += 1
+
+                text = self._text_decoder.decode(data[i:end])
+                events.extend(_events.KeyEvent(char, char) for char in text)
+                i = end
+                continue
+
+            if byte != _ESC:
+                events.append(_events.KeyEvent(control_key(byte)))
+                i += 1
+                continue
+
+            if i + 1 == n:
+                self._pending = data[i:]
+                break
+
+            if data[i + 1] not in b'[O':
+
+                if 0x20 < data[i + 1] < 0x7f:
+                    events.append(_events.KeyEvent(f'alt-{chr(data[i + 1])}'))
+                    i += 2
+
+                else:
+                    events.append(_events.KeyEvent(control_key(_ESC)))
+                    i += 1
+
+                continue
+
+            end = i + 2
+            while end < n and not 0x40 <= data[end] <= 0x7e:
+                end += 1
+
+            if end == n:
+                self._pending = data[i:]
+                break
+
+            if data[i:end + 1] == _PASTE_START:
+                self._paste = bytearray()
+                i = end + 1
+                continue
+
+            final = data[end]
+            key = _FINAL_KEYS.get(final)
+            body = data[i + 2:end]
+
+            if body[:1] == b'?':
+                report = _report(final, body[1:])
+                if report is not None:
+                    events.append(report)
+
+            elif key is not None:
+                events.append(key())
+
+            elif final == 0x7e:
+                name = _TILDE_KEYS.get(data[i + 2:end].split(b';')[0])
+                if name is not None:
+                    events.append(_events.KeyEvent(name))
+
+            elif final in _FINAL_NAMES:
+                events.append(_events.KeyEvent(_FINAL_NAMES[final]))
+
+            i = end + 1
+
+        return events
@@ -203,6 +203,13 @@ CloseHandle.argtypes = [HANDLE]
 CloseHandle.restype = BOOL
 CloseHandle.errcheck = _errcheck_return_success
 
+CreateConsoleScreenBuffer = _windll.kernel32.CreateConsoleScreenBuffer
+CreateConsoleScreenBuffer.argtypes = [DWORD, DWORD,
+                                      _POINTER(SecurityAttributes), DWORD,
+                                      LPVOID]
+CreateConsoleScreenBuffer.restype = HANDLE
+CreateConsoleScreenBuffer.errcheck = _errcheck_return_handle
+
 CreateFileW = _windll.kernel32.CreateFileW
 CreateFileW.argtypes = [LPCWSTR, DWORD, DWORD, _POINTER(SecurityAttributes),
                         DWORD, DWORD, HANDLE]
@@ -250,6 +257,11 @@ ScrollConsoleScreenBufferW.argtypes = [HANDLE, PSMALL_RECT, PSMALL_RECT, Coord,
 ScrollConsoleScreenBufferW.restype = BOOL
 ScrollConsoleScreenBufferW.errcheck = _errcheck_return_success
 
+SetConsoleActiveScreenBuffer = _windll.kernel32.SetConsoleActiveScreenBuffer
+SetConsoleActiveScreenBuffer.argtypes = [HANDLE]
+SetConsoleActiveScreenBuffer.restype = BOOL
+SetConsoleActiveScreenBuffer.errcheck = _errcheck_return_success
+
 SetConsoleCursorPosition = _windll.kernel32.SetConsoleCursorPosition
 SetConsoleCursorPosition.argtypes = [HANDLE, Coord]
 SetConsoleCursorPosition.restype = BOOL
@@ -0,0 +1,91 @@
+#!/usr/bin/env python3
+
+from typing import (
+    Any as _Any,
+    Callable as _Callable,
+    List as _List,
+)
+
+from ._console import _Console
+
+from .. import events as _events
+
+
+class HeadlessConsole(_Console):
+
+    def __init__(self, rows: int = 24, cols: int = 80,
+                 colors: int = 256) -> None:
+
+        self._rows = rows
+        self._cols = cols
+        self._colors = colors
+        self._callback = None
+
+        self.lines: _List[str] = []
+        self.output: _List[str] = []
+        self.writes = 0
+
+    def close(self, timeout: float = 0.1) -> None:
+
+        self._callback = None
+
+    def print(self, s: str, flush: bool = False) -> None:
+
+        self.output.append(s)
+
+    def set_size(self, rows: int, cols: int) -> None:
+
+        self._rows = rows
+        self._cols = cols
+
+    def get_width(self) -> int:
+
+        return self._cols
+
+    def get_height(self) -> int:
+
+        return self._rows
+
+    def get_colors(self) -> int:
+
+        return self._colors
+
+    def request_size(self, height: int) -> int:
+
+        if height < 0:
+            raise ValueError("n cannot be negative")
+
+        height = min(height, self._rows)
+
+        del self.lines[height:]
+        self.lines.extend('' for _ in range(height - len(self.lines)))
+
+        return height
+
+    def line_at(self, y: int, text: str, tail: int = 0) -> None:
+
+        self.lines[y] = text[:self._cols].replace('\0', ' ')
+        self.writes += 1
+
+    def dispatch(self, event: _events.Event) -> None:
+
+        if self._callback is not None:
+            self._callback(event)
+
+    def register_input_callback(self, callback: _Callable) -> _Any:
+
+        if self._callback is not None:
+            raise NotImplementedError("cannot register multiple callbacks")
+
+        self._callback = callback
+        return hash(callback)
+
+    def unregister_input_callback(self, token: _Any) -> None:
+
+        if self._callback is None:
+            raise ValueError("no callback has been registered")
+
+        if hash(self._callback) != token:
+            raise ValueError("token mismatch")
+
+        self._callback = None
@@ -1,30 +1,410 @@
 #!/usr/bin/env python3
 
-import curses as _curses
+from typing import (
+    Any as _Any,
+    Callable as _Callable,
+    Iterable as _Iterable,
+)
+
+import asyncio as _asyncio
+import logging as _logging
+import os as _os
+import time as _time
+
+from . import _terminfo
 
 from ._console import _Console
+from ._emitter import Emitter as _Emitter
+from ._vtinput import (
+    BRACKETED_PASTE_OFF as _BRACKETED_PASTE_OFF,
+    BRACKETED_PASTE_ON as _BRACKETED_PASTE_ON,
+    DEVICE_ATTRIBUTES as _DEVICE_ATTRIBUTES,
+    ESCAPE_TIMEOUT as _ESCAPE_TIMEOUT,
+    SYNC_BEGIN as _SYNC_BEGIN,
+    SYNC_END as _SYNC_END,
+    SYNC_MODE as _SYNC_MODE,
+    SYNC_QUERY as _SYNC_QUERY,
+    VTInputParser as _VTInputParser,
+)
+
+from .. import events as _events
+
+
+_log = _logging.getLogger(__name__)
+
+_PROBE_TIMEOUT = 0.2
 
 
 class POSIXConsole(_Console):
 
-    def __init__(self) -> None:
+    def __init__(self, fullscreen: bool = False) -> None:
 
-        import os
         import sys
 
+        self._emitter = None
+        self._fullscreen = fullscreen
+        self._range_height = 0
+        self._row = -1
+
+        self._input = None
+        self._saved_tty = None
+        self._parser = _VTInputParser()
+        self._escape_handle = None
+        self._typeahead = []
+
         self._stdout = sys.__stdout__
+        self._stdin = sys.__stdin__
+
+        self._terminfo = _terminfo.load(_os.environ.get("TERM", "unknown"),
+                                        fd=self._stdout.fileno())
+        self._emitter = _Emitter(self._terminfo, self._write)
+
+        if fullscreen:
+            self._emitter.cap('smcup')
+            self._emitter.cap('civis')
+            self._emitter.style(0)
+            self._emitter.cap('clear')
+            self._emitter.flush()
+
+        self._sync = self._probe_sync()
+
+    # noinspection PyBroadException
+    def _probe_sync(self) -> bool:
+
+        fd = self._stdin.fileno()
+
+        if not (_os.isatty(fd) and _os.isatty(self._stdout.fileno())):
+            return False
+
+        import select
+        import termios
+        import tty
+
+        saved_tty = termios.tcgetattr(fd)
+        parser = _VTInputParser()
+        supported = False
+
+        try:
+            tty.setcbreak(fd, termios.TCSANOW)
+            self._write(_SYNC_QUERY + _DEVICE_ATTRIBUTES)
+
+            deadline = _time.monotonic() + _PROBE_TIMEOUT
+            answered = False
+
+            while not answered:
+
+                remaining = deadline - _time.monotonic()
+                if remaining <= 0 or not select.select([fd], [], [],
+                                                       remaining)[0]:
+                    break
+
+                for event in parser.feed(_os.read(fd, 4096)):
+
+                    if isinstance(event, _events.DeviceAttributesEvent):
+                        answered = True
+
+                    elif isinstance(event, _events.ModeReportEvent):
+                        if event.mode == _SYNC_MODE:
+                            supported = event.state in (1, 2)
+
+                    else:
+                        self._typeahead.append(event)
+
+            self._typeahead.extend(parser.flush())
+
+        except Exception:
+            _log.exception("unable to probe for synchronized output")
+
+        finally:
+            termios.tcsetattr(fd, termios.TCSANOW, saved_tty)
+
+        return supported
+
+    def __del__(self) -> None:
+
+        self.close(timeout=0)
+
+    # noinspection PyBroadException
+    def close(self, timeout: float = 0.1) -> None:
 
-        self._term = _curses.setupterm(term=os.environ.get("TERM", "unknown"),
-                                       fd=self._stdout.fileno())
+        input_, self._input = self._input, None
+
+        if input_ is not None:
+
+            try:
+                self._stop_input(input_)
+
+            except Exception:
+                _log.exception("unable to stop input handler during cleanup")
+
+        emitter, self._emitter = self._emitter, None
+
+        if emitter is not None and self._fullscreen:
+
+            try:
+                emitter.style(0)
+                emitter.cap('cnorm')
+                emitter.cap('rmcup')
+                emitter.flush()
+
+            except Exception:
+                _log.exception(
+                    "unable to leave alternate screen during cleanup"
+                )
+
+        elif emitter is not None and self._range_height:
+
+            try:
+                self._move_to(self._range_height - 1, emitter)
+                emitter.style(0)
+                emitter.raw(b'\r\n')
+                emitter.flush()
+
+            except Exception:
+                _log.exception("unable to park cursor during cleanup")
+
+    def _write(self, data: bytes) -> None:
+
+        fd = self._stdout.fileno()
+        view = memoryview(data)
+
+        while view:
+            view = view[_os.write(fd, view):]
 
     def print(self, s: str, flush: bool = False) -> None:
         print(s, end='\r\n', flush=flush, file=self._stdout)
 
+    def _terminal_size(self) -> _os.terminal_size:
+        return _os.get_terminal_size(self._stdout.fileno())
+
     def get_width(self) -> int:
-        return _curses.tigetnum('cols')
+        try:
+            return self._terminal_size().columns
+        except OSError:
+            return self._terminfo.num('cols')
 
     def get_height(self) -> int:
-        return _curses.tigetnum('lines')
+        try:
+            return self._terminal_size().lines
+        except OSError:
+            return self._terminfo.num('lines')
 
     def get_colors(self) -> int:
-        return _curses.tigetnum('colors')
+        return self._terminfo.num('colors')
+
+    def _move_to(self, y: int, emitter: _Emitter) -> None:
+
+        if self._fullscreen:
+            emitter.cap('cup', y, 0)
+            self._row = y
+            return
+
+        dy = y - self._row
+
+        if dy < 0:
+            emitter.cap('cuu', -dy)
+
+        elif dy > 0:
+            emitter.cap('cud', dy)
+
+        emitter.raw(b'\r')
+        self._row = y
+
+    def _limit(self) -> int:
+
+        cols = self.get_width()
+
+        if self._terminfo.flag('am') and not self._terminfo.flag('xenl'):
+            cols -= 1
+
+        return cols
+
+    def request_size(self, height: int) -> int:
+
+        if height < 0:
+            raise ValueError("n cannot be negative")
+
+        if self._fullscreen:
+            return self._request_screen_rows(height)
+
+        height = min(height, max(self.get_height() - 1, 3))
+
+        if height == self._range_height:
+            return height
+
+        emitter = self._emitter
+        emitter.style(0)
+
+        if height > self._range_height:
+            self._move_to(self._range_height - 1, emitter)
+
+            for _ in range(height - self._range_height):
+                emitter.raw(b'\r\n')
+                emitter.cap('el')
+
+            self._row = height - 1
+
+        else:
+            for y in range(self._range_height - 1, height - 1, -1):
+                self._move_to(y, emitter)
+                emitter.cap('el')
+
+            self._move_to(height - 1, emitter)
+
+        self._range_height = height
+        emitter.flush()
+
+        return height
+
+    def _request_screen_rows(self, height: int) -> int:
+
+        height = min(height, self.get_height())
+
+        if height < self._range_height:
+            emitter = self._emitter
+            emitter.style(0)
+
+            for y in range(height, self._range_height):
+                self._move_to(y, emitter)
+                emitter.cap('el')
+
+            emitter.flush()
+
+        self._range_height = height
+        return height
+
+    def begin_frame(self) -> None:
+
+        self._emitter.hold()
+
+        if self._sync:
+            self._emitter.raw(_SYNC_BEGIN)
+
+    def end_frame(self) -> None:
+
+        if self._sync:
+            self._emitter.raw(_SYNC_END)
+
+        self._emitter.release()
+
+    def _finish_line(self, tail: int, emitter: _Emitter) -> None:
+
+        if tail > 0:
+            emitter.style(0)
+            emitter.cap('el')
+
+        emitter.flush()
+
+    def line_at(self, y: int, text: str, tail: int = 0) -> None:
+
+        emitter = self._emitter
+        self._move_to(y, emitter)
+
+        emitter.style(0)
+        emitter.text(text[:self._limit()])
+
+        self._finish_line(tail, emitter)
+
+    def styled_line_at(self, y: int, text: str, styles: _Any,
+                       tail: int = 0) -> None:
+
+        emitter = self._emitter
+        self._move_to(y, emitter)
+
+        limit = self._limit()
+        emitter.styled(text[:limit], styles[:limit])
+
+        self._finish_line(tail, emitter)
+
+    def _dispatch(self, events: _Iterable[_events.Event],
+                  callback: _Callable) -> None:
+
+        for event in events:
+            if not isinstance(event, (_events.ModeReportEvent,
+                                      _events.DeviceAttributesEvent)):
+                callback(event)
+
+    def _cancel_escape(self) -> None:
+
+        handle, self._escape_handle = self._escape_handle, None
+
+        if handle is not None:
+            handle.cancel()
+
+    def _on_escape_timeout(self) -> None:
+
+        self._escape_handle = None
+
+        if self._input is not None:
+            self._dispatch(self._parser.flush(), self._input[1])
+
+    def _on_readable(self) -> None:
+
+        loop, callback, fd = self._input
+
+        try:
+            data = _os.read(fd, 4096)
+
+        except BlockingIOError:
+            return
+
+        self._cancel_escape()
+        self._dispatch(self._parser.feed(data), callback)
+
+        if self._parser.has_escape():
+            self._escape_handle = loop.call_later(_ESCAPE_TIMEOUT,
+                                                  self._on_escape_timeout)
+
+    def _stop_input(self, input_) -> None:
+
+        loop, callback, fd = input_
+        loop.remove_reader(fd)
+        self._cancel_escape()
+
+        if self._emitter is not None:
+            self._emitter.raw(_BRACKETED_PASTE_OFF)
+            self._emitter.flush()
+
+        saved_tty, self._saved_tty = self._saved_tty, None
+
+        if saved_tty is not None:
+            import termios
+            termios.tcsetattr(fd, termios.TCSADRAIN, saved_tty)
+
+    def register_input_callback(self, callback: _Callable) -> _Any:
+
+        if self._input is not None:
+            raise NotImplementedError("cannot register multiple callbacks")
+
+        loop = _asyncio.get_running_loop()
+        fd = self._stdin.fileno()
+
+        if _os.isatty(fd):
+            import termios
+            import tty
+
+            self._saved_tty = termios.tcgetattr(fd)
+            tty.setcbreak(fd)
+
+        self._input = loop, callback, fd
+        loop.add_reader(fd, self._on_readable)
+
+        typeahead, self._typeahead = self._typeahead, []
+        for event in typeahead:
+            loop.call_soon(callback, event)
+
+        self._emitter.raw(_BRACKETED_PASTE_ON)
+        self._emitter.flush()
+
+        return hash(self._input)
+
+    def unregister_input_callback(self, token: _Any) -> None:
+
+        if self._input is None:
+            raise ValueError("no callback has been registered")
+
+        if hash(self._input) != token:
+            raise ValueError("token mismatch")
+
+        input_, self._input = self._input, None
+        self._stop_input(input_)
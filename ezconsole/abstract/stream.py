@@ -0,0 +1,200 @@
+#!/usr/bin/env python3
+
+from typing import (
+    Any as _Any,
+    Callable as _Callable,
+)
+
+import logging as _logging
+
+from . import _terminfo
+
+from ._console import _Console
+from ._emitter import Emitter as _Emitter
+from ._vtinput import (
+    BRACKETED_PASTE_OFF as _BRACKETED_PASTE_OFF,
+    BRACKETED_PASTE_ON as _BRACKETED_PASTE_ON,
+    SYNC_BEGIN as _SYNC_BEGIN,
+    SYNC_END as _SYNC_END,
+    SYNC_MODE as _SYNC_MODE,
+    SYNC_QUERY as _SYNC_QUERY,
+)
+
+from .. import events as _events
+
+
+_log = _logging.getLogger(__name__)
+
+
+class StreamConsole(_Console):
+
+    def __init__(self, write: _Callable[[bytes], None], *,
+                 term: str = 'xterm-256color', rows: int = 24,
+                 cols: int = 80) -> None:
+
+        self._terminfo = _terminfo.load(term)
+        self._emitter = _Emitter(self._terminfo, write)
+
+        self._rows = rows
+        self._cols = cols
+        self._range_height = 0
+        self._callback = None
+        self._sync = False
+
+        self._emitter.style(0)
+        self._emitter.cap('clear')
+        self._emitter.cap('civis')
+        self._emitter.raw(_SYNC_QUERY)
+        self._emitter.flush()
+
+    # noinspection PyBroadException
+    def close(self, timeout: float = 0.1) -> None:
+
+        emitter, self._emitter = self._emitter, None
+        callback, self._callback = self._callback, None
+
+        if emitter is None:
+            return
+
+        try:
+            if callback is not None:
+                emitter.raw(_BRACKETED_PASTE_OFF)
+
+            emitter.style(0)
+            emitter.cap('cup', max(self._range_height - 1, 0), 0)
+            emitter.raw(b'\r\n')
+            emitter.cap('cnorm')
+            emitter.flush()
+
+        except Exception:
+            _log.exception("unable to restore remote terminal during cleanup")
+
+    def print(self, s: str, flush: bool = False) -> None:
+
+        self._emitter.text(s + '\r\n')
+
+        if flush:
+            self._emitter.flush()
+
+    def set_size(self, rows: int, cols: int) -> None:
+
+        self._rows = rows
+        self._cols = cols
+
+    def get_width(self) -> int:
+
+        return self._cols
+
+    def get_height(self) -> int:
+
+        return self._rows
+
+    def get_colors(self) -> int:
+
+        return self._terminfo.num('colors')
+
+    def _limit(self) -> int:
+
+        if self._terminfo.flag('am') and not self._terminfo.flag('xenl'):
+            return self._cols - 1
+
+        return self._cols
+
+    def request_size(self, height: int) -> int:
+
+        if height < 0:
+            raise ValueError("n cannot be negative")
+
+        height = min(height, self._rows)
+        emitter = self._emitter
+
+        if height < self._range_height:
+            emitter.style(0)
+
+            for y in range(height, self._range_height):
+                emitter.cap('cup', y, 0)
+                emitter.cap('el')
+
+            emitter.flush()
+
+        self._range_height = height
+        return height
+
+    def begin_frame(self) -> None:
+
+        self._emitter.hold()
+
+        if self._sync:
+            self._emitter.raw(_SYNC_BEGIN)
+
+    def end_frame(self) -> None:
+
+        if self._sync:
+            self._emitter.raw(_SYNC_END)
+
+        self._emitter.release()
+
+    def _finish_line(self, tail: int, emitter: _Emitter) -> None:
+
+        if tail > 0:
+            emitter.style(0)
+            emitter.cap('el')
+
+        emitter.flush()
+
+    def line_at(self, y: int, text: str, tail: int = 0) -> None:
+
+        emitter = self._emitter
+        emitter.cap('cup', y, 0)
+
+        emitter.style(0)
+        emitter.text(text[:self._limit()])
+
+        self._finish_line(tail, emitter)
+
+    def styled_line_at(self, y: int, text: str, styles: _Any,
+                       tail: int = 0) -> None:
+
+        emitter = self._emitter
+        emitter.cap('cup', y, 0)
+
+        limit = self._limit()
+        emitter.styled(text[:limit], styles[:limit])
+
+        self._finish_line(tail, emitter)
+
+    def dispatch(self, event: _events.Event) -> None:
+
+        if isinstance(event, _events.ModeReportEvent):
+            if event.mode == _SYNC_MODE:
+                self._sync = event.state in (1, 2)
+
+            return
+
+        if self._callback is not None:
+            self._callback(event)
+
+    def register_input_callback(self, callback: _Callable) -> _Any:
+
+        if self._callback is not None:
+            raise NotImplementedError("cannot register multiple callbacks")
+
+        self._callback = callback
+
+        self._emitter.raw(_BRACKETED_PASTE_ON)
+        self._emitter.flush()
+
+        return hash(callback)
+
+    def unregister_input_callback(self, token: _Any) -> None:
+
+        if self._callback is None:
+            raise ValueError("no callback has been registered")
+
+        if hash(self._callback) != token:
+            raise ValueError("token mismatch")
+
+        self._callback = None
+
+        self._emitter.raw(_BRACKETED_PASTE_OFF)
+        self._emitter.flush()
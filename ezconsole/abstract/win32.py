@@ -3,21 +3,20 @@
 from typing import (
     Any as _Any,
     Callable as _Callable,
+    List as _List,
+    Optional as _Optional,
 )
 
 import asyncio as _asyncio
 import logging as _logging
 import threading as _threading
 
-from asyncio.windows_events import (
-    WindowsProactorEventLoopPolicy as _EventLoopPolicy,
-)
-
 from concurrent.futures import ThreadPoolExecutor as _Executor
 
 from ctypes import byref as _byref
 
 from ._console import _Console
+from ._vtinput import control_key as _control_key
 
 from ._win32api import (
     DWORD as _DWORD,
@@ -34,6 +33,7 @@ from ._win32api import (
     INVALID_HANDLE_VALUE as _INVALID_HANDLE_VALUE,
 
     CloseHandle as _CloseHandle,
+    CreateConsoleScreenBuffer as _CreateConsoleScreenBuffer,
     CreateFileW as _CreateFileW,
 
     FillConsoleOutputCharacterW as _FillConsoleOutputCharacterW,
@@ -42,6 +42,7 @@ from ._win32api import (
     GetConsoleScreenBufferInfo as _GetConsoleScreenBufferInfo,
     ReadConsoleInputW as _ReadConsoleInputW,
     ScrollConsoleScreenBufferW as _ScrollConsoleScreenBufferW,
+    SetConsoleActiveScreenBuffer as _SetConsoleActiveScreenBuffer,
     SetConsoleCursorPosition as _SetConsoleCursorPosition,
     SetConsoleMode as _SetConsoleMode,
     WriteConsoleInputW as _WriteConsoleInputW,
@@ -53,20 +54,47 @@ from .. import events as _events
 
 _log = _logging.getLogger(__name__)
 
-# noinspection PyTypeChecker
-_asyncio.set_event_loop_policy(_EventLoopPolicy())
+_INPUT_BATCH = 4096
+
+# The legacy console has no bracketed paste. A paste shows up as one read
+# of many key records that include Enter or other control characters,
+# which typing and key repeat do not produce.
+_PASTE_RECORDS = 16
+
+_NAV_EVENTS = {
+    0x25: _events.LeftNavEvent,
+    0x26: _events.UpNavEvent,
+    0x27: _events.RightNavEvent,
+    0x28: _events.DownNavEvent,
+}
+
+_ALT_PRESSED = 0x0003
+_CTRL_PRESSED = 0x000c
+
+_VK_NAMES = {
+    0x08: 'backspace',
+    0x21: 'pageup',
+    0x22: 'pagedown',
+    0x23: 'end',
+    0x24: 'home',
+    0x2d: 'insert',
+    0x2e: 'delete',
+}
 
 
 class Win32Console(_Console):
 
-    def __init__(self) -> None:
+    def __init__(self, fullscreen: bool = False) -> None:
 
         self._range_height = 0
         self._fill_char = ' '
+        self._fullscreen = fullscreen
 
         self._executor = None
 
         self._output = None
+        self._screen = None
+        self._target = None
         self._saved_output_mode = None
         self._buffer_info = _ConsoleScreenBufferInfo()
 
@@ -88,14 +116,23 @@ class Win32Console(_Console):
         self._saved_output_mode = mode.value
 
         _SetConsoleMode(self._output, self._saved_output_mode | 0x0018)
+        self._target = self._output
+
+        if fullscreen:
+            self._screen = _CreateConsoleScreenBuffer(
+                0xc0000000, 0x3, _byref(_SecurityAttributes(None, True)),
+                0x1, None
+            )
+
+            _SetConsoleMode(self._screen, self._saved_output_mode | 0x0018)
+            _SetConsoleActiveScreenBuffer(self._screen)
+            self._target = self._screen
 
         self._update_buffer_info()
 
         self._input_handler = _ConsoleInputHandler(input_, close=True)
 
-        loop = _asyncio.get_event_loop()
-        self._input_future = loop.run_in_executor(self._executor,
-                                                  self._input_handler.handle)
+        self._input_future = self._executor.submit(self._input_handler.handle)
 
     def __del__(self) -> None:
 
@@ -107,7 +144,9 @@ class Win32Console(_Console):
         input_future, self._input_future = self._input_future, None
         input_handler, self._input_handler = self._input_handler, None
         output, self._output = self._output, None
+        screen, self._screen = self._screen, None
         executor, self._executor = self._executor, None
+        self._target = None
         self._buffer_info = None
 
         if input_future is not None:
@@ -128,6 +167,17 @@ class Win32Console(_Console):
                     "unable to shutdown input handler during cleanup"
                 )
 
+        if screen is not None:
+
+            try:
+                _SetConsoleActiveScreenBuffer(output)
+                _CloseHandle(screen)
+
+            except Exception:
+                _log.exception(
+                    "unable to restore main screen buffer during cleanup"
+                )
+
         if (self._saved_output_mode is not None and
                 output is not None and output != _INVALID_HANDLE_VALUE.value):
 
@@ -149,7 +199,7 @@ class Win32Console(_Console):
 
     def _update_buffer_info(self) -> None:
 
-        _GetConsoleScreenBufferInfo(self._output, _byref(self._buffer_info))
+        _GetConsoleScreenBufferInfo(self._target, _byref(self._buffer_info))
 
     def print(self, s: str, flush: bool = False) -> None:
 
@@ -173,6 +223,9 @@ class Win32Console(_Console):
         if height < 0:
             raise ValueError("n cannot be negative")
 
+        if self._fullscreen:
+            return self._request_screen_rows(height)
+
         max_y = self._buffer_info.dwSize.Y - 1
         max_height = min(max_y, max(self._buffer_info.srWindow.Bottom -
                                     self._buffer_info.srWindow.Top, 3))
@@ -189,7 +242,7 @@ class Win32Console(_Console):
         missing_lines = (height - self._range_height) - (max_y - y)
         if missing_lines > 0:
             _ScrollConsoleScreenBufferW(
-                    self._output, _SMALL_RECT(0, 0, max_x, y - 1), None,
+                    self._target, _SMALL_RECT(0, 0, max_x, y - 1), None,
                     _Coord(0, -missing_lines),
                     _CharInfo(self._fill_char, self._buffer_info.wAttributes)
             )
@@ -204,7 +257,7 @@ class Win32Console(_Console):
 
         scroll_region = _SMALL_RECT(0, y, max_x, max_y)
         _ScrollConsoleScreenBufferW(
-                self._output, scroll_region, scroll_region,
+                self._target, scroll_region, scroll_region,
                 _Coord(0, y + delta),
                 _CharInfo(self._fill_char, self._buffer_info.wAttributes)
         )
@@ -212,25 +265,46 @@ class Win32Console(_Console):
         self._range_height += delta
         self._buffer_info.dwCursorPosition.Y += delta
 
-        _SetConsoleCursorPosition(self._output,
+        _SetConsoleCursorPosition(self._target,
                                   self._buffer_info.dwCursorPosition)
 
         assert self._range_height == height
         return height
 
+    def _request_screen_rows(self, height: int) -> int:
+
+        window = self._buffer_info.srWindow
+        height = min(height, window.Bottom - window.Top + 1)
+
+        if height < self._range_height:
+            written = _DWORD()
+            cells = self._buffer_info.dwSize.X * (self._range_height - height)
+
+            _FillConsoleOutputCharacterW(self._target, self._fill_char, cells,
+                                         _Coord(0, window.Top + height),
+                                         _byref(written))
+
+        self._range_height = height
+        return height
+
     def line_at(self, y: int, text: str, tail: int = 0) -> None:
 
-        y += self._buffer_info.dwCursorPosition.Y - self._range_height
+        if self._fullscreen:
+            y += self._buffer_info.srWindow.Top
+
+        else:
+            y += self._buffer_info.dwCursorPosition.Y - self._range_height
+
         n = len(text)
 
         written = _DWORD()
-        _WriteConsoleOutputCharacterW(self._output, text, n, _Coord(0, y),
+        _WriteConsoleOutputCharacterW(self._target, text, n, _Coord(0, y),
                                       _byref(written))
 
         if tail <= 0:
             return
 
-        _FillConsoleOutputCharacterW(self._output, self._fill_char, tail,
+        _FillConsoleOutputCharacterW(self._target, self._fill_char, tail,
                                      _Coord(n, y), _byref(written))
 
     def register_input_callback(self, callback: _Callable) -> _Any:
@@ -242,6 +316,104 @@ class Win32Console(_Console):
         self._input_handler.unregister_callback(token)
 
 
+def _is_paste(records) -> bool:
+
+    if len(records) < _PASTE_RECORDS:
+        return False
+
+    for record in records:
+
+        if record.EventType != 0x0001 or not record.KeyEvent.bKeyDown:
+            continue
+
+        if '\0' < record.KeyEvent.UnicodeChar < ' ':
+            return True
+
+    return False
+
+
+def _flush_paste(text: _List[str], events: _List[_events.Event],
+                 final: bool) -> None:
+
+    if text:
+        events.append(_events.PasteEvent(''.join(text).replace('\r', '\n'),
+                                         final=final))
+        text.clear()
+
+
+def _key_event(key_event) -> _Optional[_events.Event]:
+
+    vk = key_event.wVirtualKeyCode
+    char = key_event.UnicodeChar
+
+    state = key_event.dwControlKeyState
+    alt = state & _ALT_PRESSED
+    ctrl = state & _CTRL_PRESSED
+
+    if vk == 0x1b:
+        return _events.QuitEvent()
+
+    if vk in _NAV_EVENTS:
+        return _NAV_EVENTS[vk]()
+
+    if vk in _VK_NAMES:
+        return _events.KeyEvent(_VK_NAMES[vk])
+
+    if vk == 0x20 and ctrl and not alt:
+        return _events.KeyEvent(_control_key(0))
+
+    if not char:
+        return None
+
+    if char < ' ' or char == '\x7f':
+        return _events.KeyEvent(_control_key(ord(char)))
+
+    # AltGr reports both Ctrl and Alt, and produces ordinary text.
+    if alt and not ctrl and char > ' ':
+        return _events.KeyEvent(f'alt-{char}')
+
+    return _events.KeyEvent(char, char)
+
+
+def _translate(records, paste: bool, final: bool) -> _List[_events.Event]:
+
+    events = []
+    text = []
+
+    for record in records:
+
+        if record.EventType != 0x0001:
+            continue
+
+        key_event = record.KeyEvent
+        if not key_event.bKeyDown:
+            continue
+
+        repeat = max(key_event.wRepeatCount, 1)
+        char = key_event.UnicodeChar
+
+        if (paste and key_event.wVirtualKeyCode not in _NAV_EVENTS and
+                (char >= ' ' or char in ('\t', '\r'))):
+            text.append(char * repeat)
+            continue
+
+        event = _key_event(key_event)
+        if event is None:
+            continue
+
+        _flush_paste(text, events, final=True)
+        events.extend([event] * repeat)
+
+    _flush_paste(text, events, final=final)
+    return events
+
+
+def _dispatch(callback: _Callable, events: _List[_events.Event]) -> None:
+
+    for event in events:
+        callback(event)
+
+
 class _ConsoleInputHandler:
 
     def __init__(self, handle, close=False) -> None:
@@ -252,6 +424,7 @@ class _ConsoleInputHandler:
         self._callback = None
         self._callback_lock = None
         self._shutdown_signal = None
+        self._pasting = False
 
         mode = _DWORD()
         _GetConsoleMode(self._handle, _byref(mode))
@@ -312,7 +485,7 @@ class _ConsoleInputHandler:
     def handle(self) -> None:
 
         # noinspection PyTypeChecker,PyCallingNonCallable
-        buffer = (_InputRecord * 100)()
+        buffer = (_InputRecord * _INPUT_BATCH)()
         read = _DWORD()
 
         while not self._shutdown_signal.is_set():
@@ -322,35 +495,24 @@ class _ConsoleInputHandler:
             if self._shutdown_signal.is_set():
                 break
 
-            for input_record in buffer[:read.value]:
-
-                if input_record.EventType != 0x0001:
-                    continue
-
-                key_event = input_record.KeyEvent
-                if not key_event.bKeyDown:
-                    continue
+            records = buffer[:read.value]
+            final = read.value < len(buffer)
 
-                vk = key_event.wVirtualKeyCode
-                if vk == 0x1b:
-                    event = _events.QuitEvent()
+            paste = self._pasting or _is_paste(records)
+            self._pasting = paste and not final
 
-                elif vk == 0x26:
-                    event = _events.UpNavEvent()
+            events = _translate(records, paste, final)
 
-                elif vk == 0x28:
-                    event = _events.DownNavEvent()
+            if not events:
+                continue
 
-                else:
+            with self._callback_lock:
+                if self._callback is None:
                     continue
 
-                with self._callback_lock:
-                    if self._callback is None:
-                        continue
-
-                    loop, callback = self._callback
+                loop, callback = self._callback
 
-                loop.call_soon_threadsafe(callback, event)
+            loop.call_soon_threadsafe(_dispatch, callback, events)
 
     def register_callback(self, callback: _Callable) -> _Any:
 
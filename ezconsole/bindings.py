@@ -0,0 +1,249 @@
+#!/usr/bin/env python3
+
+from typing import (
+    Any as _Any,
+    Callable as _Callable,
+    Iterable as _Iterable,
+    List as _List,
+    Optional as _Optional,
+    Tuple as _Tuple,
+    Union as _Union,
+)
+
+import asyncio as _asyncio
+import functools as _functools
+import logging as _logging
+
+from . import events as _events
+
+
+_log = _logging.getLogger(__name__)
+
+_ALIASES = {
+    'del': 'delete',
+    'esc': 'escape',
+    'ins': 'insert',
+    'pgdn': 'pagedown',
+    'pgup': 'pageup',
+    'return': 'enter',
+    'space': ' ',
+}
+
+_NAV_KEYS = {
+    _events.UpNavEvent: ('up',),
+    _events.DownNavEvent: ('down',),
+    _events.LeftNavEvent: ('left',),
+    _events.RightNavEvent: ('right',),
+    _events.QuitEvent: ('escape',),
+}
+
+
+@_functools.lru_cache(maxsize=1024)
+def _expand(token: str) -> _Tuple[str, ...]:
+
+    if len(token) == 1:
+        return token,
+
+    modifiers, _, key = token.rpartition('-')
+
+    if not key:
+        modifiers, key = modifiers[:-1], '-'
+
+    if len(key) > 1:
+        key = key.lower()
+        key = _ALIASES.get(key, key)
+
+    keys = []
+    prefix = ''
+
+    for modifier in modifiers.lower().split('-') if modifiers else ():
+
+        if modifier in ('alt', 'meta'):
+            keys.append('escape')
+
+        elif modifier == 'ctrl':
+            prefix = 'ctrl-'
+
+        else:
+            raise ValueError(f"unknown modifier {modifier!r} in {token!r}")
+
+    if prefix:
+        key = 'space' if key == ' ' else key.lower()
+
+    keys.append(prefix + key)
+    return tuple(keys)
+
+
+def _parse(sequence: _Union[str, _Iterable[str]]) -> _Tuple[str, ...]:
+
+    if isinstance(sequence, str):
+        sequence = sequence.split()
+
+    return tuple(key for token in sequence for key in _expand(token))
+
+
+def _event_keys(event: _events.Event) -> _Optional[_Tuple[str, ...]]:
+
+    if isinstance(event, _events.KeyEvent):
+        return _expand(event.key)
+
+    return _NAV_KEYS.get(type(event))
+
+
+class _Node:
+
+    __slots__ = ('children', 'action')
+
+    def __init__(self) -> None:
+
+        self.children = {}
+        self.action = None
+
+
+class Bindings:
+
+    def __init__(self, timeout: float = 0.5) -> None:
+
+        if timeout < 0:
+            raise ValueError("timeout cannot be negative")
+
+        self.timeout = timeout
+        self._root = _Node()
+
+    def bind(self, sequence: _Union[str, _Iterable[str]],
+             action: _Callable[[], _Any]) -> None:
+
+        keys = _parse(sequence)
+        if not keys:
+            raise ValueError("key sequence cannot be empty")
+
+        node = self._root
+        for key in keys:
+            node = node.children.setdefault(key, _Node())
+
+        node.action = action
+
+    def unbind(self, sequence: _Union[str, _Iterable[str]]) -> None:
+
+        keys = _parse(sequence)
+        path = [self._root]
+
+        for key in keys:
+            node = path[-1].children.get(key)
+            if node is None:
+                raise ValueError("key sequence is not bound")
+
+            path.append(node)
+
+        if len(path) < 2 or path[-1].action is None:
+            raise ValueError("key sequence is not bound")
+
+        path[-1].action = None
+
+        for i in range(len(keys), 0, -1):
+
+            if path[i].children or path[i].action is not None:
+                break
+
+            del path[i - 1].children[keys[i - 1]]
+
+
+class _Matcher:
+
+    def __init__(self, bindings: Bindings,
+                 fallback: _Callable[[_events.Event], _Any],
+                 loop: _asyncio.AbstractEventLoop) -> None:
+
+        self._bindings = bindings
+        self._fallback = fallback
+        self._loop = loop
+
+        self._node = bindings._root
+        self._pending: _List[_Tuple[_events.Event, _Node]] = []
+        self._handle = None
+
+    def close(self) -> None:
+
+        if self._handle is not None:
+            self._handle.cancel()
+            self._handle = None
+
+    def _reset(self) -> _List[_Tuple[_events.Event, _Node]]:
+
+        self.close()
+
+        pending, self._pending = self._pending, []
+        self._node = self._bindings._root
+
+        return pending
+
+    # noinspection PyBroadException
+    def _run(self, action: _Callable[[], _Any]) -> None:
+
+        try:
+            action()
+
+        except Exception:
+            _log.exception("key binding %r failed", action)
+
+    def _flush(self) -> None:
+
+        pending = self._reset()
+
+        for i in range(len(pending) - 1, -1, -1):
+
+            if pending[i][1].action is not None:
+                self._run(pending[i][1].action)
+                break
+
+        else:
+            i = 0
+            self._fallback(pending[0][0])
+
+        for event, _ in pending[i + 1:]:
+            self.feed(event)
+
+    def _expire(self) -> None:
+
+        self._handle = None
+
+        if self._pending:
+            self._flush()
+
+    def feed(self, event: _events.Event) -> None:
+
+        keys = _event_keys(event)
+
+        if keys is None:
+            if self._pending:
+                self._flush()
+
+            self._fallback(event)
+            return
+
+        node = self._node
+
+        for key in keys:
+            node = node.children.get(key)
+            if node is None:
+                break
+
+        else:
+            if node.children:
+                self._pending.append((event, node))
+                self._node = node
+                self.close()
+                self._handle = self._loop.call_later(self._bindings.timeout,
+                                                     self._expire)
+                return
+
+            self._reset()
+            self._run(node.action)
+            return
+
+        if self._pending:
+            self._flush()
+            self.feed(event)
+
+        else:
+            self._fallback(event)
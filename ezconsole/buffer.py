@@ -0,0 +1,298 @@
+#!/usr/bin/env python3
+
+from typing import (
+    Any as _Any,
+    List as _List,
+    Optional as _Optional,
+    Sequence as _Sequence,
+    Tuple as _Tuple,
+)
+
+from abc import (
+    ABCMeta as _ABCMeta,
+    abstractmethod as _abstractmethod,
+)
+
+import array as _array
+
+
+SMALL_BUFFER_CELLS = 4096
+
+KINDS = 'auto', 'array', 'numpy'
+
+_TYPECODE = 'w' if 'w' in _array.typecodes else 'u'
+
+
+class Buffer(metaclass=_ABCMeta):
+
+    kind = None
+
+    @property
+    @_abstractmethod
+    def shape(self) -> _Tuple[int, int]:
+        raise NotImplementedError
+
+    @_abstractmethod
+    def resize(self, rows: int, cols: int) -> None:
+        raise NotImplementedError
+
+    @_abstractmethod
+    def get_cells(self) -> _Any:
+        raise NotImplementedError
+
+    @_abstractmethod
+    def get_line(self, y: int) -> str:
+        raise NotImplementedError
+
+    def get_styles(self, y: int) -> _Any:
+        return None
+
+    @_abstractmethod
+    def set_line(self, y: int, text: str) -> None:
+        raise NotImplementedError
+
+    @_abstractmethod
+    def equals(self, other: 'Buffer') -> bool:
+        raise NotImplementedError
+
+    @_abstractmethod
+    def diff(self, prev: 'Buffer') -> _List[_Tuple[int, str, int]]:
+        raise NotImplementedError
+
+    @_abstractmethod
+    def copy(self, into: _Optional['Buffer'] = None) -> 'Buffer':
+        raise NotImplementedError
+
+    def convert(self, kind: str) -> 'Buffer':
+
+        if kind == self.kind:
+            return self
+
+        rows, cols = self.shape
+        other = make_buffer(kind, rows, cols)
+
+        for y in range(rows):
+            other.set_line(y, self.get_line(y))
+
+        return other
+
+
+class ArrayCells:
+
+    def __init__(self, data: _array.array, y: int, x: int, rows: int,
+                 cols: int, stride: int) -> None:
+
+        self._data = data
+        self._y = y
+        self._x = x
+        self._stride = stride
+        self.shape = rows, cols
+
+    @classmethod
+    def zeros(cls, rows: int, cols: int) -> 'ArrayCells':
+
+        return cls(_array.array(_TYPECODE, '\0' * (rows * cols)),
+                   0, 0, rows, cols, cols)
+
+    def _span(self, row: int) -> slice:
+
+        start = (self._y + row) * self._stride + self._x
+        return slice(start, start + self.shape[1])
+
+    @staticmethod
+    def _clip(key: _Any, n: int) -> _Tuple[int, int]:
+
+        if key is Ellipsis:
+            return 0, n
+
+        if not isinstance(key, slice) or key.step not in (None, 1):
+            raise TypeError("only contiguous slices are supported")
+
+        start, stop, _ = key.indices(n)
+        return start, max(start, stop)
+
+    def __getitem__(self, key: _Any) -> 'ArrayCells':
+
+        if not isinstance(key, tuple):
+            key = key, Ellipsis
+
+        rows, cols = self.shape
+        y0, y1 = self._clip(key[0], rows)
+        x0, x1 = self._clip(key[1], cols)
+
+        return ArrayCells(self._data, self._y + y0, self._x + x0,
+                          y1 - y0, x1 - x0, self._stride)
+
+    def __setitem__(self, key: _Any, value: _Any) -> None:
+
+        view = self[key]
+
+        if isinstance(value, str):
+            view.fill(value)
+
+        else:
+            view.copy_from(value)
+
+    def fill(self, char: str) -> None:
+
+        rows, cols = self.shape
+        blank = _array.array(_TYPECODE, (char or '\0')[:1] * cols)
+
+        for row in range(rows):
+            self._data[self._span(row)] = blank
+
+    def copy_from(self, other: 'ArrayCells') -> None:
+
+        if other.shape != self.shape:
+            raise ValueError(f"cannot copy {other.shape} cells "
+                             f"into {self.shape} cells")
+
+        for row in range(self.shape[0]):
+            self._data[self._span(row)] = other._data[other._span(row)]
+
+    def get_line(self, row: int) -> str:
+
+        return self._data[self._span(row)].tounicode().rstrip('\0')
+
+    def set_line(self, row: int, text: str) -> None:
+
+        cols = self.shape[1]
+        self._data[self._span(row)] = _array.array(
+            _TYPECODE, text[:cols].ljust(cols, '\0')
+        )
+
+    def write_lines(self, texts: _Sequence[str]) -> None:
+
+        rows = self.shape[0]
+
+        for row, text in enumerate(texts[:rows]):
+            self.set_line(row, text)
+
+        self[len(texts):].fill('')
+
+
+class ArrayBuffer(Buffer):
+
+    kind = 'array'
+
+    def __init__(self, rows: int = 0, cols: int = 0) -> None:
+
+        self._cells = ArrayCells.zeros(rows, cols)
+
+    @property
+    def shape(self) -> _Tuple[int, int]:
+
+        return self._cells.shape
+
+    def resize(self, rows: int, cols: int) -> None:
+
+        if (rows, cols) == self.shape:
+            return
+
+        old = self._cells
+        old_rows, old_cols = old.shape
+
+        self._cells = ArrayCells.zeros(rows, cols)
+
+        keep_rows, keep_cols = min(rows, old_rows), min(cols, old_cols)
+        self._cells[:keep_rows, :keep_cols] = old[:keep_rows, :keep_cols]
+
+    def get_cells(self) -> ArrayCells:
+
+        return self._cells
+
+    def get_line(self, y: int) -> str:
+
+        return self._cells.get_line(y)
+
+    def set_line(self, y: int, text: str) -> None:
+
+        self._cells.set_line(y, text)
+
+    def equals(self, other: Buffer) -> bool:
+
+        return (isinstance(other, ArrayBuffer) and
+                other.shape == self.shape and
+                other._cells._data == self._cells._data)
+
+    def diff(self, prev: Buffer) -> _List[_Tuple[int, str, int]]:
+
+        cells = self._cells
+        changed = []
+
+        for y in range(min(self.shape[0], prev.shape[0])):
+
+            line = cells.get_line(y)
+            old = prev.get_line(y)
+
+            if line != old:
+                changed.append((y, line, len(old)))
+
+        return changed
+
+    def copy(self, into: _Optional[Buffer] = None) -> Buffer:
+
+        if not isinstance(into, ArrayBuffer) or into.shape != self.shape:
+            into = ArrayBuffer(*self.shape)
+
+        into._cells._data[:] = self._cells._data
+        return into
+
+
+def make_buffer(kind: str, rows: int = 0, cols: int = 0) -> Buffer:
+
+    if kind == 'array':
+        return ArrayBuffer(rows, cols)
+
+    if kind == 'numpy':
+        from ._numpy_buffer import NumpyBuffer
+        return NumpyBuffer(rows, cols)
+
+    raise ValueError(f"unknown buffer kind {kind!r}")
+
+
+def select_kind(kind: str, rows: int, cols: int,
+                require_ndarray: bool = False) -> str:
+
+    if kind not in KINDS:
+        raise ValueError(f"unknown buffer kind {kind!r}")
+
+    if kind == 'array' and require_ndarray:
+        raise ValueError("elements require a numpy buffer")
+
+    if kind != 'auto':
+        return kind
+
+    if require_ndarray or rows * cols > SMALL_BUFFER_CELLS:
+        return 'numpy'
+
+    return 'array'
+
+
+def empty_like(cells: _Any) -> _Any:
+
+    if isinstance(cells, ArrayCells):
+        return ArrayCells.zeros(*cells.shape)
+
+    from ._numpy_buffer import empty_like as _empty_like
+    return _empty_like(cells)
+
+
+def write_lines(cells: _Any, texts: _Sequence[str]) -> None:
+
+    if isinstance(cells, ArrayCells):
+        cells.write_lines(texts)
+        return
+
+    from ._numpy_buffer import write_lines as _write_lines
+    _write_lines(cells, texts)
+
+
+def write_line(cells: _Any, row: int, text: str) -> None:
+
+    if isinstance(cells, ArrayCells):
+        cells.set_line(row, text)
+        return
+
+    from ._numpy_buffer import write_line as _write_line
+    _write_line(cells, row, text)
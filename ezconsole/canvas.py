@@ -0,0 +1,219 @@
+#!/usr/bin/env python3
+
+from typing import (
+    Optional as _Optional,
+    Sequence as _Sequence,
+    Tuple as _Tuple,
+    Union as _Union,
+)
+
+import numpy as _np
+
+from ._cells import text_block as _text_block
+
+
+BORDERS = {
+    'single': '┌┐└┘─│',
+    'double': '╔╗╚╝═║',
+    'rounded': '╭╮╰╯─│',
+    'heavy': '┏┓┗┛━┃',
+    'ascii': '++++-|',
+}
+
+_ALIGN = {
+    'left': _np.char.ljust,
+    'center': _np.char.center,
+    'right': _np.char.rjust,
+}
+
+_PAD = '\uffff'
+
+_Region = _Tuple[slice, slice, int, int]
+
+
+class Canvas:
+
+    def __init__(self, cells: _np.ndarray,
+                 styles: _Optional[_np.ndarray] = None) -> None:
+
+        if cells.ndim != 2:
+            raise ValueError("cells must be two-dimensional")
+
+        if styles is not None and styles.shape != cells.shape:
+            raise ValueError("styles must have the same shape as cells")
+
+        self.cells = cells
+        self.styles = styles
+
+    @property
+    def shape(self) -> _Tuple[int, int]:
+
+        return self.cells.shape
+
+    def _region(self, y: int, x: int, rows: _Optional[int],
+                cols: _Optional[int]) -> _Optional[_Region]:
+
+        total_rows, total_cols = self.cells.shape
+
+        if rows is None:
+            rows = total_rows - y
+
+        if cols is None:
+            cols = total_cols - x
+
+        y0, x0 = max(y, 0), max(x, 0)
+        y1, x1 = min(y + rows, total_rows), min(x + cols, total_cols)
+
+        if y0 >= y1 or x0 >= x1:
+            return None
+
+        return slice(y0, y1), slice(x0, x1), y0 - y, x0 - x
+
+    def _paint(self, ys: slice, xs: slice, style: _Optional[int]) -> None:
+
+        if style is not None and self.styles is not None:
+            self.styles[ys, xs] = style
+
+    def view(self, y: int = 0, x: int = 0, rows: _Optional[int] = None,
+             cols: _Optional[int] = None) -> 'Canvas':
+
+        region = self._region(y, x, rows, cols)
+
+        if region is None:
+            ys = xs = slice(0, 0)
+
+        else:
+            ys, xs, _, _ = region
+
+        return Canvas(self.cells[ys, xs],
+                      None if self.styles is None else self.styles[ys, xs])
+
+    def fill(self, char: str = ' ', y: int = 0, x: int = 0,
+             rows: _Optional[int] = None, cols: _Optional[int] = None, *,
+             style: _Optional[int] = None) -> None:
+
+        region = self._region(y, x, rows, cols)
+        if region is None:
+            return
+
+        ys, xs, _, _ = region
+        self.cells[ys, xs] = char[:1]
+        self._paint(ys, xs, style)
+
+    def clear(self) -> None:
+
+        self.cells[...] = ''
+
+        if self.styles is not None:
+            self.styles[...] = 0
+
+    def hline(self, y: int, x: int, n: int, char: str = '─', *,
+              style: _Optional[int] = None) -> None:
+
+        self.fill(char, y, x, 1, n, style=style)
+
+    def vline(self, y: int, x: int, n: int, char: str = '│', *,
+              style: _Optional[int] = None) -> None:
+
+        self.fill(char, y, x, n, 1, style=style)
+
+    def box(self, y: int = 0, x: int = 0, rows: _Optional[int] = None,
+            cols: _Optional[int] = None, *, border: str = 'single',
+            fill: _Optional[str] = None,
+            style: _Optional[int] = None) -> None:
+
+        chars = BORDERS.get(border, border)
+        if len(chars) != 6:
+            raise ValueError(f"unknown border {border!r}")
+
+        total_rows, total_cols = self.cells.shape
+        rows = total_rows - y if rows is None else rows
+        cols = total_cols - x if cols is None else cols
+
+        if rows <= 0 or cols <= 0:
+            return
+
+        top_left, top_right, bottom_left, bottom_right, across, down = chars
+        bottom, right = y + rows - 1, x + cols - 1
+
+        if fill is not None:
+            self.fill(fill, y + 1, x + 1, rows - 2, cols - 2, style=style)
+
+        self.hline(y, x + 1, cols - 2, across, style=style)
+        self.hline(bottom, x + 1, cols - 2, across, style=style)
+        self.vline(y + 1, x, rows - 2, down, style=style)
+        self.vline(y + 1, right, rows - 2, down, style=style)
+
+        self.fill(top_left, y, x, 1, 1, style=style)
+        self.fill(top_right, y, right, 1, 1, style=style)
+        self.fill(bottom_left, bottom, x, 1, 1, style=style)
+        self.fill(bottom_right, bottom, right, 1, 1, style=style)
+
+    def text(self, y: int, x: int, text: str, width: _Optional[int] = None,
+             *, align: str = 'left', fill: str = ' ',
+             style: _Optional[int] = None) -> None:
+
+        self.texts(y, x, (text,), width, align=align, fill=fill, style=style)
+
+    def texts(self, y: int, x: int, lines: _Sequence[str],
+              width: _Optional[int] = None, *, align: str = 'left',
+              fill: str = ' ', style: _Optional[int] = None) -> None:
+
+        try:
+            justify = _ALIGN[align]
+
+        except KeyError:
+            raise ValueError(f"unknown alignment {align!r}") from None
+
+        strings = _np.asarray(lines, dtype=str).reshape(-1)
+
+        if width is None:
+            width = int(_np.char.str_len(strings).max(initial=0))
+
+        if align != 'left':
+            strings = justify(strings, width, fill or _PAD)
+
+        block = _text_block(strings, width, fill)
+
+        if not fill:
+            block[block == _PAD] = ''
+
+        self.blit(block, y, x, transparent=not fill, style=style)
+
+    def vtext(self, y: int, x: int, text: str, *,
+              style: _Optional[int] = None) -> None:
+
+        self.blit(_text_block((text,), len(text), '').T, y, x, style=style)
+
+    def blit(self, source: _Union['Canvas', _np.ndarray], y: int = 0,
+             x: int = 0, *, transparent: bool = False,
+             style: _Optional[int] = None) -> None:
+
+        source_styles = None
+
+        if isinstance(source, Canvas):
+            source, source_styles = source.cells, source.styles
+
+        rows, cols = source.shape
+        region = self._region(y, x, rows, cols)
+        if region is None:
+            return
+
+        ys, xs, sy, sx = region
+        source_rows = slice(sy, sy + ys.stop - ys.start)
+        source_cols = slice(sx, sx + xs.stop - xs.start)
+
+        block = source[source_rows, source_cols]
+        mask = block != '' if transparent else True
+
+        _np.copyto(self.cells[ys, xs], block, where=mask)
+
+        if self.styles is None:
+            return
+
+        if style is not None:
+            _np.copyto(self.styles[ys, xs], style, where=mask)
+
+        elif source_styles is not None:
+            _np.copyto(self.styles[ys, xs],
+                       source_styles[source_rows, source_cols], where=mask)
@@ -0,0 +1,218 @@
+#!/usr/bin/env python3
+
+from typing import (
+    Optional as _Optional,
+    Tuple as _Tuple,
+)
+
+import numpy as _np
+
+from .elements import _Element
+
+
+_BLOCKS = _np.array(list(' ▁▂▃▄▅▆▇█'), dtype='=U1')
+
+_BRAILLE_BASE = 0x2800
+_BRAILLE_WEIGHTS = _np.array([[0x01, 0x02, 0x04, 0x40],
+                              [0x08, 0x10, 0x20, 0x80]], dtype=_np.uint32)
+
+
+class Chart(_Element):
+
+    MODES = 'block', 'braille'
+
+    def __init__(self, samples_per_column: int = 1, *,
+                 capacity: int = 1024, mode: str = 'block', height: int = 4,
+                 low: _Optional[float] = None, high: _Optional[float] = None,
+                 **kwargs) -> None:
+
+        if samples_per_column <= 0:
+            raise ValueError("samples_per_column must be positive")
+
+        if capacity <= 0:
+            raise ValueError("capacity must be positive")
+
+        if mode not in self.MODES:
+            raise ValueError(f"mode must be one of {self.MODES}")
+
+        super().__init__(**kwargs)
+
+        self._samples_per_column = samples_per_column
+        self._mode = mode
+        self._low = low
+        self._high = high
+
+        self._lo = _np.full((capacity,), _np.nan)
+        self._hi = _np.full((capacity,), _np.nan)
+        self._columns = 0
+        self._filled = samples_per_column
+
+        self._min = 1, 1
+        self._def = height, min(capacity, 80)
+
+    def clear(self) -> None:
+
+        self._lo[:] = _np.nan
+        self._hi[:] = _np.nan
+        self._columns = 0
+        self._filled = self._samples_per_column
+
+        self.invalidate()
+
+    def set_data(self, samples) -> None:
+
+        self._lo[:] = _np.nan
+        self._hi[:] = _np.nan
+        self._columns = 0
+        self._filled = self._samples_per_column
+
+        self.extend(samples)
+
+    def append(self, sample: float) -> None:
+
+        self.extend((sample,))
+
+    def _store(self, lo: _np.ndarray, hi: _np.ndarray) -> None:
+
+        capacity = len(self._lo)
+        n = len(lo)
+
+        if n > capacity:
+            lo, hi = lo[-capacity:], hi[-capacity:]
+
+        head = (self._columns + n - len(lo)) % capacity
+        first = min(len(lo), capacity - head)
+
+        self._lo[head:head + first] = lo[:first]
+        self._hi[head:head + first] = hi[:first]
+        self._lo[:len(lo) - first] = lo[first:]
+        self._hi[:len(hi) - first] = hi[first:]
+
+        self._columns += n
+
+    def extend(self, samples) -> None:
+
+        samples = _np.asarray(samples, dtype=float).ravel()
+        if not len(samples):
+            return
+
+        per_column = self._samples_per_column
+
+        if self._filled < per_column:
+
+            part = samples[:per_column - self._filled]
+            samples = samples[len(part):]
+
+            current = (self._columns - 1) % len(self._lo)
+            self._lo[current] = _np.fmin(self._lo[current], part.min())
+            self._hi[current] = _np.fmax(self._hi[current], part.max())
+            self._filled += len(part)
+
+        if len(samples):
+
+            full = len(samples) // per_column * per_column
+            blocks = samples[:full].reshape(-1, per_column)
+            rest = samples[full:]
+
+            lo = blocks.min(axis=1)
+            hi = blocks.max(axis=1)
+
+            if len(rest):
+                lo = _np.append(lo, rest.min())
+                hi = _np.append(hi, rest.max())
+                self._filled = len(rest)
+
+            else:
+                self._filled = per_column
+
+            self._store(lo, hi)
+
+        self.invalidate()
+
+    def _visible(self, n: int) -> _Tuple[_np.ndarray, _np.ndarray]:
+
+        capacity = len(self._lo)
+        count = min(n, self._columns, capacity)
+
+        index = _np.arange(self._columns - count, self._columns) % capacity
+
+        lo = _np.full((n,), _np.nan)
+        hi = _np.full((n,), _np.nan)
+        lo[n - count:] = self._lo[index]
+        hi[n - count:] = self._hi[index]
+
+        return lo, hi
+
+    def _levels(self, lo: _np.ndarray, hi: _np.ndarray,
+                steps: int) -> _Tuple[_np.ndarray, _np.ndarray, _np.ndarray]:
+
+        valid = ~(_np.isnan(lo) | _np.isnan(hi))
+
+        low, high = self._low, self._high
+
+        if low is None:
+            low = lo[valid].min(initial=_np.inf)
+
+        if high is None:
+            high = hi[valid].max(initial=-_np.inf)
+
+        if not _np.isfinite(low) or not _np.isfinite(high):
+            low, high = 0.0, 1.0
+
+        span = high - low if high > low else 1.0
+        scale = steps / span
+
+        with _np.errstate(invalid='ignore'):
+            lo_level = _np.clip(_np.floor((lo - low) * scale), 0, steps - 1)
+            hi_level = _np.clip(_np.ceil((hi - low) * scale), 1, steps)
+
+        lo_level[~valid] = 0
+        hi_level[~valid] = 0
+
+        return lo_level.astype(_np.intp), hi_level.astype(_np.intp), valid
+
+    def render(self, cells: _np.ndarray) -> None:
+
+        rows, cols = cells.shape
+
+        if not rows or not cols:
+            self._needs_refresh = False
+            return
+
+        if self._mode == 'braille':
+            self._render_braille(cells)
+
+        else:
+            self._render_block(cells)
+
+        self._needs_refresh = False
+
+    def _render_block(self, cells: _np.ndarray) -> None:
+
+        rows, cols = cells.shape
+
+        lo, hi = self._visible(cols)
+        _, level, _ = self._levels(lo, hi, rows * 8)
+
+        bottom_up = _np.arange(rows - 1, -1, -1) * 8
+        cells[:] = _BLOCKS[_np.clip(level[None, :] - bottom_up[:, None],
+                                    0, 8)]
+
+    def _render_braille(self, cells: _np.ndarray) -> None:
+
+        rows, cols = cells.shape
+        dots = rows * 4
+
+        lo, hi = self._visible(cols * 2)
+        lo_level, hi_level, valid = self._levels(lo, hi, dots)
+        hi_level = _np.maximum(hi_level, lo_level + 1)
+
+        top_down = _np.arange(dots - 1, -1, -1)
+        mask = ((top_down[None, :] >= lo_level[:, None]) &
+                (top_down[None, :] < hi_level[:, None]) &
+                valid[:, None])
+
+        codes = (mask.reshape(cols, 2, rows, 4) *
+                 _BRAILLE_WEIGHTS[None, :, None, :]).sum(axis=(1, 3))
+
+        cells[:] = (_BRAILLE_BASE + codes.T).astype('=u4').view('=U1')
@@ -0,0 +1,113 @@
+#!/usr/bin/env python3
+
+from typing import (
+    Any as _Any,
+    Callable as _Callable,
+    Dict as _Dict,
+    Optional as _Optional,
+)
+
+import logging as _logging
+import math as _math
+
+
+_log = _logging.getLogger(__name__)
+
+_SLACK = 0.001
+
+
+class _Group:
+
+    def __init__(self, interval: float, now: float) -> None:
+
+        self.interval = interval
+        self.callbacks = {}
+        self.due = self.next_after(now)
+
+    def next_after(self, now: float) -> float:
+
+        return (_math.floor(now / self.interval) + 1) * self.interval
+
+
+class AnimationClock:
+
+    def __init__(self, time: _Callable[[], float],
+                 on_change: _Callable[[], None]) -> None:
+
+        self._time = time
+        self._on_change = on_change
+        self._groups: _Dict[float, _Group] = {}
+        self._tokens = {}
+        self._next_token = 0
+
+    def __len__(self) -> int:
+
+        return len(self._tokens)
+
+    def subscribe(self, callback: _Callable[[float], _Any],
+                  rate: float) -> int:
+
+        if rate <= 0:
+            raise ValueError("rate must be positive")
+
+        interval = 1.0 / rate
+
+        group = self._groups.get(interval)
+        if group is None:
+            group = self._groups[interval] = _Group(interval, self._time())
+
+        token = self._next_token
+        self._next_token += 1
+
+        group.callbacks[token] = callback
+        self._tokens[token] = interval
+
+        self._on_change()
+
+        return token
+
+    def unsubscribe(self, token: int) -> None:
+
+        try:
+            interval = self._tokens.pop(token)
+
+        except KeyError:
+            raise ValueError("unknown subscription token") from None
+
+        group = self._groups[interval]
+        del group.callbacks[token]
+
+        if not group.callbacks:
+            del self._groups[interval]
+
+    def next_due(self) -> _Optional[float]:
+
+        return min((group.due for group in self._groups.values()),
+                   default=None)
+
+    # noinspection PyBroadException
+    def advance(self, now: float) -> int:
+
+        ticked = 0
+
+        for group in list(self._groups.values()):
+
+            if group.due > now + _SLACK:
+                continue
+
+            group.due = group.next_after(max(now, group.due))
+
+            for token, callback in list(group.callbacks.items()):
+
+                if token not in self._tokens:
+                    continue
+
+                try:
+                    callback(now)
+
+                except Exception:
+                    _log.exception("animation tick %r failed", callback)
+
+                ticked += 1
+
+        return ticked
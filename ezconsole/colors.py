@@ -0,0 +1,130 @@
+#!/usr/bin/env python3
+
+import numpy as _np
+
+from . import styles as _styles
+
+
+DEFAULT = -1
+
+_ANSI = _np.array([
+    (0x00, 0x00, 0x00), (0x80, 0x00, 0x00), (0x00, 0x80, 0x00),
+    (0x80, 0x80, 0x00), (0x00, 0x00, 0x80), (0x80, 0x00, 0x80),
+    (0x00, 0x80, 0x80), (0xc0, 0xc0, 0xc0), (0x80, 0x80, 0x80),
+    (0xff, 0x00, 0x00), (0x00, 0xff, 0x00), (0xff, 0xff, 0x00),
+    (0x00, 0x00, 0xff), (0xff, 0x00, 0xff), (0x00, 0xff, 0xff),
+    (0xff, 0xff, 0xff),
+], dtype=_np.int32)
+
+_CUBE_LEVELS = _np.array([0x00, 0x5f, 0x87, 0xaf, 0xd7, 0xff], dtype=_np.int32)
+
+_LUT_BITS = 5
+
+_luts = {}
+
+
+def level(colors: int) -> int:
+
+    if colors >= 256:
+        return 256
+
+    if colors >= 16:
+        return 16
+
+    if colors >= 8:
+        return 8
+
+    return 0
+
+
+def palette(colors: int) -> _np.ndarray:
+
+    count = level(colors)
+
+    if count <= 16:
+        return _ANSI[:count].copy()
+
+    cube = _np.stack(_np.meshgrid(_CUBE_LEVELS, _CUBE_LEVELS, _CUBE_LEVELS,
+                                  indexing='ij'), axis=-1).reshape(-1, 3)
+    grays = _np.repeat(8 + 10 * _np.arange(24, dtype=_np.int32), 3)
+
+    return _np.concatenate([_ANSI, cube, grays.reshape(-1, 3)])
+
+
+def _nearest(rgb: _np.ndarray, targets: _np.ndarray) -> _np.ndarray:
+
+    mean_red = (rgb[:, None, 0] + targets[None, :, 0]) / 2
+    delta = (rgb[:, None, :] - targets[None, :, :]).astype(_np.float64)
+
+    distance = ((2 + mean_red / 256) * delta[..., 0] ** 2 +
+                4 * delta[..., 1] ** 2 +
+                (2 + (255 - mean_red) / 256) * delta[..., 2] ** 2)
+
+    return distance.argmin(axis=1)
+
+
+def lookup_table(colors: int) -> _np.ndarray:
+
+    count = level(colors)
+
+    try:
+        return _luts[count]
+
+    except KeyError:
+        pass
+
+    size = 1 << _LUT_BITS
+    steps = (_np.arange(size, dtype=_np.int32) * 255 + (size - 1) // 2
+             ) // (size - 1)
+    grid = _np.stack(_np.meshgrid(steps, steps, steps, indexing='ij'),
+                     axis=-1).reshape(-1, 3)
+
+    if not count:
+        lut = _np.full((len(grid),), DEFAULT, dtype=_np.int16)
+
+    else:
+        targets = palette(count)
+        first = 16 if count == 256 else 0
+
+        lut = _np.empty((len(grid),), dtype=_np.int16)
+        for start in range(0, len(grid), 1024):
+            chunk = grid[start:start + 1024]
+            lut[start:start + 1024] = first + _nearest(chunk, targets[first:])
+
+    lut.flags.writeable = False
+    _luts[count] = lut
+
+    return lut
+
+
+def rgb(red, green, blue) -> _np.ndarray:
+
+    return ((_np.asarray(red, dtype=_np.int32) & 0xff) << 16 |
+            (_np.asarray(green, dtype=_np.int32) & 0xff) << 8 |
+            (_np.asarray(blue, dtype=_np.int32) & 0xff))
+
+
+def quantize(plane: _np.ndarray, colors: int) -> _np.ndarray:
+
+    plane = _np.asarray(plane, dtype=_np.int32)
+    lut = lookup_table(colors)
+
+    shift = 8 - _LUT_BITS
+    mask = (1 << _LUT_BITS) - 1
+
+    index = (((plane >> (16 + shift)) & mask) << (2 * _LUT_BITS) |
+             ((plane >> (8 + shift)) & mask) << _LUT_BITS |
+             ((plane >> shift) & mask))
+
+    return _np.where(plane < 0, DEFAULT, lut[index]).astype(_np.int16)
+
+
+def pack_styles(fg: _np.ndarray, bg: _np.ndarray,
+                flags=0) -> _np.ndarray:
+
+    fg = _np.asarray(fg).astype(_np.uint32) + 1
+    bg = _np.asarray(bg).astype(_np.uint32) + 1
+
+    return (fg & _styles.COLOR_MASK |
+            (bg & _styles.COLOR_MASK) << _styles.BG_SHIFT |
+            _np.asarray(flags, dtype=_np.uint32) & _styles.FLAGS)
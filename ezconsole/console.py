@@ -3,23 +3,43 @@
 from typing import (
     Any as _Any,
     Callable as _Callable,
+    Optional as _Optional,
+    TextIO as _TextIO,
     Tuple as _Tuple,
 )
 
-import numpy as _np
+import shutil as _shutil
+import sys as _sys
 
-from .abstract import Console as _AbstractConsole
+from . import abstract as _abstract
+from . import buffer as _buffer
+
+from .abstract._console import _Console as _AbstractConsole
 
 
 class Console:
 
-    def __init__(self) -> None:
+    interactive = True
+    fullscreen = False
+    recorder = None
+
+    def __init__(self, buffer: str = 'auto', *,
+                 backend: _Optional[_AbstractConsole] = None,
+                 fullscreen: bool = False) -> None:
 
-        self._abstract_console = _AbstractConsole()
+        kind = _buffer.select_kind(buffer, 0, 0)
+
+        self.fullscreen = fullscreen
+        self._abstract_console = (
+            backend if backend is not None else
+            _abstract.Console(fullscreen=fullscreen)
+        )
         cols = self._abstract_console.get_width()
 
-        self._prev_cells = _np.zeros((0, cols), dtype='=U1')
-        self._cells = _np.zeros((0, cols), dtype='=U1')
+        self._buffer_kind = buffer
+        self._styled = False
+        self._prev_cells = _buffer.make_buffer(kind, 0, cols)
+        self._cells = _buffer.make_buffer(kind, 0, cols)
 
     def close(self, timeout: float = 0.1) -> None:
 
@@ -33,75 +53,85 @@ class Console:
         return (self._abstract_console.get_height(),
                 self._abstract_console.get_width())
 
-    def resize_buffer(self, rows, cols) -> None:
+    def get_colors(self) -> int:
 
-        if (rows, cols) == self._cells.shape:
-            return
+        return self._abstract_console.get_colors()
 
-        try:
-            self._cells.resize((rows, cols))
+    def resize_buffer(self, rows, cols, require_ndarray: bool = False) -> None:
 
-        except ValueError:
-            pass
+        kind = _buffer.select_kind(self._buffer_kind, rows, cols,
+                                   require_ndarray or self._styled)
 
-        else:
+        if kind != self._cells.kind:
+            self._cells = self._cells.convert(kind)
+            self._prev_cells = self._prev_cells.convert(kind)
+
+        self._cells.resize(rows, cols)
+
+    def flush(self) -> None:
+
+        cells = self._cells
+
+        if cells.equals(self._prev_cells):
             return
 
-        old_rows, old_cols = self._cells.shape
+        backend = self._abstract_console
+        backend.begin_frame()
 
-        if rows <= old_rows and cols <= old_cols:
-            self._cells = self._cells[:rows, :cols]
+        try:
+            self._emit_frame(cells)
 
-        else:
-            new_cells = _np.zeros((rows, cols), dtype=self._cells.dtype)
-            new_cells[:old_rows, :old_cols] = self._cells[:rows, :cols]
-            self._cells = new_cells
+        finally:
+            backend.end_frame()
 
-    def flush(self) -> None:
+        if self.recorder is not None:
+            self.recorder.record(cells, self._prev_cells)
 
-        if _np.array_equal(self._cells, self._prev_cells):
-            return
+        self._prev_cells = cells.copy(self._prev_cells)
+
+    def _emit_frame(self, cells: _buffer.Buffer) -> None:
 
         prev_rows, prev_cols = self._prev_cells.shape
-        rows, cols = self._cells.shape
+        rows, cols = cells.shape
 
         if rows != prev_rows:
             n = self._abstract_console.request_size(rows)
             if n != rows:
                 rows = n
+                cells.resize(rows, cols)
+
+        for i, line, old_len in cells.diff(self._prev_cells):
+            self._emit_line(i, line, max(old_len - len(line), 0))
 
-                try:
-                    self._cells.resize((rows, cols))
+        for i in range(prev_rows, rows):
+            self._emit_line(i, cells.get_line(i), 0)
 
-                except ValueError:
-                    self._cells = self._cells[:rows]
+    def _emit_line(self, y: int, line: str, tail: int) -> None:
 
-        prev_lines = _np.ndarray((prev_rows,),
-                                 dtype=f'=U{prev_cols}',
-                                 buffer=self._prev_cells)
-        lines = _np.ndarray((rows,), dtype=f'=U{cols}', buffer=self._cells)
-        indices, = (lines[:prev_rows] != prev_lines[:rows]).nonzero()
+        styles = self._cells.get_styles(y)
 
-        if len(indices):
-            for i, line, old_len in zip(indices, lines[indices],
-                                        _np.char.str_len(prev_lines[indices])):
+        if styles is None:
+            self._abstract_console.line_at(y, line, tail)
 
-                self._abstract_console.line_at(i, line,
-                                               max(old_len - len(line), 0))
+        else:
+            self._abstract_console.styled_line_at(y, line, styles, tail)
 
-        if rows > prev_rows:
-            for i in range(prev_rows, rows):
-                self._abstract_console.line_at(i, lines[i], 0)
+    def get_buffer(self) -> _Any:
 
-        if self._prev_cells.shape == self._cells.shape:
-            self._prev_cells[:] = self._cells
+        return self._cells.get_cells()
 
-        else:
-            self._prev_cells = self._cells.copy()
+    def get_style_buffer(self) -> _Any:
 
-    def get_buffer(self) -> _np.ndarray:
+        if self._cells.kind != 'numpy':
 
-        return self._cells
+            if self._buffer_kind == 'array':
+                raise ValueError("styles require a numpy buffer")
+
+            self._cells = self._cells.convert('numpy')
+            self._prev_cells = self._prev_cells.convert('numpy')
+
+        self._styled = True
+        return self._cells.get_style_plane()
 
     def register_event_handler(self, func: _Callable) -> _Any:
 
@@ -110,3 +140,75 @@ class Console:
     def unregister_event_handler(self, token: _Any) -> None:
 
         self._abstract_console.unregister_input_callback(token)
+
+
+class PlainConsole(Console):
+
+    interactive = False
+
+    def __init__(self, stream: _Optional[_TextIO] = None,
+                 buffer: str = 'auto', *, rows: _Optional[int] = None,
+                 cols: _Optional[int] = None) -> None:
+
+        size = _shutil.get_terminal_size()
+        kind = _buffer.select_kind(buffer, 0, 0)
+
+        self._stream = stream if stream is not None else _sys.stdout
+        self._rows = rows if rows is not None else size.lines
+        self._cols = cols if cols is not None else size.columns
+
+        self._abstract_console = None
+        self._buffer_kind = buffer
+        self._styled = False
+        self._prev_cells = _buffer.make_buffer(kind, 0, 0)
+        self._cells = _buffer.make_buffer(kind, 0, self._cols)
+
+    def close(self, timeout: float = 0.1) -> None:
+
+        self.write_frame()
+
+    def visible_dims(self) -> _Tuple[int, int]:
+
+        return self._rows, self._cols
+
+    def get_colors(self) -> int:
+
+        return 2
+
+    def flush(self) -> None:
+
+        pass
+
+    def write_frame(self) -> None:
+
+        cells = self._cells
+
+        if cells.equals(self._prev_cells):
+            return
+
+        self._prev_cells = cells.copy(self._prev_cells)
+
+        lines = (cells.get_line(y).replace('\0', ' ').rstrip()
+                 for y in range(cells.shape[0]))
+
+        self._stream.write(''.join(line + '\n' for line in lines))
+        self._stream.flush()
+
+    def register_event_handler(self, func: _Callable) -> _Any:
+
+        return None
+
+    def unregister_event_handler(self, token: _Any) -> None:
+
+        pass
+
+
+def open_console(buffer: str = 'auto', *,
+                 fullscreen: bool = False) -> Console:
+
+    stream = _sys.stdout
+
+    if stream is not None and not stream.isatty():
+        return PlainConsole(stream, buffer)
+
+    return Console(buffer, fullscreen=fullscreen)
@@ -1,17 +1,24 @@
 #!/usr/bin/env python3
 
 from .elements import _Element
-from .console import Console as _Console
+from .console import (
+    Console as _Console,
+    open_console as _open_console,
+)
 
 
 def ez_dialog(element: _Element, console: _Console = None):
 
     if console is None:
-        console = _Console()
+        console = _open_console()
 
     min_rows, min_cols = element.get_min()
     tty_rows, tty_cols = console.visible_dims()
 
-    console.resize_buffer(min(min_rows, tty_rows), tty_cols)
+    console.resize_buffer(min(min_rows, tty_rows), tty_cols,
+                          require_ndarray=not element.accepts_array_buffer())
     element.render(console.get_buffer())
     console.flush()
+
+    if not console.interactive:
+        console.write_frame()
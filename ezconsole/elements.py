@@ -1,6 +1,9 @@
 #!/usr/bin/env python3
 
 from typing import (
+    TYPE_CHECKING as _TYPE_CHECKING,
+    Iterable as _Iterable,
+    List as _List,
     Optional as _Optional,
     Sequence as _Sequence,
     Tuple as _Tuple,
@@ -11,12 +14,244 @@ from abc import (
     abstractmethod as _abstractmethod,
 )
 
+import array as _array
+import threading as _threading
 import weakref as _weakref
 
-import numpy as _np
-
+from . import buffer as _buffer
 from . import events as _events
 
+if _TYPE_CHECKING:
+    import numpy as _np
+
+
+_SELF = 1
+_SUBTREE = 2
+_QUEUED = 4
+
+
+class _Registry:
+
+    def __init__(self) -> None:
+
+        self.nodes = []
+        self.parents = _array.array('q')
+        self.flags = bytearray()
+        self.drawn = _array.array('q')
+        self.order = _array.array('q')
+
+        self.frame = 0
+        self.sequence = 0
+
+        self._free = []
+        self._pending = []
+        self._lock = _threading.RLock()
+        self._roots = _weakref.WeakSet()
+        self._subtree = []
+
+    def register(self, node: object) -> int:
+
+        ref = _weakref.ref(node)
+
+        with self._lock:
+
+            if self._free:
+                node_id = self._free.pop()
+                self.nodes[node_id] = ref
+
+            else:
+                node_id = len(self.nodes)
+                self.nodes.append(ref)
+                self.parents.append(-1)
+                self.flags.append(0)
+                self.drawn.append(0)
+                self.order.append(0)
+
+        _weakref.finalize(node, self._release, node_id)
+        return node_id
+
+    def _release(self, node_id: int) -> None:
+
+        with self._lock:
+            self.nodes[node_id] = None
+            self.parents[node_id] = -1
+            self.flags[node_id] = 0
+            self.drawn[node_id] = 0
+            self._free.append(node_id)
+
+    def add_root(self, root: '_Container') -> None:
+
+        self._roots.add(root)
+
+    def _root_of(self, node_id: int) -> _Optional['_Container']:
+
+        parent = node_id
+        while parent >= 0:
+            node_id, parent = parent, self._parent_of(parent)
+
+        ref = self.nodes[node_id]
+        root = ref() if ref is not None else None
+
+        return root if root is not None and root in self._roots else None
+
+    def queue(self, node_id: int) -> None:
+
+        with self._lock:
+
+            flags = self.flags[node_id]
+            if flags & _QUEUED:
+                return
+
+            root = self._root_of(node_id)
+            if root is None:
+                return
+
+            self.flags[node_id] = flags | _QUEUED
+            self._pending.append(node_id)
+
+        root._wake()
+
+    def mark(self, node_id: int) -> bool:
+
+        with self._lock:
+            flags = self.flags[node_id]
+            self.flags[node_id] = flags | _SELF
+
+        self.queue(node_id)
+        return not flags & _SELF
+
+    def unmark(self, node_id: int) -> None:
+
+        with self._lock:
+            self.flags[node_id] &= ~(_SELF | _SUBTREE)
+
+    def stamp(self, node_id: int) -> None:
+
+        self.drawn[node_id] = self.frame
+        self.order[node_id] = self.sequence
+        self.sequence += 1
+
+    def _parent_of(self, node_id: int) -> int:
+
+        parent_id = self.parents[node_id]
+        if parent_id < 0:
+            return -1
+
+        node = self.nodes[node_id]()
+        parent_ref = self.nodes[parent_id]
+
+        if (node is None or parent_ref is None or
+                node._parent() is not parent_ref()):
+            return -1
+
+        return parent_id
+
+    def _is_barrier(self, node_id: int) -> bool:
+
+        node = self.nodes[node_id]()
+        return node is not None and (node._cached or node._barrier)
+
+    def collect(self, root: '_Container') -> _List['_Element']:
+
+        self.frame += 1
+
+        with self._lock:
+            pending, self._pending = self._pending, []
+
+        flags = self.flags
+        drawn = self.drawn
+        root_id = root._id
+
+        memo = {}
+        targets = set()
+
+        for node_id in pending:
+
+            flags[node_id] &= ~_QUEUED
+
+            if not flags[node_id] & _SELF or self.nodes[node_id] is None:
+                continue
+
+            path = []
+            node = node_id
+
+            while node not in memo:
+
+                path.append(node)
+                parent = self._parent_of(node)
+
+                if parent < 0:
+                    memo[node] = node, -1
+                    path.pop()
+                    break
+
+                node = parent
+
+            top = memo[node][0]
+
+            for node in reversed(path):
+
+                parent = self.parents[node]
+                upper = memo[parent][1]
+
+                if (upper < 0 and parent != top and
+                        drawn[node] < drawn[parent]):
+                    upper = parent
+
+                if upper < 0 and (flags[node] & _SELF or
+                                  self._is_barrier(node)):
+                    upper = node
+
+                memo[node] = top, upper
+
+            if top != root_id:
+
+                other = self.nodes[top]()
+                if other is not None and other in self._roots:
+                    with self._lock:
+                        flags[node_id] |= _QUEUED
+                        self._pending.append(node_id)
+                    other._wake()
+
+                continue
+
+            for node in path[1:]:
+                if not flags[node] & _SUBTREE:
+                    flags[node] |= _SUBTREE
+                    self._subtree.append(node)
+
+            target = memo[node_id][1] if node_id in memo else -1
+            if target >= 0:
+                targets.add(target)
+
+        order = self.order
+        return [self.nodes[node_id]()
+                for node_id in sorted(targets, key=order.__getitem__)]
+
+    def finish(self) -> None:
+
+        flags = self.flags
+
+        for node_id in self._subtree:
+            flags[node_id] &= ~_SUBTREE
+
+        self._subtree.clear()
+
+    def clear_subtree(self, root: '_Element') -> None:
+
+        flags = self.flags
+        stack = [root]
+
+        with self._lock:
+
+            while stack:
+                node = stack.pop()
+                flags[node._id] &= ~(_SELF | _SUBTREE)
+                stack.extend(node.get_children())
+
+
+_registry = _Registry()
+
 
 class _Container(metaclass=_ABCMeta):
 
@@ -24,26 +259,42 @@ class _Container(metaclass=_ABCMeta):
 
         super().__init__(**kwargs)
 
-        self._refresh_children = _weakref.WeakSet()
+        self._id = _registry.register(self)
+
+    def _wake(self) -> None:
+
+        pass
 
     def invalidate_child(self, child: '_Element') -> bool:
 
-        if child in self._refresh_children:
+        if child._parent() is not self:
             return False
 
-        self._refresh_children.add(child)
+        _registry.queue(child._id)
         return True
 
 
 class _Element(metaclass=_ABCMeta):
 
-    def __init__(self, *, parent: _Container = None, **kwargs) -> None:
+    _barrier = False
+
+    def __init__(self, *, parent: _Container = None, cached: bool = False,
+                 **kwargs) -> None:
+
+        self._id = None
 
         super().__init__(**kwargs)
 
-        self._parent = None
+        if self._id is None:
+            self._id = _registry.register(self)
+
+        self._parent = type(None)
         self._needs_refresh = True
-        self._refresh_children = None
+
+        self._cached = cached
+        self._surface = None
+        self._retained = False
+        self._view = None
 
         self._min = 0, 0
         self._def = 0, 0
@@ -51,6 +302,38 @@ class _Element(metaclass=_ABCMeta):
 
         self.parent = parent
 
+    def __getstate__(self) -> dict:
+
+        state = self.__dict__.copy()
+        del state['_id']
+        state['_parent'] = None
+        state['_surface'] = None
+        state['_view'] = None
+
+        return state
+
+    def __setstate__(self, state: dict) -> None:
+
+        state['_parent'] = type(None)
+        self.__dict__.update(state)
+
+        self._id = _registry.register(self)
+        self._needs_refresh = True
+
+    @property
+    def _needs_refresh(self) -> bool:
+
+        return bool(_registry.flags[self._id] & _SELF)
+
+    @_needs_refresh.setter
+    def _needs_refresh(self, needs_refresh: bool) -> None:
+
+        if needs_refresh:
+            _registry.mark(self._id)
+
+        else:
+            _registry.unmark(self._id)
+
     @property
     def parent(self) -> _Optional[_Container]:
 
@@ -61,9 +344,11 @@ class _Element(metaclass=_ABCMeta):
 
         if parent is None:
             self._parent = type(None)
+            _registry.parents[self._id] = -1
             return
 
         self._parent = _weakref.ref(parent)
+        _registry.parents[self._id] = parent._id
 
         if self._needs_refresh:
             parent.invalidate_child(self)
@@ -76,24 +361,85 @@ class _Element(metaclass=_ABCMeta):
 
         return self._def
 
+    def get_children(self) -> _List['_Element']:
+
+        return []
+
     @_abstractmethod
-    def render(self, cells: _np.ndarray) -> None:
+    def render(self, cells: '_np.ndarray') -> None:
 
         raise NotImplementedError
 
-    def invalidate(self) -> bool:
+    @property
+    def cached(self) -> bool:
 
-        if self._needs_refresh:
-            return False
+        return self._cached
 
-        self._needs_refresh = True
+    @cached.setter
+    def cached(self, cached: bool) -> None:
 
-        parent = self._parent()
-        if parent is not None:
-            parent.invalidate_child(self)
+        self._cached = cached
+
+        if not cached:
+            self._surface = None
+
+    def is_dirty(self) -> bool:
+
+        return bool(_registry.flags[self._id] & (_SELF | _SUBTREE))
+
+    def accepts_array_buffer(self) -> bool:
+
+        return False
+
+    def draw(self, cells: '_np.ndarray', retained: bool = False) -> None:
+
+        self._view = cells
+        _registry.stamp(self._id)
+
+        if not self._cached:
+
+            if retained and not self.is_dirty():
+                return
+
+            self._retained = retained
+            self.render(cells)
+            self._retained = False
+            return
+
+        surface = self._surface
+        dirty = self.is_dirty()
+
+        if surface is None or surface.shape != cells.shape:
+            surface = self._surface = _buffer.empty_like(cells)
+            self._retained = False
+            dirty = True
+
+        else:
+            self._retained = True
+
+        if dirty:
+            self.render(surface)
 
+        self._retained = False
+
+        if dirty or not retained:
+            cells[...] = surface
+
+    def restore(self, cells: '_np.ndarray', rows: slice, cols: slice) -> bool:
+
+        surface = self._surface
+
+        if (surface is None or surface.shape != cells.shape or
+                self.is_dirty()):
+            return False
+
+        cells[rows, cols] = surface[rows, cols]
         return True
 
+    def invalidate(self) -> bool:
+
+        return _registry.mark(self._id)
+
     def handle_event(self, event: _events.Event) -> bool:
 
         return False
@@ -102,16 +448,78 @@ class _Element(metaclass=_ABCMeta):
 # noinspection PyAbstractClass
 class _ContainerElement(_Element, _Container):
 
-    def invalidate_child(self, child: _Element) -> bool:
+    pass
 
-        if not super().invalidate_child(child):
-            return False
 
-        parent = self._parent()
-        if parent is not None:
-            parent.invalidate_child(self)
+class Stack(_ContainerElement):
 
-        return True
+    def __init__(self, children: _Iterable[_Element], *,
+                 focus: _Optional[int] = None, **kwargs) -> None:
+
+        super().__init__(**kwargs)
+
+        self._children = list(children)
+        self._focus = focus
+        self._layout = None
+
+        for child in self._children:
+            child.parent = self
+
+        self._min = (sum(child.get_min()[0] for child in self._children),
+                     max((child.get_min()[1] for child in self._children),
+                         default=0))
+        self._def = (sum(child.get_def()[0] for child in self._children),
+                     max((child.get_def()[1] for child in self._children),
+                         default=0))
+
+    def get_children(self) -> _List[_Element]:
+
+        return list(self._children)
+
+    def accepts_array_buffer(self) -> bool:
+
+        return all(child.accepts_array_buffer() for child in self._children)
+
+    def _heights(self, rows: int) -> _List[int]:
+
+        heights = []
+        remaining = rows
+
+        for child in self._children:
+            height = min(child.get_min()[0], remaining)
+            heights.append(height)
+            remaining -= height
+
+        for i, child in enumerate(self._children):
+            extra = min(max(child.get_def()[0] - heights[i], 0), remaining)
+            heights[i] += extra
+            remaining -= extra
+
+        return heights
+
+    def render(self, cells: '_np.ndarray') -> None:
+
+        layout = cells.shape, self._heights(cells.shape[0])
+        retained = self._retained and layout == self._layout
+        self._layout = layout
+
+        y = 0
+        for child, height in zip(self._children, layout[1]):
+
+            child.draw(cells[y:y + height], retained=retained)
+            y += height
+
+        if not retained:
+            cells[y:] = ''
+
+        self._needs_refresh = False
+
+    def handle_event(self, event: _events.Event) -> bool:
+
+        if self._focus is not None:
+            return self._children[self._focus].handle_event(event)
+
+        return any(child.handle_event(event) for child in self._children)
 
 
 class Choice(_Element):
@@ -129,10 +537,10 @@ class Choice(_Element):
         self._min = min(3, height), min(3, width) + 4
         self._def = height, width + 4
 
-    def render(self, cells: _np.ndarray) -> None:
+    def render(self, cells: '_np.ndarray') -> None:
 
         rows, cols = cells.shape
-        lines = _np.ndarray((rows,), dtype=f'=U{cols}', buffer=cells)
+        lines = []
 
         count = min(len(self._items), rows)
         choice = self._choice - 1
@@ -142,14 +550,18 @@ class Choice(_Element):
             text = f" {item:.{cols-4}} "
 
             if y == choice:
-                lines[y] = text.center(cols, '=')
+                lines.append(text.center(cols, '='))
             else:
-                lines[y] = text.center(cols)
+                lines.append(text.center(cols))
 
-        lines[count:] = ''
+        _buffer.write_lines(cells, lines)
 
         self._needs_refresh = False
 
+    def accepts_array_buffer(self) -> bool:
+
+        return True
+
     def handle_event(self, event: _events.Event) -> bool:
 
         if not isinstance(event, _events.VerticalNavEvent):
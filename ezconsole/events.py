@@ -16,6 +16,35 @@ class QuitEvent(Event):
     pass
 
 
+class KeyEvent(Event):
+
+    def __init__(self, key: str, text: str = '') -> None:
+
+        self.key = key
+        self.text = text
+
+
+class ModeReportEvent(Event):
+
+    def __init__(self, mode: int, state: int) -> None:
+
+        self.mode = mode
+        self.state = state
+
+
+class DeviceAttributesEvent(Event):
+
+    pass
+
+
+class PasteEvent(Event):
+
+    def __init__(self, text: str, final: bool = True) -> None:
+
+        self.text = text
+        self.final = final
+
+
 class NavigateEvent(Event):
 
     @_abstractproperty
@@ -1,77 +1,367 @@
 #!/usr/bin/env python3
 
+from typing import (
+    Any as _Any,
+    Callable as _Callable,
+    Hashable as _Hashable,
+    List as _List,
+    Optional as _Optional,
+    Tuple as _Tuple,
+)
+
 import asyncio as _asyncio
+import logging as _logging
 
 from asyncio import Event as _Signal
+from collections import deque as _deque
 from functools import partial as _partial
 
+import numpy as _np
+
 from . import events as _events
 
+from .bindings import (
+    Bindings as _Bindings,
+    _Matcher,
+)
+from .clock import AnimationClock as _AnimationClock
+
+from ._frames import _FrameRoot
 from .elements import (
-    _Container,
     _Element,
+    _registry,
+)
+
+from .console import (
+    Console as _Console,
+    open_console as _open_console,
 )
 
-from .console import Console as _Console
+
+_log = _logging.getLogger(__name__)
+
+_Rect = _Tuple[int, int, int, int]
+
+
+def _intersect(a: _Rect, b: _Rect) -> _Optional[_Rect]:
+
+    y0, x0 = max(a[0], b[0]), max(a[1], b[1])
+    y1, x1 = min(a[2], b[2]), min(a[3], b[3])
+
+    if y0 >= y1 or x0 >= x1:
+        return None
+
+    return y0, x0, y1, x1
+
+
+class _Layer:
+
+    def __init__(self, element: _Element, y: _Optional[int] = None,
+                 x: _Optional[int] = None, rows: _Optional[int] = None,
+                 cols: _Optional[int] = None, z: float = 0) -> None:
+
+        self.element = element
+        self.y = y
+        self.x = x
+        self.rows = rows
+        self.cols = cols
+        self.z = z
+        self.rect = None
+
+    def place(self, shape: _Tuple[int, int]) -> _Rect:
+
+        buffer_rows, buffer_cols = shape
+        def_rows, def_cols = self.element.get_def()
+
+        rows = min(def_rows if self.rows is None else self.rows, buffer_rows)
+        cols = min(def_cols if self.cols is None else self.cols, buffer_cols)
+
+        if self.y is None:
+            y = (buffer_rows - rows) // 2
+        else:
+            y = min(max(self.y, 0), buffer_rows - rows)
+
+        if self.x is None:
+            x = (buffer_cols - cols) // 2
+        else:
+            x = min(max(self.x, 0), buffer_cols - cols)
+
+        return y, x, y + rows, x + cols
 
 
-class GUI(_Container):
+class GUI(_FrameRoot):
 
     def __init__(self, element: _Element, *, console: _Console = None,
+                 frame_rate: float = 60.0, bindings: _Bindings = None,
+                 fullscreen: bool = False,
+                 loop: _Optional[_asyncio.AbstractEventLoop] = None,
                  **kwargs) -> None:
 
-        super().__init__(**kwargs)
+        if fullscreen and console is not None and not console.fullscreen:
+            raise ValueError("console is not in full-screen mode")
+
+        super().__init__(frame_rate=frame_rate, loop=loop, **kwargs)
 
         self.element = element
-        self.console = console if console is not None else _Console()
+        self.console = (console if console is not None else
+                        _open_console(fullscreen=fullscreen))
+        self.bindings = bindings
+
+        self._buffer = None
+        self._buffer_shape = None
+
+        self._base = _Layer(element, 0, 0, float('inf'), float('inf'))
+        self._layers = []
+        self._damage = []
+
+        self._updates = _deque()
+        self._wakeup_pending = False
+
+        self.clock = _AnimationClock(self._loop.time, self._schedule_tick)
 
         def_rows, def_cols = element.get_def()
-        tty_rows, tty_cols = console.visible_dims()
+        tty_rows, tty_cols = self.console.visible_dims()
+
+        if self.console.fullscreen:
+            def_rows = tty_rows
 
-        self.console.resize_buffer(min(def_rows, tty_rows), tty_cols)
+        self.console.resize_buffer(min(def_rows, tty_rows), tty_cols,
+                                   require_ndarray=True)
+
+        _registry.add_root(self)
 
         self.element.parent = self
         self.invalidate_child(self.element)
         # self._refresh()
 
+    def _schedule_tick(self) -> None:
+
+        due = self.clock.next_due()
+
+        if due is not None:
+            self._schedule_at(max(due, self._next_frame))
+
+    def post(self, key: _Hashable, func: _Callable[..., _Any],
+             *args: _Any) -> None:
+
+        self._updates.append((key, func, args))
+
+        if self._wakeup_pending or self._loop.is_closed():
+            return
+
+        self._wakeup_pending = True
+        self._loop.call_soon_threadsafe(self._schedule_refresh)
+
+    # noinspection PyBroadException
+    def _apply_updates(self) -> None:
+
+        self._wakeup_pending = False
+
+        updates = {}
+        for _ in range(len(self._updates)):
+            key, func, args = self._updates.popleft()
+            updates[key] = func, args
+
+        for func, args in updates.values():
+
+            try:
+                func(*args)
+
+            except Exception:
+                _log.exception("posted update %r failed", func)
+
+    def push_layer(self, element: _Element, *, y: _Optional[int] = None,
+                   x: _Optional[int] = None, rows: _Optional[int] = None,
+                   cols: _Optional[int] = None,
+                   z: _Optional[float] = None) -> None:
+
+        if element is self.element or self._find_layer(element) is not None:
+            raise ValueError("element is already shown")
+
+        if z is None:
+            z = self._layers[-1].z if self._layers else 0
+
+        layer = _Layer(element, y, x, rows, cols, z)
+        index = sum(1 for other in self._layers if other.z <= z)
+        self._layers.insert(index, layer)
+
+        self.element.cached = True
+        element.cached = True
+        element.parent = self
+        self.invalidate_child(element)
+
+    def remove_layer(self, element: _Element) -> None:
+
+        layer = self._find_layer(element)
+        if layer is None:
+            raise ValueError("element is not shown in a layer")
+
+        self._layers.remove(layer)
+        self._damage_rect(layer.rect)
+
+        if element.parent is self:
+            element.parent = None
+
+    def move_layer(self, element: _Element, y: _Optional[int] = None,
+                   x: _Optional[int] = None) -> None:
+
+        layer = self._find_layer(element)
+        if layer is None:
+            raise ValueError("element is not shown in a layer")
+
+        layer.y, layer.x = y, x
+        self._damage_rect(layer.rect)
+
+    def get_layers(self) -> _List[_Element]:
+
+        return [layer.element for layer in self._layers]
+
+    def _find_layer(self, element: _Element) -> _Optional[_Layer]:
+
+        for layer in self._layers:
+            if layer.element is element:
+                return layer
+
+        return None
+
+    def _damage_rect(self, rect: _Optional[_Rect]) -> None:
+
+        if rect is not None:
+            self._damage.append(rect)
+
+        self._schedule_refresh()
+
+    def _composite(self, buffer: _np.ndarray, retained: bool) -> None:
+
+        shape = buffer.shape
+        layers = [self._base] + self._layers
+        rects = [layer.place(shape) for layer in layers]
+
+        damage = [] if retained else [(0, 0) + shape]
+        damage.extend(self._damage)
+        self._damage.clear()
+
+        covered = _np.zeros(shape, dtype=bool)
+        visible = [False] * len(layers)
+
+        for i in range(len(layers) - 1, -1, -1):
+
+            y0, x0, y1, x1 = rects[i]
+            area = covered[y0:y1, x0:x1]
+
+            visible[i] = area.size > 0 and not area.all()
+            area[...] = True
+
+        for layer, rect, shown in zip(layers, rects, visible):
+
+            if not shown:
+                continue
+
+            y0, x0, y1, x1 = rect
+            element = layer.element
+            cells = buffer[y0:y1, x0:x1]
+
+            hits = [hit for hit in (_intersect(rect, other)
+                                    for other in damage) if hit is not None]
+
+            if element.is_dirty() or rect != layer.rect:
+
+                element.draw(cells, retained=rect == layer.rect and not hits)
+                layer.rect = rect
+                damage.append(rect)
+                continue
+
+            for hy0, hx0, hy1, hx1 in hits:
+
+                if not element.restore(cells, slice(hy0 - y0, hy1 - y0),
+                                       slice(hx0 - x0, hx1 - x0)):
+
+                    element.draw(cells)
+                    damage.append(rect)
+                    break
+
+                damage.append((hy0, hx0, hy1, hx1))
+
     def _refresh(self) -> None:
 
-        if not self._refresh_children:
+        loop = self._loop
+
+        self._apply_updates()
+
+        if self.clock:
+            self.clock.advance(loop.time())
+
+        self._frame_handle = None
+
+        targets = _registry.collect(self)
+
+        if not targets and not self._damage:
+            _registry.finish()
+            self._schedule_tick()
             return
 
+        self._next_frame = loop.time() + self._frame_interval
+
         buffer = self.console.get_buffer()
+        retained = (buffer is self._buffer and
+                    buffer.shape == self._buffer_shape)
 
-        if self.element in self._refresh_children:
-            self.element.render(buffer)
+        if (retained and not self._damage and not self._layers and
+                all(target.parent is not self and target._view is not None
+                    for target in targets)):
 
-        self._refresh_children.clear()
+            for target in targets:
+                target.draw(target._view, retained=True)
 
-        _asyncio.get_running_loop().call_soon(self.console.flush)
+        else:
+            self._composite(buffer, retained)
 
-    def invalidate_child(self, child: _Element) -> bool:
+        self._buffer = buffer
+        self._buffer_shape = buffer.shape
 
-        if not super().invalidate_child(child):
-            return False
+        _registry.finish()
 
-        _asyncio.get_running_loop().call_soon(self._refresh)
-        return True
+        loop.call_soon(self.console.flush)
+        self._schedule_tick()
 
-    def _event_callback(self, event: _events.Event,
-                        *, quit_signal: _Signal) -> None:
+    def _dispatch(self, event: _events.Event, *, quit_signal: _Signal) -> None:
 
         if isinstance(event, _events.QuitEvent):
             quit_signal.set()
             return
 
-        self.element.handle_event(event)
+        if self._layers:
+            self._layers[-1].element.handle_event(event)
+
+        else:
+            self.element.handle_event(event)
 
     async def handle(self) -> None:
 
+        if not self.console.interactive:
+
+            if self._frame_handle is not None:
+                self._frame_handle.cancel()
+                self._refresh()
+
+            self.console.write_frame()
+            return
+
         quit_signal = _Signal()
-        token = self.console.register_event_handler(
-            _partial(self._event_callback, quit_signal=quit_signal)
-        )
+        callback = _partial(self._dispatch, quit_signal=quit_signal)
+        matcher = None
+
+        if self.bindings is not None:
+            matcher = _Matcher(self.bindings, callback, self._loop)
+            callback = matcher.feed
+
+        token = self.console.register_event_handler(callback)
+
+        try:
+            await quit_signal.wait()
 
-        await quit_signal.wait()
+        finally:
+            self.console.unregister_event_handler(token)
 
-        self.console.unregister_event_handler(token)
+            if matcher is not None:
+                matcher.close()
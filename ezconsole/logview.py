@@ -0,0 +1,125 @@
+#!/usr/bin/env python3
+
+from typing import (
+    Iterable as _Iterable,
+)
+
+import threading as _threading
+
+import numpy as _np
+
+from . import events as _events
+
+from .elements import _Element
+
+
+class LogView(_Element):
+
+    def __init__(self, capacity: int = 10000, width: int = 200,
+                 **kwargs) -> None:
+
+        if capacity <= 0:
+            raise ValueError("capacity must be positive")
+
+        if width <= 0:
+            raise ValueError("width must be positive")
+
+        super().__init__(**kwargs)
+
+        self._ring = _np.zeros((capacity,), dtype=f'=U{width}')
+        self._count = 0
+        self._scroll = 0
+
+        self._lock = _threading.Lock()
+
+        self._min = 1, 1
+        self._def = min(capacity, 10), width
+
+    def __len__(self) -> int:
+
+        return min(self._count, len(self._ring))
+
+    def append(self, line: str) -> None:
+
+        self.extend((line,))
+
+    def extend(self, lines: _Iterable[str]) -> None:
+
+        batch = _np.asarray(list(lines), dtype=self._ring.dtype)
+        n = len(batch)
+        if not n:
+            return
+
+        capacity = len(self._ring)
+        if n > capacity:
+            batch = batch[-capacity:]
+
+        with self._lock:
+
+            head = (self._count + n - len(batch)) % capacity
+            first = min(len(batch), capacity - head)
+
+            self._ring[head:head + first] = batch[:first]
+            self._ring[:len(batch) - first] = batch[first:]
+
+            self._count += n
+
+            if self._scroll:
+                self._scroll = min(self._scroll + n,
+                                   max(min(self._count, capacity) - 1, 0))
+
+        self.invalidate()
+
+    def clear(self) -> None:
+
+        with self._lock:
+            self._count = 0
+            self._scroll = 0
+
+        self.invalidate()
+
+    def scroll(self, delta: int) -> None:
+
+        with self._lock:
+            available = min(self._count, len(self._ring))
+            scroll = min(max(self._scroll + delta, 0), max(available - 1, 0))
+
+            if scroll == self._scroll:
+                return
+
+            self._scroll = scroll
+
+        self.invalidate()
+
+    def follow(self) -> None:
+
+        self.scroll(-self._scroll)
+
+    def render(self, cells: _np.ndarray) -> None:
+
+        rows, cols = cells.shape
+        capacity = len(self._ring)
+
+        with self._lock:
+            end = self._count - self._scroll
+            start = max(end - rows, self._count - capacity, 0)
+            tail = self._ring[_np.arange(start, end) % capacity]
+
+        n = len(tail)
+
+        if cols:
+            cells[:n] = tail.astype(f'=U{cols}').view('=U1').reshape(n, cols)
+
+        cells[n:] = ''
+
+        self._needs_refresh = False
+
+    def handle_event(self, event: _events.Event) -> bool:
+
+        if not isinstance(event, _events.VerticalNavEvent):
+
+            return False
+
+        self.scroll(-event.y)
+
+        return True
@@ -0,0 +1,269 @@
+#!/usr/bin/env python3
+
+from typing import (
+    Callable as _Callable,
+    List as _List,
+    Optional as _Optional,
+    Tuple as _Tuple,
+)
+
+import asyncio as _asyncio
+import copy as _copy
+import functools as _functools
+import logging as _logging
+import pickle as _pickle
+import weakref as _weakref
+
+from concurrent.futures import (
+    Executor as _Executor,
+    Future as _Future,
+    ProcessPoolExecutor as _ProcessPoolExecutor,
+    ThreadPoolExecutor as _ThreadPoolExecutor,
+)
+from multiprocessing.shared_memory import SharedMemory as _SharedMemory
+
+import numpy as _np
+
+from . import events as _events
+
+from .elements import (
+    _ContainerElement,
+    _Element,
+    _registry,
+)
+
+
+_log = _logging.getLogger(__name__)
+
+_default_executor = None
+
+
+def _get_default_executor() -> _Executor:
+
+    global _default_executor
+
+    if _default_executor is None:
+        _default_executor = _ThreadPoolExecutor(
+            thread_name_prefix='ezconsole-render'
+        )
+
+    return _default_executor
+
+
+# noinspection PyBroadException
+def _release(shm: _SharedMemory) -> None:
+
+    try:
+        shm.close()
+
+    except BufferError:
+        pass
+
+    except Exception:
+        _log.exception("unable to close shared cells during cleanup")
+
+    try:
+        shm.unlink()
+
+    except FileNotFoundError:
+        pass
+
+    except Exception:
+        _log.exception("unable to unlink shared cells during cleanup")
+
+
+class _SharedCells:
+
+    def __init__(self, shape: _Tuple[int, int]) -> None:
+
+        rows, cols = shape
+        dtype = _np.dtype('=U1')
+
+        self._shm = _SharedMemory(create=True,
+                                  size=max(rows * cols * dtype.itemsize, 1))
+        self._finalizer = _weakref.finalize(self, _release, self._shm)
+
+        self.name = self._shm.name
+        self.shape = shape
+        self.cells = _np.ndarray(shape, dtype=dtype, buffer=self._shm.buf)
+        self.cells[...] = ''
+
+    def close(self) -> None:
+
+        self.cells = None
+        self._finalizer()
+
+
+def _job_finished(loop: _asyncio.AbstractEventLoop,
+                  callback: _Callable[[_Future], None], job: _Future) -> None:
+
+    if not loop.is_closed():
+        loop.call_soon_threadsafe(callback, job)
+
+
+def _render_shared(name: str, shape: _Tuple[int, int],
+                   payload: bytes) -> None:
+
+    element = _pickle.loads(payload)
+    shm = _SharedMemory(name=name)
+
+    try:
+        cells = _np.ndarray(shape, dtype='=U1', buffer=shm.buf)
+        element.render(cells)
+        del cells
+
+    finally:
+        shm.close()
+
+
+class Offload(_ContainerElement):
+
+    _barrier = True
+
+    def __init__(self, child: _Element, *,
+                 executor: _Optional[_Executor] = None, **kwargs) -> None:
+
+        super().__init__(**kwargs)
+
+        self.child = child
+        self._executor = executor
+        self._front = None
+        self._back = None
+        self._job = None
+        self._stale = False
+        self._picklable = True
+
+        self._min = child.get_min()
+        self._def = child.get_def()
+
+        child.parent = self
+
+    def close(self) -> None:
+
+        job, self._job = self._job, None
+        if job is not None:
+            job.cancel()
+
+        for surface in (self._front, self._back):
+            if surface is not None:
+                surface.close()
+
+        self._front = self._back = None
+
+    def is_busy(self) -> bool:
+
+        return self._job is not None
+
+    def get_children(self) -> _List[_Element]:
+
+        return [self.child]
+
+    # noinspection PyBroadException
+    def _payload(self) -> _Optional[bytes]:
+
+        if not self._picklable:
+            return None
+
+        try:
+            return _pickle.dumps(self.child)
+
+        except Exception:
+            _log.warning("cannot send %r to a worker process, rendering it "
+                         "inline", self.child, exc_info=True)
+            self._picklable = False
+            return None
+
+    def _submit(self, shape: _Tuple[int, int]) -> bool:
+
+        if self._job is not None:
+            self._stale = self._stale or self.child.is_dirty()
+            return True
+
+        try:
+            loop = _asyncio.get_running_loop()
+
+        except RuntimeError:
+            return False
+
+        executor = self._executor or _get_default_executor()
+        shared = isinstance(executor, _ProcessPoolExecutor)
+
+        if shared:
+            payload = self._payload()
+            if payload is None:
+                return False
+
+        else:
+            snapshot = _copy.copy(self.child)
+
+        back = self._back
+        if back is None or back.shape != shape:
+            if back is not None:
+                back.close()
+            back = self._back = _SharedCells(shape)
+
+        _registry.clear_subtree(self.child)
+
+        if shared:
+            job = executor.submit(_render_shared, back.name, shape, payload)
+
+        else:
+            job = executor.submit(snapshot.render, back.cells)
+
+        self._job = job
+        job.add_done_callback(
+            _functools.partial(_job_finished, loop, self._job_done)
+        )
+
+        return True
+
+    def _job_done(self, job: _Future) -> None:
+
+        if job is not self._job:
+            return
+
+        self._job = None
+
+        if job.cancelled():
+            return
+
+        error = job.exception()
+
+        if error is not None:
+            _log.error("offloaded render of %r failed", self.child,
+                       exc_info=error)
+
+        else:
+            self._front, self._back = self._back, self._front
+
+        if self._stale:
+            self._stale = False
+            self.child._needs_refresh = True
+
+        self._needs_refresh = False
+        self.invalidate()
+
+    def render(self, cells: _np.ndarray) -> None:
+
+        front = self._front
+        shape = cells.shape
+
+        if (self.child.is_dirty() or front is None or
+                front.shape != shape):
+
+            if not self._submit(shape):
+                self.child.render(cells)
+                self._needs_refresh = False
+                return
+
+        if front is not None and front.shape == shape:
+            cells[...] = front.cells
+
+        elif not self._retained:
+            cells[...] = ''
+
+        self._needs_refresh = False
+
+    def handle_event(self, event: _events.Event) -> bool:
+
+        return self.child.handle_event(event)
@@ -0,0 +1,251 @@
+#!/usr/bin/env python3
+
+from typing import (
+    Callable as _Callable,
+    Iterable as _Iterable,
+    Optional as _Optional,
+    Union as _Union,
+)
+
+import time as _time
+
+import numpy as _np
+
+from . import events as _events
+
+from ._cells import (
+    number_block as _number_block,
+    text_block as _text_block,
+)
+
+from .elements import _Element
+
+
+_Index = _Union[int, _np.ndarray, _Iterable[int]]
+
+_BAR = _np.array(list(' ▏▎▍▌▋▊▉█'), dtype='=U1')
+_UNKNOWN_ETA = _np.array(list('--:--:--'), dtype='=U1')
+
+
+class MultiProgress(_Element):
+
+    def __init__(self, labels: _Iterable[str] = (),
+                 totals: _Optional[_Iterable[float]] = None, *,
+                 height: int = 10, label_width: int = 20,
+                 smoothing: float = 2.0,
+                 time: _Callable[[], float] = _time.monotonic,
+                 **kwargs) -> None:
+
+        if label_width < 0:
+            raise ValueError("label_width cannot be negative")
+
+        if smoothing < 0:
+            raise ValueError("smoothing cannot be negative")
+
+        super().__init__(**kwargs)
+
+        self._size = 0
+        self._labels = _np.zeros((0,), dtype=f'=U{label_width or 1}')
+        self._label_width = label_width
+        self._done = _np.zeros((0,))
+        self._total = _np.zeros((0,))
+        self._rate = _np.zeros((0,))
+        self._eta = _np.zeros((0,))
+        self._last_done = _np.zeros((0,))
+        self._last_time = None
+        self._smoothing = smoothing
+        self._time = time
+        self._offset = 0
+
+        self.extend(labels, totals)
+
+        self._min = 1, 20
+        self._def = height, 80
+
+    def __len__(self) -> int:
+
+        return self._size
+
+    def _reserve(self, n: int) -> None:
+
+        capacity = len(self._done)
+        if n <= capacity:
+            return
+
+        capacity = max(n, 2 * capacity, 16)
+
+        for name in ('_labels', '_done', '_total', '_rate', '_eta',
+                     '_last_done'):
+
+            old = getattr(self, name)
+            new = _np.zeros((capacity,), dtype=old.dtype)
+            new[:self._size] = old[:self._size]
+            setattr(self, name, new)
+
+    def extend(self, labels: _Iterable[str],
+               totals: _Optional[_Iterable[float]] = None) -> _np.ndarray:
+
+        labels = _np.asarray(list(labels), dtype=self._labels.dtype)
+        n = len(labels)
+
+        start, stop = self._size, self._size + n
+        self._reserve(stop)
+
+        self._labels[start:stop] = labels
+        self._total[start:stop] = 0.0 if totals is None else list(totals)
+        self._done[start:stop] = 0.0
+        self._rate[start:stop] = 0.0
+        self._eta[start:stop] = _np.inf
+        self._last_done[start:stop] = 0.0
+        self._size = stop
+
+        if n:
+            self.invalidate()
+
+        return _np.arange(start, stop)
+
+    def add(self, label: str, total: float = 0.0) -> int:
+
+        return int(self.extend((label,), (total,))[0])
+
+    def _check(self, index: _Index) -> _np.ndarray:
+
+        index = _np.asarray(index, dtype=_np.intp)
+
+        if index.size and not ((0 <= index) & (index < self._size)).all():
+            raise IndexError("task index out of range")
+
+        return index
+
+    def set_total(self, index: _Index, total) -> None:
+
+        self._total[self._check(index)] = total
+        self._smooth()
+        self.invalidate()
+
+    def update(self, index: _Index, done) -> None:
+
+        self._done[self._check(index)] = done
+        self._smooth()
+        self.invalidate()
+
+    def advance(self, index: _Index, amount=1.0) -> None:
+
+        _np.add.at(self._done, self._check(index), amount)
+        self._smooth()
+        self.invalidate()
+
+    def scroll(self, delta: int) -> None:
+
+        offset = min(max(self._offset + delta, 0), max(self._size - 1, 0))
+        if offset == self._offset:
+            return
+
+        self._offset = offset
+        self.invalidate()
+
+    def _smooth(self) -> None:
+
+        now = self._time()
+        n = self._size
+        done = self._done[:n]
+        last_done = self._last_done[:n]
+        rate = self._rate[:n]
+
+        if self._last_time is None:
+            last_done[:] = done
+            self._last_time = now
+
+        elif now > self._last_time:
+
+            dt = now - self._last_time
+            alpha = (1.0 - _np.exp(-dt / self._smoothing)
+                     if self._smoothing else 1.0)
+
+            rate += alpha * (_np.maximum(done - last_done, 0.0) / dt - rate)
+            last_done[:] = done
+            self._last_time = now
+
+        remaining = _np.maximum(self._total[:n] - done, 0.0)
+
+        with _np.errstate(divide='ignore', invalid='ignore'):
+            eta = _np.where(rate > 0, remaining / rate, _np.inf)
+
+        eta[remaining <= 0] = 0.0
+        self._eta[:n] = eta
+
+    def render(self, cells: _np.ndarray) -> None:
+
+        rows, cols = cells.shape
+
+        self._offset = min(self._offset, max(self._size - rows, 0))
+        start = self._offset
+        stop = min(start + rows, self._size)
+        count = stop - start
+
+        view = cells[:count]
+        x = 0
+
+        def put(block: _np.ndarray) -> None:
+
+            nonlocal x
+
+            width = min(block.shape[1], cols - x)
+            if width > 0:
+                view[:, x:x + width] = block[:, :width]
+
+            x += block.shape[1]
+
+        label_width = min(self._label_width, cols // 3)
+        bar_width = cols - label_width - 17
+
+        if label_width:
+            put(_text_block(self._labels[start:stop], label_width))
+            put(_text_block(_np.full((count,), ' '), 1))
+
+        done = self._done[start:stop]
+        total = self._total[start:stop]
+
+        with _np.errstate(divide='ignore', invalid='ignore'):
+            fraction = _np.where(total > 0, _np.clip(done / total, 0, 1), 0)
+
+        if bar_width > 0:
+            eighths = (fraction * (bar_width * 8)).astype(_np.int64)
+            level = _np.clip(eighths[:, None] - 8 * _np.arange(bar_width), 0, 8)
+
+            put(_text_block(_np.full((count,), '['), 1))
+            put(_BAR[level])
+            put(_text_block(_np.full((count,), ']'), 1))
+
+        put(_text_block(_np.full((count,), ' '), 1))
+        put(_number_block(_np.floor(fraction * 100), 3))
+        put(_text_block(_np.full((count,), '% '), 2))
+
+        eta = self._eta[start:stop]
+        known = _np.isfinite(eta) & (eta < 100 * 3600)
+        seconds = _np.where(known, _np.ceil(eta), 0).astype(_np.int64)
+
+        eta_block = _np.empty((count, 8), dtype='=U1')
+        eta_block[:, 0:2] = _number_block(seconds // 3600, 2, fill='0')
+        eta_block[:, 3:5] = _number_block(seconds // 60 % 60, 2, fill='0')
+        eta_block[:, 6:8] = _number_block(seconds % 60, 2, fill='0')
+        eta_block[:, [2, 5]] = ':'
+        eta_block[~known] = _UNKNOWN_ETA
+        put(eta_block)
+
+        if x < cols:
+            view[:, x:] = ''
+
+        cells[count:] = ''
+
+        self._needs_refresh = False
+
+    def handle_event(self, event: _events.Event) -> bool:
+
+        if not isinstance(event, _events.VerticalNavEvent):
+
+            return False
+
+        self.scroll(event.y)
+
+        return True
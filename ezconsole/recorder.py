@@ -0,0 +1,496 @@
+#!/usr/bin/env python3
+
+from typing import (
+    BinaryIO as _BinaryIO,
+    Callable as _Callable,
+    Iterator as _Iterator,
+    List as _List,
+    Optional as _Optional,
+    Tuple as _Tuple,
+    Union as _Union,
+)
+
+import bisect as _bisect
+import struct as _struct
+import time as _time
+
+import numpy as _np
+
+from . import buffer as _buffer
+
+from ._numpy_buffer import write_line as _write_line
+from .abstract._console import _Console as _AbstractConsole
+from .buffer import Buffer as _Buffer
+from .console import Console as _Console
+
+
+MAGIC = b'EZREC2\n'
+
+_INDEX_MAGIC = b'EZIDX2\n'
+
+_KEY = b'K'
+_DELTA = b'D'
+_INDEX = b'I'
+
+_STYLED = 1
+
+_FRAME = _struct.Struct('<cdHHIB')
+_SPAN = _struct.Struct('<HHHI')
+_INDEX_HEAD = _struct.Struct('<cQ')
+_INDEX_ENTRY = _struct.Struct('<dQ')
+_INDEX_LINK = _struct.Struct('<QQ')
+
+_STYLE = _np.dtype('<u4')
+
+_SEARCH_BLOCK = 1 << 16
+
+_Span = _Tuple[int, int, _np.ndarray, _np.ndarray]
+_Frame = _Tuple[float, int, _List[str], _Optional[_np.ndarray]]
+
+
+def _diff_span(old: _np.ndarray, new: _np.ndarray, old_styles: _np.ndarray,
+               new_styles: _np.ndarray) -> _Tuple[int, int]:
+
+    changed = _np.flatnonzero((old != new) | (old_styles != new_styles))
+
+    if not len(changed):
+        return 0, 0
+
+    return int(changed[0]), int(changed[-1]) + 1
+
+
+def _resized(array: _np.ndarray, rows: int, cols: int) -> _np.ndarray:
+
+    if array.shape == (rows, cols):
+        return array
+
+    old_rows, old_cols = array.shape
+    rows_kept, cols_kept = min(rows, old_rows), min(cols, old_cols)
+
+    new_array = _np.zeros((rows, cols), dtype=array.dtype)
+    new_array[:rows_kept, :cols_kept] = array[:rows_kept, :cols_kept]
+    return new_array
+
+
+def _text(cells: _np.ndarray) -> str:
+
+    n = len(cells)
+    if not n:
+        return ''
+
+    return str(_np.ascontiguousarray(cells).view(f'=U{n}')[0])
+
+
+class Recorder:
+
+    def __init__(self, stream: _BinaryIO, *, keyframe_interval: int = 256,
+                 index_interval: int = 16,
+                 time: _Callable[[], float] = _time.monotonic) -> None:
+
+        if keyframe_interval < 1:
+            raise ValueError("keyframe_interval must be positive")
+
+        if index_interval < 1:
+            raise ValueError("index_interval must be positive")
+
+        self._stream = stream
+        self._interval = keyframe_interval
+        self._index_interval = index_interval
+        self._time = time
+        self._start = time()
+
+        self._console = None
+        self._cells = _np.zeros((0, 0), dtype='=U1')
+        self._styles = _np.zeros((0, 0), dtype=_np.uint32)
+        self._styled = False
+        self._deltas = keyframe_interval
+        self._index = []
+        self._last_index = 0
+
+        stream.write(MAGIC)
+        self._offset = len(MAGIC)
+
+    def attach(self, console: _Console) -> None:
+
+        if console.recorder is not None:
+            raise ValueError("console is already being recorded")
+
+        if self._stream is None:
+            raise ValueError("recorder has been closed")
+
+        console.recorder = self
+        self._console = console
+        self._deltas = self._interval
+
+    def detach(self) -> None:
+
+        console, self._console = self._console, None
+
+        if console is not None and console.recorder is self:
+            console.recorder = None
+
+    def close(self) -> None:
+
+        self.detach()
+
+        if self._stream is None:
+            return
+
+        self._write_index()
+        self._stream = None
+
+    def record(self, cells: _Buffer, prev: _Buffer) -> None:
+
+        if self._stream is None:
+            return
+
+        now = self._time() - self._start
+        rows, cols = cells.shape
+
+        if self._deltas >= self._interval:
+
+            self._cells = _np.zeros((rows, cols), dtype='=U1')
+            self._styles = _np.zeros((rows, cols), dtype=_np.uint32)
+
+            for y in range(rows):
+                self._load_row(cells, y, self._cells[y], self._styles[y])
+
+            if len(self._index) >= self._index_interval:
+                self._write_index()
+
+            self._index.append((now, self._offset))
+            self._deltas = 0
+            self._write(_KEY, now, rows, cols,
+                        [(y, 0, self._cells[y], self._styles[y])
+                         for y in range(rows)])
+            return
+
+        self._cells = _resized(self._cells, rows, cols)
+        self._styles = _resized(self._styles, rows, cols)
+
+        ys = {y for y, _, _ in cells.diff(prev)}
+        ys.update(range(prev.shape[0], rows))
+
+        row = _np.zeros(cols, dtype='=U1')
+        styles = _np.zeros(cols, dtype=_np.uint32)
+        spans = []
+
+        for y in sorted(ys):
+
+            self._load_row(cells, y, row, styles)
+
+            start, stop = _diff_span(self._cells[y], row, self._styles[y],
+                                     styles)
+            if start == stop:
+                continue
+
+            self._cells[y, start:stop] = row[start:stop]
+            self._styles[y, start:stop] = styles[start:stop]
+            spans.append((y, start, self._cells[y, start:stop],
+                          self._styles[y, start:stop]))
+
+        self._deltas += 1
+        self._write(_DELTA, now, rows, cols, spans)
+
+    def _load_row(self, cells: _Buffer, y: int, row: _np.ndarray,
+                  styles: _np.ndarray) -> None:
+
+        _write_line(row[None], 0, cells.get_line(y))
+
+        line_styles = cells.get_styles(y)
+
+        if line_styles is None:
+            styles[:] = 0
+
+        else:
+            styles[:] = line_styles
+            self._styled = True
+
+    def _write(self, kind: bytes, now: float, rows: int, cols: int,
+               spans: _List[_Span]) -> None:
+
+        styled = self._styled
+        parts = [_FRAME.pack(kind, now, rows, cols, len(spans),
+                             _STYLED if styled else 0)]
+
+        for y, x, cells, styles in spans:
+
+            data = _text(cells).encode('utf-8')
+            parts.append(_SPAN.pack(y, x, len(cells), len(data)))
+            parts.append(data)
+
+            if styled:
+                parts.append(styles.astype(_STYLE).tobytes())
+
+        self._append(b''.join(parts))
+
+    def _write_index(self) -> None:
+
+        parts = [_INDEX_HEAD.pack(_INDEX, len(self._index))]
+        parts.extend(_INDEX_ENTRY.pack(*entry) for entry in self._index)
+        parts.append(_INDEX_LINK.pack(self._last_index, self._offset))
+        parts.append(_INDEX_MAGIC)
+
+        self._last_index = self._offset
+        self._index.clear()
+
+        self._append(b''.join(parts))
+        self._stream.flush()
+
+    def _append(self, record: bytes) -> None:
+
+        self._stream.write(record)
+        self._offset += len(record)
+
+
+class Player:
+
+    def __init__(self, stream: _BinaryIO) -> None:
+
+        self._stream = stream
+
+        stream.seek(0)
+        if stream.read(len(MAGIC)) != MAGIC:
+            raise ValueError("not an ezconsole recording")
+
+        self._index = self._read_index()
+        self._times = [time for time, _ in self._index]
+
+    def _read_index(self) -> _List[_Tuple[float, int]]:
+
+        found = self._find_index(self._stream.seek(0, 2))
+        offset, resume = found if found is not None else (0, len(MAGIC))
+        chunks = []
+
+        while offset:
+            entries, offset = self._index_chunk(offset)
+            chunks.append(entries)
+
+        index = [entry for entries in reversed(chunks) for entry in entries]
+        index.extend((time, offset)
+                     for offset, kind, time, *_ in self._records(resume)
+                     if kind == _KEY)
+
+        return index
+
+    def _find_index(self, end: int) -> _Optional[_Tuple[int, int]]:
+
+        stream = self._stream
+        stop = end
+        tail = b''
+
+        while stop > len(MAGIC):
+
+            start = max(stop - _SEARCH_BLOCK, len(MAGIC))
+            stream.seek(start)
+            data = stream.read(stop - start) + tail
+            position = len(data)
+
+            while True:
+
+                position = data.rfind(_INDEX_MAGIC, 0,
+                                      position + len(_INDEX_MAGIC) - 1)
+                if position < 0:
+                    break
+
+                offset = self._index_at(start + position)
+                if offset is not None:
+                    return offset, start + position + len(_INDEX_MAGIC)
+
+            tail = data[:len(_INDEX_MAGIC) - 1]
+            stop = start
+
+        return None
+
+    def _index_at(self, position: int) -> _Optional[int]:
+
+        stream = self._stream
+        link = position - _INDEX_LINK.size
+
+        if link < len(MAGIC) + _INDEX_HEAD.size:
+            return None
+
+        stream.seek(link)
+        _, offset = _INDEX_LINK.unpack(stream.read(_INDEX_LINK.size))
+
+        if not len(MAGIC) <= offset <= link - _INDEX_HEAD.size:
+            return None
+
+        stream.seek(offset)
+        kind, count = _INDEX_HEAD.unpack(stream.read(_INDEX_HEAD.size))
+
+        if (kind != _INDEX or
+                offset + _INDEX_HEAD.size + count * _INDEX_ENTRY.size != link):
+            return None
+
+        return offset
+
+    def _index_chunk(self, offset: int) -> _Tuple[_List[_Tuple[float, int]],
+                                                   int]:
+
+        stream = self._stream
+        stream.seek(offset)
+
+        _, count = _INDEX_HEAD.unpack(stream.read(_INDEX_HEAD.size))
+        entries = list(_INDEX_ENTRY.iter_unpack(
+            stream.read(count * _INDEX_ENTRY.size)
+        ))
+        previous, _ = _INDEX_LINK.unpack(stream.read(_INDEX_LINK.size))
+
+        return entries, previous
+
+    def _records(self, offset: int) -> _Iterator[_Tuple[int, bytes, float,
+                                                        int, int, bool,
+                                                        list]]:
+
+        stream = self._stream
+        stream.seek(offset)
+
+        while True:
+
+            head = stream.read(_FRAME.size)
+
+            if head[:1] == _INDEX and len(head) >= _INDEX_HEAD.size:
+                _, count = _INDEX_HEAD.unpack(head[:_INDEX_HEAD.size])
+                offset += (_INDEX_HEAD.size + count * _INDEX_ENTRY.size +
+                           _INDEX_LINK.size + len(_INDEX_MAGIC))
+                stream.seek(offset)
+                continue
+
+            if len(head) < _FRAME.size or head[:1] not in (_KEY, _DELTA):
+                return
+
+            kind, time, rows, cols, count, flags = _FRAME.unpack(head)
+            styled = bool(flags & _STYLED)
+            spans = []
+
+            for _ in range(count):
+
+                head = stream.read(_SPAN.size)
+                if len(head) < _SPAN.size:
+                    return
+
+                y, x, n, size = _SPAN.unpack(head)
+                data = stream.read(size)
+                if len(data) < size:
+                    return
+
+                styles = None
+
+                if styled:
+                    styles = stream.read(n * _STYLE.itemsize)
+                    if len(styles) < n * _STYLE.itemsize:
+                        return
+
+                    styles = _np.frombuffer(styles, dtype=_STYLE)
+
+                spans.append((y, x, n, data.decode('utf-8'), styles))
+
+            position = stream.tell()
+            yield offset, kind, time, rows, cols, styled, spans
+            offset = position
+            stream.seek(position)
+
+    def _replay(self, offset: int, until: _Optional[float] = None
+                ) -> _Iterator[_Tuple[float, int, _np.ndarray,
+                                      _Optional[_np.ndarray]]]:
+
+        cells = _np.zeros((0, 0), dtype='=U1')
+        styles = _np.zeros((0, 0), dtype=_np.uint32)
+        first = True
+
+        for _, kind, time, rows, cols, styled, spans in self._records(offset):
+
+            if until is not None and time > until and not first:
+                return
+
+            first = False
+
+            if kind == _KEY:
+                cells = _np.zeros((rows, cols), dtype='=U1')
+                styles = _np.zeros((rows, cols), dtype=_np.uint32)
+
+            else:
+                cells = _resized(cells, rows, cols)
+                styles = _resized(styles, rows, cols)
+
+            for y, x, n, text, span_styles in spans:
+                _write_line(cells[y:y + 1, x:x + n], 0, text)
+
+                if span_styles is not None:
+                    styles[y, x:x + n] = span_styles
+
+            yield time, cols, cells, styles if styled else None
+
+    @staticmethod
+    def _frame(time: float, cols: int, cells: _np.ndarray,
+               styles: _Optional[_np.ndarray]) -> _Frame:
+
+        rows = cells.shape[0]
+        lines = [_text(cells[y]) for y in range(rows)]
+
+        return (time, cols, lines,
+                styles.copy() if styles is not None else None)
+
+    def keyframes(self) -> _List[float]:
+
+        return list(self._times)
+
+    def frames(self, start: float = 0.0) -> _Iterator[_Frame]:
+
+        if not self._index:
+            return
+
+        i = max(_bisect.bisect_right(self._times, start) - 1, 0)
+
+        for frame in self._replay(self._index[i][1]):
+
+            if frame[0] >= start:
+                yield self._frame(*frame)
+
+    def seek(self, time: float) -> _Frame:
+
+        i = _bisect.bisect_right(self._times, time) - 1
+        if i < 0:
+            raise ValueError("no frame recorded at or before this time")
+
+        for frame in self._replay(self._index[i][1], time):
+            pass
+
+        return self._frame(*frame)
+
+    def replay(self, console: _Union[_Console, _AbstractConsole], *,
+               speed: float = 1.0, start: float = 0.0,
+               sleep: _Callable[[float], None] = _time.sleep,
+               clock: _Callable[[], float] = _time.monotonic) -> int:
+
+        if speed <= 0:
+            raise ValueError("speed must be positive")
+
+        if isinstance(console, _AbstractConsole):
+            console = _Console(backend=console)
+
+        count = 0
+        origin = None
+
+        for time, cols, lines, styles in self.frames(start):
+
+            if origin is None:
+                origin = clock() - time / speed
+
+            delay = origin + time / speed - clock()
+            if delay > 0:
+                sleep(delay)
+
+            console.resize_buffer(len(lines), cols,
+                                  require_ndarray=styles is not None)
+            _buffer.write_lines(console.get_buffer(), lines)
+
+            if styles is not None:
+                console.get_style_buffer()[:] = styles
+
+            console.flush()
+
+            count += 1
+
+        return count
@@ -0,0 +1,490 @@
+#!/usr/bin/env python3
+
+from typing import (
+    Callable as _Callable,
+    Dict as _Dict,
+    List as _List,
+    Optional as _Optional,
+    Tuple as _Tuple,
+)
+
+import asyncio as _asyncio
+import logging as _logging
+import os as _os
+
+from functools import partial as _partial
+
+import numpy as _np
+
+from . import events as _events
+
+from .abstract._vtinput import (
+    ESCAPE_TIMEOUT as _ESCAPE_TIMEOUT,
+    VTInputParser as _VTInputParser,
+)
+from .abstract.stream import StreamConsole as _StreamConsole
+
+from .console import Console as _Console
+
+from ._frames import _FrameRoot
+from .elements import (
+    _Element,
+    _registry,
+)
+
+
+_log = _logging.getLogger(__name__)
+
+_IAC = 255
+_SB = 250
+_SE = 240
+_NEGOTIATION = frozenset((251, 252, 253, 254))
+_NAWS = 31
+
+_Shape = _Tuple[int, int]
+
+_InputTarget = _Callable[['_Session'], _Optional[_Element]]
+
+_TELNET_GREETING = bytes((
+    _IAC, 253, _NAWS,
+    _IAC, 251, 1,
+    _IAC, 251, 3,
+))
+
+
+def _area(shape: _Shape) -> int:
+
+    return shape[0] * shape[1]
+
+
+def _nearest(shape: _Shape, shapes: _List[_Shape]) -> _Shape:
+
+    rows, cols = shape
+    covering = [other for other in shapes
+                if other[0] >= rows and other[1] >= cols]
+
+    if covering:
+        return min(covering, key=_area)
+
+    return max(shapes, key=_area)
+
+
+class _TelnetFilter:
+
+    def __init__(self) -> None:
+
+        self._pending = b''
+
+    def feed(self, data: bytes) -> _Tuple[bytes, _Optional[_Tuple[int, int]]]:
+
+        data = self._pending + data
+        self._pending = b''
+
+        out = bytearray()
+        size = None
+        n = len(data)
+        i = 0
+
+        while i < n:
+
+            start = data.find(_IAC, i)
+            if start < 0:
+                out += data[i:]
+                break
+
+            out += data[i:start]
+            i = start
+
+            if i + 1 == n:
+                self._pending = data[i:]
+                break
+
+            command = data[i + 1]
+
+            if command == _IAC:
+                out.append(_IAC)
+                i += 2
+
+            elif command in _NEGOTIATION:
+                if i + 2 >= n:
+                    self._pending = data[i:]
+                    break
+                i += 3
+
+            elif command == _SB:
+                end = data.find(bytes((_IAC, _SE)), i + 2)
+                if end < 0:
+                    self._pending = data[i:]
+                    break
+
+                option = data[i + 2:end].replace(b'\xff\xff', b'\xff')
+                if option[:1] == bytes((_NAWS,)) and len(option) >= 5:
+                    size = (option[3] << 8 | option[4],
+                            option[1] << 8 | option[2])
+
+                i = end + 2
+
+            else:
+                i += 2
+
+        return bytes(out), size
+
+
+class _Session(_asyncio.Protocol):
+
+    def __init__(self, server: 'Server', telnet: bool = True) -> None:
+
+        self._server = server
+        self._telnet = _TelnetFilter() if telnet else None
+        self._parser = _VTInputParser()
+        self._escape_handle = None
+
+        self.transport = None
+        self.backend = None
+        self.console = None
+        self.target = None
+        self.shape = 0, 0
+        self.paused = False
+        self.behind = False
+
+    def connection_made(self, transport: _asyncio.BaseTransport) -> None:
+
+        self.transport = transport
+        transport.set_write_buffer_limits(high=self._server.high_water)
+
+        if self._telnet is not None:
+            transport.write(_TELNET_GREETING)
+
+        self.backend = _StreamConsole(transport.write, term=self._server.term)
+        self.console = _Console('numpy', backend=self.backend)
+        self.console.register_event_handler(
+            _partial(self._server._event_callback, self)
+        )
+
+        self.shape = self.backend.get_height(), self.backend.get_width()
+        self._server._attach(self)
+
+    def data_received(self, data: bytes) -> None:
+
+        if self._telnet is not None:
+            data, size = self._telnet.feed(data)
+
+            if size is not None and all(size):
+                self.resize(*size)
+
+        self._cancel_escape()
+
+        for event in self._parser.feed(data):
+            self.backend.dispatch(event)
+
+        if self._parser.has_escape():
+            self._escape_handle = self._server._loop.call_later(
+                _ESCAPE_TIMEOUT, self._on_escape_timeout
+            )
+
+    def _cancel_escape(self) -> None:
+
+        handle, self._escape_handle = self._escape_handle, None
+
+        if handle is not None:
+            handle.cancel()
+
+    def _on_escape_timeout(self) -> None:
+
+        self._escape_handle = None
+
+        for event in self._parser.flush():
+            if self.backend is not None:
+                self.backend.dispatch(event)
+
+    def resize(self, rows: int, cols: int) -> None:
+
+        if (rows, cols) == self.shape:
+            return
+
+        self.backend.set_size(rows, cols)
+        self.shape = rows, cols
+        self._server._mark_stale(self)
+
+    def pause_writing(self) -> None:
+
+        self.paused = True
+
+    def resume_writing(self) -> None:
+
+        self.paused = False
+
+        if self.behind:
+            self._server._mark_stale(self)
+
+    def present(self, view: _np.ndarray) -> None:
+
+        if self.paused:
+            self.behind = True
+            return
+
+        self.behind = False
+
+        console = self.console
+        console.resize_buffer(*view.shape)
+        console.get_buffer()[...] = view
+        console.flush()
+
+    def close(self) -> None:
+
+        self._cancel_escape()
+
+        console, self.console = self.console, None
+
+        if console is not None:
+            console.close()
+
+        if self.transport is not None:
+            self.transport.close()
+
+    def connection_lost(self, exc: _Optional[Exception]) -> None:
+
+        self._server._detach(self)
+        self._cancel_escape()
+        self.console = None
+
+
+class _PtyWriter(_asyncio.Protocol):
+
+    def __init__(self, session: _Session) -> None:
+
+        self._session = session
+
+    def pause_writing(self) -> None:
+
+        self._session.pause_writing()
+
+    def resume_writing(self) -> None:
+
+        self._session.resume_writing()
+
+    def connection_lost(self, exc: _Optional[Exception]) -> None:
+
+        self._session.transport = None
+
+
+class _PtySession(_Session):
+
+    def __init__(self, server: 'Server', master: int, slave: int) -> None:
+
+        super().__init__(server, telnet=False)
+
+        self._master = master
+        self._slave = slave
+        self._reader = None
+
+    def connection_made(self, transport: _asyncio.BaseTransport) -> None:
+
+        self._reader = transport
+
+    def attach_writer(self, transport: _asyncio.BaseTransport) -> None:
+
+        super().connection_made(transport)
+        self.poll_size()
+
+    def poll_size(self) -> None:
+
+        try:
+            size = _os.get_terminal_size(self._master)
+
+        except OSError:
+            return
+
+        if size.lines and size.columns:
+            self.resize(size.lines, size.columns)
+
+    def close(self) -> None:
+
+        super().close()
+
+        reader, self._reader = self._reader, None
+        if reader is not None:
+            reader.close()
+
+        slave, self._slave = self._slave, None
+        if slave is not None:
+            _os.close(slave)
+
+
+class Server(_FrameRoot):
+
+    def __init__(self, element: _Element, *, frame_rate: float = 30.0,
+                 term: str = 'xterm-256color', high_water: int = 1 << 16,
+                 max_shapes: int = 4,
+                 input_target: _Optional[_InputTarget] = None,
+                 loop: _Optional[_asyncio.AbstractEventLoop] = None,
+                 **kwargs) -> None:
+
+        if max_shapes < 1:
+            raise ValueError("max_shapes must be positive")
+
+        super().__init__(frame_rate=frame_rate, loop=loop, **kwargs)
+
+        self.element = element
+        self.term = term
+        self.high_water = high_water
+        self.max_shapes = max_shapes
+
+        self._input_target = input_target
+
+        self._sessions = []
+        self._stale = set()
+        self._views = {}
+        self._servers = []
+
+        _registry.add_root(self)
+
+        self.element.parent = self
+        self.invalidate_child(self.element)
+
+    def get_sessions(self) -> _List[_Session]:
+
+        return list(self._sessions)
+
+    async def serve_tcp(self, host: _Optional[str] = None,
+                        port: int = 0) -> _asyncio.AbstractServer:
+
+        server = await self._loop.create_server(
+            lambda: _Session(self), host, port
+        )
+        self._servers.append(server)
+        return server
+
+    async def serve_unix(self, path: str) -> _asyncio.AbstractServer:
+
+        server = await self._loop.create_unix_server(
+            lambda: _Session(self), path
+        )
+        self._servers.append(server)
+        return server
+
+    async def open_pty(self) -> str:
+
+        import pty
+
+        master, slave = pty.openpty()
+        name = _os.ttyname(slave)
+
+        session = _PtySession(self, master, slave)
+
+        await self._loop.connect_read_pipe(
+            lambda: session, open(master, 'rb', buffering=0)
+        )
+        transport, _ = await self._loop.connect_write_pipe(
+            lambda: _PtyWriter(session), open(_os.dup(master), 'wb',
+                                              buffering=0)
+        )
+
+        session.attach_writer(transport)
+        return name
+
+    def close(self) -> None:
+
+        servers, self._servers = self._servers, []
+        for server in servers:
+            server.close()
+
+        for session in list(self._sessions):
+            session.close()
+
+        if self._frame_handle is not None:
+            self._frame_handle.cancel()
+            self._frame_handle = None
+
+    def _attach(self, session: _Session) -> None:
+
+        session.target = (self.element if self._input_target is None else
+                          self._input_target(session))
+
+        self._sessions.append(session)
+        self._mark_stale(session)
+
+    def _detach(self, session: _Session) -> None:
+
+        try:
+            self._sessions.remove(session)
+
+        except ValueError:
+            pass
+
+        self._stale.discard(session)
+
+    def _mark_stale(self, session: _Session) -> None:
+
+        self._stale.add(session)
+        self._schedule_refresh()
+
+    # noinspection PyBroadException
+    def _refresh(self) -> None:
+
+        self._frame_handle = None
+
+        for session in self._sessions:
+            if isinstance(session, _PtySession):
+                session.poll_size()
+
+        dirty = bool(_registry.collect(self))
+        _registry.finish()
+
+        if not dirty and not self._stale:
+            return
+
+        self._next_frame = self._loop.time() + self._frame_interval
+
+        groups: _Dict[_Shape, _List[_Session]] = {}
+        for session in self._sessions:
+            groups.setdefault(session.shape, []).append(session)
+
+        shapes = sorted(groups, key=lambda shape: len(groups[shape]),
+                        reverse=True)
+
+        for shape in shapes[self.max_shapes:]:
+            nearest = _nearest(shape, shapes[:self.max_shapes])
+            groups[nearest].extend(groups.pop(shape))
+
+        views = {}
+
+        for shape, sessions in groups.items():
+
+            view = self._views.get(shape)
+            fresh = view is None
+
+            if fresh:
+                view = _np.zeros(shape, dtype='=U1')
+
+            if dirty or fresh:
+                self.element.draw(view)
+
+            views[shape] = view
+
+            for session in sessions:
+
+                if not (dirty or fresh or session in self._stale):
+                    continue
+
+                rows, cols = session.shape
+
+                try:
+                    session.present(view[:rows, :cols])
+
+                except Exception:
+                    _log.exception("unable to present frame to %r", session)
+                    session.close()
+
+        self._views = views
+        self._stale.clear()
+
+    def _event_callback(self, session: _Session,
+                        event: _events.Event) -> None:
+
+        if isinstance(event, _events.QuitEvent):
+            session.close()
+            return
+
+        if session.target is not None:
+            session.target.handle_event(event)
@@ -0,0 +1,48 @@
+#!/usr/bin/env python3
+
+from typing import (
+    Optional as _Optional,
+    Tuple as _Tuple,
+)
+
+
+DEFAULT = 0
+
+BOLD = 1 << 18
+DIM = 1 << 19
+ITALIC = 1 << 20
+UNDERLINE = 1 << 21
+BLINK = 1 << 22
+REVERSE = 1 << 23
+
+FLAGS = BOLD | DIM | ITALIC | UNDERLINE | BLINK | REVERSE
+
+BG_SHIFT = 9
+COLOR_MASK = 0x1ff
+
+
+def style(fg: _Optional[int] = None, bg: _Optional[int] = None,
+          flags: int = 0) -> int:
+
+    if fg is not None and not 0 <= fg < 256:
+        raise ValueError("fg must be a colour index between 0 and 255")
+
+    if bg is not None and not 0 <= bg < 256:
+        raise ValueError("bg must be a colour index between 0 and 255")
+
+    if flags & ~FLAGS:
+        raise ValueError("unknown style flags")
+
+    return ((0 if fg is None else fg + 1) |
+            (0 if bg is None else bg + 1) << BG_SHIFT |
+            flags)
+
+
+def unpack(word: int) -> _Tuple[_Optional[int], _Optional[int], int]:
+
+    fg = (word & COLOR_MASK) - 1
+    bg = (word >> BG_SHIFT & COLOR_MASK) - 1
+
+    return (None if fg < 0 else fg,
+            None if bg < 0 else bg,
+            word & FLAGS)
@@ -0,0 +1,213 @@
+#!/usr/bin/env python3
+
+from typing import (
+    List as _List,
+    Optional as _Optional,
+    Sequence as _Sequence,
+)
+
+import numpy as _np
+
+from . import events as _events
+
+from ._cells import text_block as _text_block
+
+from .elements import _Element
+
+
+def _format_column(values: _np.ndarray) -> _np.ndarray:
+
+    kind = values.dtype.kind
+
+    if kind == 'f' or kind == 'c':
+        return _np.char.mod('%.6g', values)
+
+    if kind == 'U':
+        return values
+
+    if kind == 'S':
+        return _np.char.decode(values, 'utf-8', 'replace')
+
+    return values.astype(str)
+
+
+class Table(_Element):
+
+    def __init__(self, data: _np.ndarray, *,
+                 headers: _Optional[_Sequence[str]] = None,
+                 height: int = 20, sample: int = 1000,
+                 max_column_width: int = 40, separator: str = '│',
+                 **kwargs) -> None:
+
+        if sample <= 0:
+            raise ValueError("sample must be positive")
+
+        if max_column_width <= 0:
+            raise ValueError("max_column_width must be positive")
+
+        super().__init__(**kwargs)
+
+        self._sample = sample
+        self._max_column_width = max_column_width
+        self._separator = separator[:1]
+        self._height = height
+
+        self._columns = []
+        self._headers = []
+        self._widths = _np.zeros((0,), dtype=_np.intp)
+        self._right = _np.zeros((0,), dtype=bool)
+        self._rows = 0
+
+        self._row_offset = 0
+        self._column_offset = 0
+
+        self.set_data(data, headers=headers)
+
+    def set_data(self, data: _np.ndarray, *,
+                 headers: _Optional[_Sequence[str]] = None) -> None:
+
+        data = _np.asanyarray(data)
+
+        if data.dtype.names is not None:
+
+            if data.ndim != 1:
+                raise ValueError("structured data must be one-dimensional")
+
+            columns = [data[name] for name in data.dtype.names]
+            default_headers = list(data.dtype.names)
+
+        elif data.ndim == 2:
+
+            columns = [data[:, j] for j in range(data.shape[1])]
+            default_headers = [str(j) for j in range(data.shape[1])]
+
+        else:
+            raise ValueError("data must be two-dimensional or structured")
+
+        if headers is None:
+            headers = default_headers
+
+        elif len(headers) != len(columns):
+            raise ValueError("headers do not match the number of columns")
+
+        self._columns = columns
+        self._headers = [str(header) for header in headers]
+        self._rows = len(data)
+        self._right = _np.array([column.dtype.kind in 'biufc'
+                                 for column in columns], dtype=bool)
+        self._widths = self._sample_widths()
+
+        self._row_offset = min(self._row_offset, max(self._rows - 1, 0))
+        self._column_offset = min(self._column_offset,
+                                  max(len(columns) - 1, 0))
+
+        cols = int(self._widths.sum()) + max(len(columns) - 1, 0)
+        self._min = 2, 1
+        self._def = min(self._rows + 1, self._height), cols
+
+        self.invalidate()
+
+    def _sample_widths(self) -> _np.ndarray:
+
+        n = self._rows
+
+        if n > self._sample:
+            rows = _np.unique(_np.linspace(0, n - 1, self._sample,
+                                           dtype=_np.intp))
+        else:
+            rows = slice(None)
+
+        widths = _np.array([
+            max(len(header), int(_np.char.str_len(
+                _format_column(column[rows])).max(initial=0)))
+            for header, column in zip(self._headers, self._columns)
+        ], dtype=_np.intp)
+
+        return _np.clip(widths, 1, self._max_column_width)
+
+    def get_widths(self) -> _List[int]:
+
+        return self._widths.tolist()
+
+    def scroll(self, rows: int = 0, columns: int = 0) -> None:
+
+        row_offset = min(max(self._row_offset + rows, 0),
+                         max(self._rows - 1, 0))
+        column_offset = min(max(self._column_offset + columns, 0),
+                            max(len(self._columns) - 1, 0))
+
+        if (row_offset, column_offset) == (self._row_offset,
+                                           self._column_offset):
+            return
+
+        self._row_offset = row_offset
+        self._column_offset = column_offset
+        self.invalidate()
+
+    def render(self, cells: _np.ndarray) -> None:
+
+        rows, cols = cells.shape
+
+        if not rows:
+            self._needs_refresh = False
+            return
+
+        body_rows = rows - 1
+        self._row_offset = min(self._row_offset,
+                               max(self._rows - body_rows, 0))
+        start = self._row_offset
+        stop = min(start + body_rows, self._rows)
+        count = stop - start
+
+        header = cells[0]
+        body = cells[1:1 + count]
+
+        x = 0
+        for j in range(self._column_offset, len(self._columns)):
+
+            if x >= cols:
+                break
+
+            if x:
+                header[x] = self._separator
+                body[:, x] = self._separator
+                x += 1
+
+                if x >= cols:
+                    break
+
+            width = int(self._widths[j])
+            visible = min(width, cols - x)
+
+            title = self._headers[j]
+            title = title.rjust(width) if self._right[j] else title
+            header[x:x + visible] = _text_block([title], width)[0, :visible]
+
+            if count > 0:
+
+                texts = _format_column(self._columns[j][start:stop])
+                if self._right[j]:
+                    texts = _np.char.rjust(texts, width)
+
+                body[:, x:x + visible] = _text_block(texts,
+                                                     width)[:, :visible]
+
+            x += width
+
+        if x < cols:
+            header[x:] = ''
+            body[:, x:] = ''
+
+        cells[1 + count:] = ''
+
+        self._needs_refresh = False
+
+    def handle_event(self, event: _events.Event) -> bool:
+
+        if not isinstance(event, _events.NavigateEvent):
+
+            return False
+
+        self.scroll(event.y, event.x)
+
+        return True
@@ -0,0 +1,448 @@
+#!/usr/bin/env python3
+
+from typing import (
+    TYPE_CHECKING as _TYPE_CHECKING,
+    Tuple as _Tuple,
+)
+
+import array as _array
+
+from . import buffer as _buffer
+from . import events as _events
+
+from .elements import _Element
+
+if _TYPE_CHECKING:
+    import numpy as _np
+
+
+_TYPECODE = 'w' if 'w' in _array.typecodes else 'u'
+
+
+class _GapBuffer:
+
+    def __init__(self, text: str = '', gap: int = 64) -> None:
+
+        self._data = _array.array(_TYPECODE, text + '\0' * gap)
+        self._start = len(text)
+        self._end = len(self._data)
+
+    def __len__(self) -> int:
+
+        return len(self._data) - (self._end - self._start)
+
+    def _move(self, pos: int) -> None:
+
+        start, end = self._start, self._end
+
+        if pos < start:
+            n = start - pos
+            self._data[end - n:end] = self._data[pos:start]
+
+        elif pos > start:
+            n = pos - start
+            self._data[start:pos] = self._data[end:end + n]
+
+        else:
+            return
+
+        self._start = pos
+        self._end = end + pos - start
+
+    def _reserve(self, n: int) -> None:
+
+        gap = self._end - self._start
+        if gap >= n:
+            return
+
+        grow = max(n - gap, len(self._data))
+        self._data[self._end:self._end] = _array.array(_TYPECODE,
+                                                       '\0' * grow)
+        self._end += grow
+
+    def insert(self, pos: int, text: str) -> None:
+
+        n = len(text)
+
+        self._move(pos)
+        self._reserve(n)
+
+        self._data[self._start:self._start + n] = _array.array(_TYPECODE,
+                                                               text)
+        self._start += n
+
+    def delete(self, pos: int, n: int) -> None:
+
+        self._move(pos)
+        self._end += max(min(n, len(self) - pos), 0)
+
+    def slice(self, start: int, stop: int) -> str:
+
+        gap_start, gap_end = self._start, self._end
+        gap = gap_end - gap_start
+        parts = []
+
+        if start < gap_start:
+            parts.append(self._data[start:min(stop, gap_start)].tounicode())
+
+        if stop > gap_start:
+            parts.append(self._data[max(start, gap_start) + gap:
+                                    stop + gap].tounicode())
+
+        return ''.join(parts)
+
+    def text(self) -> str:
+
+        return self.slice(0, len(self))
+
+
+def _scroll(offset: int, cursor: int, size: int) -> int:
+
+    if cursor < offset:
+        return cursor
+
+    if cursor >= offset + size:
+        return cursor - size + 1
+
+    return offset
+
+
+def _with_cursor(text: str, x: int, cursor: str) -> str:
+
+    return text[:x].ljust(x) + cursor + text[x + 1:]
+
+
+class TextInput(_Element):
+
+    def __init__(self, value: str = '', *, width: int = 20,
+                 cursor: str = '█', **kwargs) -> None:
+
+        super().__init__(**kwargs)
+
+        self._text = _GapBuffer(value)
+        self._cursor = len(value)
+        self._offset = 0
+        self._cursor_char = cursor
+
+        self._min = 1, 1
+        self._def = 1, width
+
+    @property
+    def value(self) -> str:
+
+        return self._text.text()
+
+    @value.setter
+    def value(self, value: str) -> None:
+
+        self._text = _GapBuffer(value)
+        self._cursor = len(value)
+        self._offset = 0
+        self.invalidate()
+
+    def get_cursor(self) -> int:
+
+        return self._cursor
+
+    def accepts_array_buffer(self) -> bool:
+
+        return True
+
+    def _insert(self, text: str) -> None:
+
+        text = text.replace('\r\n', ' ').replace('\r', ' ').replace('\n', ' ')
+
+        self._text.insert(self._cursor, text)
+        self._cursor += len(text)
+
+    def handle_event(self, event: _events.Event) -> bool:
+
+        length = len(self._text)
+
+        if isinstance(event, _events.PasteEvent):
+            self._insert(event.text)
+
+        elif isinstance(event, _events.HorizontalNavEvent):
+            self._cursor = min(max(self._cursor + event.x, 0), length)
+
+        elif not isinstance(event, _events.KeyEvent):
+            return False
+
+        elif event.text:
+            self._insert(event.text)
+
+        elif event.key == 'backspace':
+            if not self._cursor:
+                return True
+            self._cursor -= 1
+            self._text.delete(self._cursor, 1)
+
+        elif event.key == 'delete':
+            self._text.delete(self._cursor, 1)
+
+        elif event.key == 'home':
+            self._cursor = 0
+
+        elif event.key == 'end':
+            self._cursor = length
+
+        else:
+            return False
+
+        self.invalidate()
+        return True
+
+    def render(self, cells: '_np.ndarray') -> None:
+
+        rows, cols = cells.shape
+
+        if rows and cols:
+
+            self._offset = _scroll(self._offset, self._cursor, cols)
+
+            start = self._offset
+            visible = self._text.slice(start, min(start + cols,
+                                                  len(self._text)))
+
+            _buffer.write_line(cells, 0, _with_cursor(
+                visible, self._cursor - start, self._cursor_char
+            ))
+
+            if not self._retained:
+                cells[1:] = ''
+
+        self._needs_refresh = False
+
+
+class TextArea(_Element):
+
+    def __init__(self, value: str = '', *, rows: int = 5, width: int = 40,
+                 cursor: str = '█', **kwargs) -> None:
+
+        super().__init__(**kwargs)
+
+        self._cursor_char = cursor
+        self._reset(value)
+
+        self._min = 1, 1
+        self._def = rows, width
+
+    def _reset(self, value: str) -> None:
+
+        self._lines = value.split('\n')
+        self._row = 0
+        self._col = 0
+        self._active = _GapBuffer(self._lines[0])
+
+        self._top = 0
+        self._offset = 0
+        self._layout = None
+        self._dirty_rows = set()
+
+    @property
+    def value(self) -> str:
+
+        self._lines[self._row] = self._active.text()
+        return '\n'.join(self._lines)
+
+    @value.setter
+    def value(self, value: str) -> None:
+
+        self._reset(value)
+        self.invalidate()
+
+    def get_cursor(self) -> _Tuple[int, int]:
+
+        return self._row, self._col
+
+    def line_count(self) -> int:
+
+        return len(self._lines)
+
+    def accepts_array_buffer(self) -> bool:
+
+        return True
+
+    def _activate(self, row: int) -> None:
+
+        if row == self._row:
+            return
+
+        self._lines[self._row] = self._active.text()
+        self._dirty_rows.add(self._row)
+
+        self._row = row
+        self._active = _GapBuffer(self._lines[row])
+        self._col = min(self._col, len(self._active))
+        self._dirty_rows.add(row)
+
+    def _insert(self, text: str) -> None:
+
+        parts = text.replace('\r\n', '\n').replace('\r', '\n').split('\n')
+        active = self._active
+
+        if len(parts) == 1:
+            active.insert(self._col, text)
+            self._col += len(text)
+            self._dirty_rows.add(self._row)
+            return
+
+        length = len(active)
+        tail = active.slice(self._col, length)
+        active.delete(self._col, length - self._col)
+        active.insert(self._col, parts[0])
+
+        self._lines[self._row] = active.text()
+
+        added = parts[1:]
+        added[-1] += tail
+        self._lines[self._row + 1:self._row + 1] = added
+
+        self._row += len(added)
+        self._col = len(parts[-1])
+        self._active = _GapBuffer(self._lines[self._row])
+        self._layout = None
+
+    def _backspace(self) -> None:
+
+        if self._col:
+            self._col -= 1
+            self._active.delete(self._col, 1)
+            self._dirty_rows.add(self._row)
+            return
+
+        if not self._row:
+            return
+
+        previous = self._lines[self._row - 1]
+        current = self._active.text()
+
+        del self._lines[self._row]
+        self._row -= 1
+        self._active = _GapBuffer(previous + current)
+        self._col = len(previous)
+        self._layout = None
+
+    def _delete(self) -> None:
+
+        if self._col < len(self._active):
+            self._active.delete(self._col, 1)
+            self._dirty_rows.add(self._row)
+            return
+
+        if self._row + 1 >= len(self._lines):
+            return
+
+        following = self._lines.pop(self._row + 1)
+        self._active.insert(len(self._active), following)
+        self._layout = None
+
+    def _move(self, dx: int) -> None:
+
+        col = self._col + dx
+
+        if col < 0 and self._row:
+            self._activate(self._row - 1)
+            col = len(self._active)
+
+        elif col > len(self._active) and self._row + 1 < len(self._lines):
+            self._activate(self._row + 1)
+            col = 0
+
+        self._col = min(max(col, 0), len(self._active))
+        self._dirty_rows.add(self._row)
+
+    def _page(self) -> int:
+
+        return max((self._layout or (self._def[0],))[0] - 1, 1)
+
+    def handle_event(self, event: _events.Event) -> bool:
+
+        if isinstance(event, _events.PasteEvent):
+            self._insert(event.text)
+
+        elif isinstance(event, _events.VerticalNavEvent):
+            self._activate(min(max(self._row + event.y, 0),
+                               len(self._lines) - 1))
+
+        elif isinstance(event, _events.HorizontalNavEvent):
+            self._move(event.x)
+
+        elif not isinstance(event, _events.KeyEvent):
+            return False
+
+        elif event.text:
+            self._insert(event.text)
+
+        elif event.key == 'enter':
+            self._insert('\n')
+
+        elif event.key == 'backspace':
+            self._backspace()
+
+        elif event.key == 'delete':
+            self._delete()
+
+        elif event.key == 'home':
+            self._col = 0
+            self._dirty_rows.add(self._row)
+
+        elif event.key == 'end':
+            self._col = len(self._active)
+            self._dirty_rows.add(self._row)
+
+        elif event.key in ('pageup', 'pagedown'):
+            step = self._page() * (-1 if event.key == 'pageup' else 1)
+            self._activate(min(max(self._row + step, 0),
+                               len(self._lines) - 1))
+
+        else:
+            return False
+
+        self.invalidate()
+        return True
+
+    def _visible(self, row: int, cols: int) -> str:
+
+        start = self._offset
+
+        if row != self._row:
+            return self._lines[row][start:start + cols]
+
+        active = self._active
+        text = active.slice(min(start, len(active)),
+                            min(start + cols, len(active)))
+
+        return _with_cursor(text, self._col - start, self._cursor_char)
+
+    def render(self, cells: '_np.ndarray') -> None:
+
+        rows, cols = cells.shape
+
+        if rows and cols:
+
+            self._top = _scroll(self._top, self._row, rows)
+            self._offset = _scroll(self._offset, self._col, cols)
+
+            layout = rows, cols, self._top, self._offset, len(self._lines)
+            full = not self._retained or layout != self._layout
+            self._layout = layout
+
+            top = self._top
+            bottom = min(top + rows, len(self._lines))
+
+            if full:
+                targets = range(top, bottom)
+
+            else:
+                targets = [row for row in self._dirty_rows
+                           if top <= row < bottom]
+
+            for row in targets:
+                _buffer.write_line(cells, row - top, self._visible(row, cols))
+
+            if full:
+                cells[bottom - top:] = ''
+
+        self._dirty_rows.clear()
+        self._needs_refresh = False
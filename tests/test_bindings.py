@@ -0,0 +1,176 @@
+#!/usr/bin/env python3
+
+import asyncio
+
+import pytest
+
+from ezconsole import Bindings, Console, GUI, TextInput, events
+from ezconsole.abstract._vtinput import VTInputParser
+from ezconsole.abstract.headless import HeadlessConsole
+from ezconsole.bindings import _Matcher, _parse
+
+
+def _key(key: str) -> events.KeyEvent:
+
+    return events.KeyEvent(key, key if len(key) == 1 else '')
+
+
+def _run(bindings: Bindings, *steps):
+
+    async def main():
+
+        seen = []
+        matcher = _Matcher(bindings, seen.append, asyncio.get_running_loop())
+
+        for step in steps:
+
+            if isinstance(step, float):
+                await asyncio.sleep(step)
+            else:
+                matcher.feed(step)
+
+        matcher.close()
+        return [getattr(event, 'key', type(event).__name__)
+                for event in seen]
+
+    return asyncio.run(main())
+
+
+def test_parse():
+
+    assert _parse('ctrl-x ctrl-s') == ('ctrl-x', 'ctrl-s')
+    assert _parse('Alt-X') == ('escape', 'X')
+    assert _parse(['ctrl-Space', 'PgDn', 'esc']) == \
+        ('ctrl-space', 'pagedown', 'escape')
+    assert _parse('ctrl--') == ('ctrl--',)
+
+    with pytest.raises(ValueError):
+        _parse('super-x')
+
+
+def test_sequences_and_fallback():
+
+    bindings = Bindings(timeout=5)
+    fired = []
+
+    bindings.bind('ctrl-x ctrl-s', lambda: fired.append('save'))
+    bindings.bind('g g', lambda: fired.append('top'))
+
+    seen = _run(bindings, _key('ctrl-x'), _key('ctrl-s'), _key('g'),
+                _key('x'), _key('g'), _key('g'))
+
+    assert fired == ['save', 'top']
+    assert seen == ['g', 'x']
+
+
+def test_alt_matches_escape_prefix():
+
+    bindings = Bindings(timeout=5)
+    fired = []
+
+    bindings.bind('alt-x', lambda: fired.append('alt'))
+
+    assert _run(bindings, _key('alt-x'), events.QuitEvent(), _key('x'),
+                _key('y')) == ['y']
+    assert fired == ['alt', 'alt']
+
+
+def test_ambiguous_prefix_waits_for_timeout():
+
+    bindings = Bindings(timeout=0.02)
+    fired = []
+
+    bindings.bind('escape', lambda: fired.append('escape'))
+    bindings.bind('escape q', lambda: fired.append('quit'))
+
+    assert _run(bindings, events.QuitEvent(), 0.05, _key('q')) == ['q']
+    assert fired == ['escape']
+
+    fired.clear()
+    assert _run(bindings, events.QuitEvent(), events.UpNavEvent()) == [
+        'UpNavEvent',
+    ]
+    assert fired == ['escape']
+
+
+def test_unmatched_prefix_is_replayed():
+
+    bindings = Bindings(timeout=5)
+    bindings.bind('a b c', lambda: None)
+
+    assert _run(bindings, _key('a'), _key('b'), _key('x')) == ['a', 'b', 'x']
+    assert _run(bindings, _key('a'), 0.01, events.PasteEvent('p')) == [
+        'a', 'PasteEvent',
+    ]
+
+
+def test_unbind_prunes_trie():
+
+    bindings = Bindings()
+    bindings.bind('a b', lambda: None)
+    bindings.bind('a c', lambda: None)
+
+    bindings.unbind('a b')
+    assert list(bindings._root.children['a'].children) == ['c']
+
+    bindings.unbind('a c')
+    assert bindings._root.children == {}
+
+    with pytest.raises(ValueError):
+        bindings.unbind('a')
+
+    with pytest.raises(ValueError):
+        bindings.bind('', lambda: None)
+
+    with pytest.raises(ValueError):
+        Bindings(timeout=-1)
+
+
+def test_failing_action_is_logged(caplog):
+
+    bindings = Bindings()
+    bindings.bind('x', lambda: 1 / 0)
+
+    assert _run(bindings, _key('x'), _key('y')) == ['y']
+    assert "key binding" in caplog.text
+
+
+def test_gui_routes_keys_through_bindings():
+
+    async def main():
+
+        backend = HeadlessConsole(1, 10)
+        bindings = Bindings(timeout=5)
+        element = TextInput()
+        gui = GUI(element, console=Console('numpy', backend=backend),
+                  bindings=bindings)
+
+        bindings.bind('ctrl-u', lambda: setattr(element, 'value', ''))
+        bindings.bind('ctrl-q', lambda: backend.dispatch(events.QuitEvent()))
+
+        task = asyncio.ensure_future(gui.handle())
+        await asyncio.sleep(0)
+
+        for key in ('a', 'b', 'ctrl-u', 'c', 'ctrl-q'):
+            backend.dispatch(_key(key))
+
+        value = element.value
+        await asyncio.wait_for(task, 1)
+
+        return value
+
+    assert asyncio.run(main()) == 'c'
+
+
+def test_alt_space_from_terminal_input():
+
+    bindings = Bindings(timeout=5)
+    fired = []
+
+    bindings.bind('alt-space', lambda: fired.append('alt-space'))
+    bindings.bind('alt-ctrl-a', lambda: fired.append('alt-ctrl-a'))
+
+    parsed = VTInputParser().feed(b'\x1b \x1b\x01')
+
+    assert _run(bindings, *parsed) == []
+    assert fired == ['alt-space', 'alt-ctrl-a']
@@ -0,0 +1,118 @@
+#!/usr/bin/env python3
+
+import pytest
+
+from ezconsole import Console
+from ezconsole.abstract.headless import HeadlessConsole
+from ezconsole.buffer import ArrayBuffer, make_buffer, select_kind
+
+
+def _buffer(*lines: str, cols: int = 6) -> ArrayBuffer:
+
+    buffer = ArrayBuffer(len(lines), cols)
+    buffer.get_cells().write_lines(lines)
+
+    return buffer
+
+
+def _lines(buffer) -> list:
+
+    return [buffer.get_line(y) for y in range(buffer.shape[0])]
+
+
+def test_resize_keeps_overlap():
+
+    buffer = _buffer('abcdef', 'ghijkl')
+
+    buffer.resize(3, 4)
+    assert buffer.shape == (3, 4)
+    assert _lines(buffer) == ['abcd', 'ghij', '']
+
+    buffer.resize(1, 8)
+    assert _lines(buffer) == ['abcd']
+
+
+def test_equals_and_diff():
+
+    old = _buffer('abc', 'def', 'ghi')
+    new = _buffer('abc', 'de', 'xyz', 'new')
+
+    assert old.equals(old.copy())
+    assert not old.equals(new)
+    assert not old.equals(make_buffer('numpy', 3, 6))
+
+    assert new.diff(old) == [(1, 'de', 3), (2, 'xyz', 3)]
+    assert old.diff(new) == [(1, 'def', 2), (2, 'ghi', 3)]
+
+
+def test_copy_reuses_matching_target():
+
+    source = _buffer('abc')
+    target = ArrayBuffer(1, 6)
+
+    assert source.copy(target) is target
+    assert _lines(target) == ['abc']
+
+    other = source.copy(ArrayBuffer(2, 6))
+    assert other.shape == (1, 6) and _lines(other) == ['abc']
+
+
+def test_convert_round_trip():
+
+    buffer = _buffer('abc', '', 'xy')
+    numpy = buffer.convert('numpy')
+
+    assert numpy.kind == 'numpy'
+    assert numpy.shape == (3, 6)
+    assert _lines(numpy) == ['abc', '', 'xy']
+    assert buffer.convert('array') is buffer
+
+    back = numpy.convert('array')
+
+    assert back.kind == 'array'
+    assert back.equals(buffer)
+
+
+def test_cell_views():
+
+    buffer = _buffer('abcdef', 'ghijkl')
+    cells = buffer.get_cells()
+
+    cells[1:, 2:4] = 'x'
+    cells[:1, 4:] = cells[1:, :2]
+
+    assert _lines(buffer) == ['abcdgh', 'ghxxkl']
+    assert cells[:, 1:3].get_line(1) == 'hx'
+
+    with pytest.raises(TypeError):
+        cells[::2]
+
+    with pytest.raises(ValueError):
+        cells[:1] = cells[:, :2]
+
+
+def test_select_kind():
+
+    assert select_kind('auto', 3, 20) == 'array'
+    assert select_kind('auto', 100, 100) == 'numpy'
+    assert select_kind('auto', 3, 20, require_ndarray=True) == 'numpy'
+
+    with pytest.raises(ValueError):
+        select_kind('array', 3, 20, require_ndarray=True)
+
+    with pytest.raises(ValueError):
+        select_kind('bitmap', 3, 20)
+
+
+def test_styled_console_stays_numpy():
+
+    console = Console('auto', backend=HeadlessConsole(40, 200))
+
+    console.resize_buffer(40, 200)
+    styles = console.get_style_buffer()
+    styles[0, 0] = 7
+
+    console.resize_buffer(2, 10)
+
+    assert console._cells.kind == 'numpy'
+    assert console.get_style_buffer()[0, 0] == 7
@@ -0,0 +1,115 @@
+#!/usr/bin/env python3
+
+import numpy as np
+import pytest
+
+from ezconsole import Canvas
+
+
+def _canvas(rows: int, cols: int, styled: bool = False) -> Canvas:
+
+    return Canvas(np.zeros((rows, cols), dtype='=U1'),
+                  np.zeros((rows, cols), dtype=np.uint32) if styled else None)
+
+
+def _lines(canvas: Canvas):
+
+    return [''.join(char or '.' for char in row) for row in canvas.cells]
+
+
+def test_box_and_lines():
+
+    canvas = _canvas(4, 7)
+
+    canvas.box(border='rounded', fill=' ')
+    canvas.hline(2, 1, 5)
+    canvas.vline(0, 3, 4, '┼')
+
+    assert _lines(canvas) == [
+        '╭──┼──╮',
+        '│  ┼  │',
+        '│──┼──│',
+        '╰──┼──╯',
+    ]
+
+
+def test_drawing_is_clipped():
+
+    canvas = _canvas(3, 5)
+
+    canvas.box(-1, -1, 3, 10, border='ascii')
+    canvas.fill('#', 2, 3, 5, 5)
+    canvas.text(1, 3, 'hello')
+    canvas.hline(5, 0, 3)
+    canvas.vtext(-1, 0, 'xyz')
+
+    assert _lines(canvas) == [
+        'y....',
+        'z--he',
+        '...##',
+    ]
+
+
+def test_text_alignment_and_transparency():
+
+    canvas = _canvas(3, 6)
+    canvas.fill('.')
+
+    canvas.texts(0, 0, ['ab', 'abcd'], 6, align='right')
+    canvas.text(2, 0, 'ab', 6, align='center', fill='')
+
+    assert _lines(canvas) == [
+        '    ab',
+        '  abcd',
+        '..ab..',
+    ]
+
+    with pytest.raises(ValueError):
+        canvas.text(0, 0, 'x', align='justify')
+
+
+def test_view_shares_cells_and_styles():
+
+    canvas = _canvas(4, 6, styled=True)
+    view = canvas.view(1, 2, 2, 10)
+
+    assert view.shape == (2, 4)
+
+    view.box(border='double', style=7)
+    view.text(0, 1, 'AB', style=9)
+
+    assert _lines(canvas)[1:3] == ['..╔AB╗', '..╚══╝']
+    assert canvas.styles[1].tolist() == [0, 0, 7, 9, 9, 7]
+    assert canvas.view(5, 0).shape == (0, 0)
+
+
+def test_blit():
+
+    source = _canvas(2, 3, styled=True)
+    source.text(0, 0, 'ab')
+    source.styles[...] = 4
+
+    target = _canvas(3, 4, styled=True)
+    target.fill('.', style=1)
+    target.blit(source, 1, 2, transparent=True)
+
+    assert _lines(target) == ['....', '..ab', '....']
+    assert target.styles.tolist() == [[1, 1, 1, 1], [1, 1, 4, 4],
+                                      [1, 1, 1, 1]]
+
+    target.blit(source.cells, 0, -1, style=2)
+
+    assert _lines(target) == ['b...', '..ab', '....']
+    assert target.styles[:2].tolist() == [[2, 2, 1, 1], [2, 2, 4, 4]]
+
+
+def test_invalid_arguments():
+
+    with pytest.raises(ValueError):
+        Canvas(np.zeros(3, dtype='=U1'))
+
+    with pytest.raises(ValueError):
+        _canvas(2, 2).box(border='dots')
+
+    with pytest.raises(ValueError):
+        Canvas(np.zeros((2, 2), dtype='=U1'), np.zeros((2, 3)))
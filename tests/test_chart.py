@@ -0,0 +1,81 @@
+#!/usr/bin/env python3
+
+import numpy as np
+import pytest
+
+from ezconsole import Chart
+
+
+def _lines(chart: Chart, rows: int, cols: int):
+
+    cells = np.zeros((rows, cols), dtype='=U1')
+    chart.render(cells)
+
+    return [''.join(row) for row in cells]
+
+
+def test_block_levels():
+
+    chart = Chart(low=0, high=8)
+    chart.extend(range(9))
+
+    assert _lines(chart, 1, 9) == ['▁▁▂▃▄▅▆▇█']
+    assert _lines(chart, 2, 9) == ['     ▂▄▆█', '▁▂▄▆█████']
+
+
+def test_autoscale_and_padding():
+
+    chart = Chart()
+    chart.extend([10, 20])
+
+    assert _lines(chart, 1, 4) == ['  ▁█']
+    assert _lines(Chart(), 1, 3) == ['   ']
+
+
+def test_samples_per_column_keeps_extremes():
+
+    chart = Chart(2, low=0, high=8)
+    chart.extend([0, 8, 4])
+    chart.append(4)
+    chart.append(1)
+
+    assert _lines(chart, 1, 4) == [' █▄▁']
+
+
+def test_capacity_keeps_latest_columns():
+
+    chart = Chart(capacity=3, low=0, high=8)
+    chart.extend(range(10))
+
+    assert _lines(chart, 1, 5) == ['  ▇██']
+
+    chart.set_data([0, 4, 8])
+    assert _lines(chart, 1, 3) == ['▁▄█']
+
+    chart.clear()
+    assert _lines(chart, 1, 3) == ['   ']
+
+
+def test_braille_draws_every_sample():
+
+    chart = Chart(mode='braille', low=0, high=4)
+    chart.extend([0, 1, 2, 3, 4, 4])
+
+    assert _lines(chart, 1, 3) == ['⡠⠊⠉']
+
+    chart = Chart(mode='braille', low=0, high=8)
+    chart.extend([0, 8])
+
+    assert _lines(chart, 2, 1) == ['⠈', '⡀']
+
+
+def test_rejects_bad_arguments():
+
+    with pytest.raises(ValueError):
+        Chart(0)
+
+    with pytest.raises(ValueError):
+        Chart(capacity=0)
+
+    with pytest.raises(ValueError):
+        Chart(mode='dots')
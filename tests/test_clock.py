@@ -0,0 +1,118 @@
+#!/usr/bin/env python3
+
+import asyncio
+
+import pytest
+
+from ezconsole import Console, GUI, MultiProgress
+from ezconsole.abstract.headless import HeadlessConsole
+from ezconsole.clock import AnimationClock
+
+
+def _clock():
+
+    now = [0.25]
+    changes = []
+    clock = AnimationClock(lambda: now[0], lambda: changes.append(now[0]))
+
+    return clock, now, changes
+
+
+def test_subscriptions_share_aligned_groups():
+
+    clock, now, changes = _clock()
+    ticks = []
+
+    clock.subscribe(lambda t: ticks.append(('a', t)), 2)
+    clock.subscribe(lambda t: ticks.append(('b', t)), 2)
+    clock.subscribe(lambda t: ticks.append(('c', t)), 10)
+
+    assert len(clock) == 3
+    assert len(clock._groups) == 2
+    assert changes == [0.25] * 3
+    assert clock.next_due() == pytest.approx(0.3)
+
+    assert clock.advance(0.3) == 1
+    assert clock.next_due() == pytest.approx(0.4)
+
+    assert clock.advance(0.5) == 3
+    assert [name for name, _ in ticks] == ['c', 'a', 'b', 'c']
+    assert clock.next_due() == pytest.approx(0.6)
+
+
+def test_late_advance_skips_missed_ticks():
+
+    clock, now, _ = _clock()
+    ticks = []
+
+    clock.subscribe(ticks.append, 10)
+
+    assert clock.advance(1.03) == 1
+    assert clock.next_due() == pytest.approx(1.1)
+    assert clock.advance(1.05) == 0
+
+
+def test_unsubscribe():
+
+    clock, now, _ = _clock()
+    ticks = []
+
+    token = clock.subscribe(ticks.append, 4)
+    clock.unsubscribe(token)
+
+    assert len(clock) == 0
+    assert clock.next_due() is None
+    assert clock.advance(10) == 0
+
+    with pytest.raises(ValueError):
+        clock.unsubscribe(token)
+
+    with pytest.raises(ValueError):
+        clock.subscribe(ticks.append, 0)
+
+
+def test_failing_callback_is_logged(caplog):
+
+    clock, now, _ = _clock()
+    ticks = []
+
+    def fail(t):
+        raise RuntimeError("boom")
+
+    clock.subscribe(fail, 4)
+    clock.subscribe(ticks.append, 4)
+
+    assert clock.advance(0.5) == 2
+    assert ticks == [0.5]
+    assert "animation tick" in caplog.text
+
+
+def test_gui_drives_clock():
+
+    async def main():
+
+        backend = HeadlessConsole(1, 40)
+        progress = MultiProgress(['spin'], [20], label_width=4)
+        gui = GUI(progress, console=Console('numpy', backend=backend))
+
+        ticks = []
+
+        def tick(now):
+            ticks.append(now)
+            progress.advance(0)
+
+        token = gui.clock.subscribe(tick, 50)
+        await asyncio.sleep(0.25)
+        gui.clock.unsubscribe(token)
+
+        count = len(ticks)
+        await asyncio.sleep(0.05)
+
+        return ticks, count, backend.lines
+
+    ticks, count, lines = asyncio.run(main())
+
+    assert 5 <= len(ticks) <= 14
+    assert len(ticks) == count
+    assert all(later > earlier for earlier, later in zip(ticks, ticks[1:]))
+    assert f"{min(len(ticks), 20) * 5:3d}%" in lines[0]
@@ -0,0 +1,93 @@
+#!/usr/bin/env python3
+
+import numpy as np
+import pytest
+
+from ezconsole import colors, styles
+
+
+def _quantize(rgb: np.ndarray, count: int) -> np.ndarray:
+
+    return colors.quantize(colors.rgb(rgb[..., 0], rgb[..., 1], rgb[..., 2]),
+                           count)
+
+
+def _random(n: int) -> np.ndarray:
+
+    return np.random.default_rng(0).integers(0, 256, (n, 3))
+
+
+@pytest.mark.parametrize('count', [8, 16])
+def test_ansi_palette_maps_to_itself(count):
+
+    palette = colors.palette(count)
+
+    assert _quantize(palette, count).tolist() == list(range(count))
+
+
+def test_cube_and_grays_mostly_map_to_themselves():
+
+    palette = colors.palette(256)[16:]
+
+    assert (_quantize(palette, 256) == np.arange(16, 256)).mean() > 0.95
+
+
+def test_known_colours():
+
+    rgb = np.array([(255, 0, 0), (0, 0, 0), (255, 255, 255)])
+
+    assert _quantize(rgb, 256).tolist() == [196, 16, 231]
+    assert _quantize(rgb, 16).tolist() == [9, 0, 15]
+    assert _quantize(rgb, 8).tolist() == [1, 0, 7]
+
+
+@pytest.mark.parametrize('count', [8, 16])
+def test_agrees_with_brute_force(count):
+
+    rgb = _random(2000)
+    exact = colors._nearest(rgb, colors.palette(count))
+
+    assert (_quantize(rgb, count) == exact).mean() > 0.9
+
+
+def test_256_error_is_bounded():
+
+    rgb = _random(2000)
+    palette = colors.palette(256)
+
+    exact = 16 + colors._nearest(rgb, palette[16:])
+    approx = _quantize(rgb, 256)
+
+    error = np.abs(palette[approx] - rgb).max(axis=1)
+    best = np.abs(palette[exact] - rgb).max(axis=1)
+
+    assert (error - best).max() <= 24
+
+
+def test_default_and_monochrome():
+
+    assert colors.quantize([-1, 0xff0000], 16).tolist() == [-1, 9]
+    assert colors.quantize([0xff0000, 0x00ff00], 2).tolist() == [-1, -1]
+
+
+def test_lookup_table_is_cached_and_read_only():
+
+    lut = colors.lookup_table(300)
+
+    assert colors.lookup_table(256) is lut
+    assert colors.level(300) == 256 and colors.level(9) == 8
+
+    with pytest.raises(ValueError):
+        lut[0] = 1
+
+
+def test_pack_styles_matches_style():
+
+    fg = colors.quantize([0xff0000, -1], 256)
+    bg = colors.quantize([-1, 0x0000ff], 256)
+
+    packed = colors.pack_styles(fg, bg, styles.BOLD)
+
+    assert packed.tolist() == [styles.style(196, None, styles.BOLD),
+                               styles.style(None, 21, styles.BOLD)]
+    assert styles.unpack(int(packed[1])) == (None, 21, styles.BOLD)
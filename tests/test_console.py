@@ -0,0 +1,74 @@
+#!/usr/bin/env python3
+
+import asyncio
+import io
+
+from ezconsole import GUI, MultiProgress, PlainConsole, Stack
+from ezconsole import console
+
+
+def test_open_console_without_terminal(monkeypatch):
+
+    stream = io.StringIO()
+    monkeypatch.setattr(console._sys, 'stdout', stream)
+
+    result = console.open_console()
+
+    assert isinstance(result, PlainConsole)
+    assert not result.interactive
+    assert result._stream is stream
+
+
+def test_plain_console_writes_final_frame():
+
+    async def main():
+
+        stream = io.StringIO()
+        progress = MultiProgress(['a', 'b'], [10, 10], label_width=2)
+        gui = GUI(progress, console=PlainConsole(stream, rows=5, cols=30))
+
+        for _ in range(5):
+            progress.advance(0)
+            await asyncio.sleep(0.02)
+
+        written = stream.getvalue()
+        await gui.handle()
+        first = stream.getvalue()
+        await gui.handle()
+
+        return written, first, stream.getvalue()
+
+    written, first, second = asyncio.run(main())
+    lines = first.splitlines()
+
+    assert written == ''
+    assert len(lines) == 5 and lines[2:] == ['', '', '']
+    assert lines[0].startswith('a') and '50%' in lines[0]
+    assert lines[1].startswith('b') and '0%' in lines[1]
+    assert all(line == line.rstrip() for line in lines)
+    assert '\x1b' not in first
+    assert second == first
+
+
+def test_plain_console_ignores_input():
+
+    plain = PlainConsole(io.StringIO(), rows=2, cols=10)
+
+    assert plain.register_event_handler(lambda event: None) is None
+    assert plain.get_colors() == 2
+    assert plain.visible_dims() == (2, 10)
+    plain.unregister_event_handler(None)
+
+
+def test_gui_handle_returns_for_plain_console():
+
+    async def main():
+
+        stream = io.StringIO()
+        gui = GUI(Stack([MultiProgress(['x'])]),
+                  console=PlainConsole(stream, rows=3, cols=20))
+
+        await asyncio.wait_for(gui.handle(), 1)
+        return stream.getvalue()
+
+    assert asyncio.run(main()).startswith('x')
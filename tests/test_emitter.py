@@ -0,0 +1,166 @@
+#!/usr/bin/env python3
+
+import itertools
+import random
+import re
+
+import numpy as np
+
+from ezconsole import styles
+from ezconsole.abstract._emitter import Emitter, runs, sgr
+from ezconsole.abstract._terminfo import TermInfo
+
+
+_ON = {1: styles.BOLD, 2: styles.DIM, 3: styles.ITALIC, 4: styles.UNDERLINE,
+       5: styles.BLINK, 7: styles.REVERSE}
+
+_OFF = {22: styles.BOLD | styles.DIM, 23: styles.ITALIC,
+        24: styles.UNDERLINE, 25: styles.BLINK, 27: styles.REVERSE}
+
+
+def _apply(state, sequence: str):
+
+    fg, bg, flags = state
+    params = [int(param) for param in
+              re.fullmatch(r'\x1b\[([0-9;]*)m', sequence).group(1).split(';')]
+
+    while params:
+
+        code = params.pop(0)
+
+        if code == 0:
+            fg, bg, flags = None, None, 0
+        elif code in _ON:
+            flags |= _ON[code]
+        elif code in _OFF:
+            flags &= ~_OFF[code]
+        elif 30 <= code <= 37:
+            fg = code - 30
+        elif 90 <= code <= 97:
+            fg = code - 82
+        elif code == 38:
+            fg = params[1]
+            del params[:2]
+        elif code == 39:
+            fg = None
+        elif 40 <= code <= 47:
+            bg = code - 40
+        elif 100 <= code <= 107:
+            bg = code - 92
+        elif code == 48:
+            bg = params[1]
+            del params[:2]
+        elif code == 49:
+            bg = None
+        else:
+            raise AssertionError(f"unexpected SGR parameter {code}")
+
+    return fg, bg, flags
+
+
+def _words(n: int):
+
+    rng = random.Random(0)
+    colours = [None, 0, 7, 8, 15, 16, 196, 255]
+    flags = [styles.BOLD, styles.DIM, styles.ITALIC, styles.UNDERLINE,
+             styles.BLINK, styles.REVERSE]
+
+    for _ in range(n):
+        mask = sum(flag for flag in flags if rng.random() < 0.3)
+        yield styles.style(rng.choice(colours), rng.choice(colours), mask)
+
+
+def test_deltas_reach_target_state():
+
+    words = list(_words(60)) + [styles.DEFAULT]
+
+    for old, new in itertools.product(words, repeat=2):
+
+        sequence = sgr(old, new)
+
+        if old == new:
+            assert sequence == ''
+            continue
+
+        assert _apply(styles.unpack(old), sequence) == styles.unpack(new)
+        assert len(sequence) <= len(sgr(None, new))
+
+
+def test_first_style_resets():
+
+    for word in _words(20):
+        assert sgr(None, word).startswith('\x1b[0')
+        assert _apply((1, 2, styles.ITALIC), sgr(None, word)) == \
+            styles.unpack(word)
+
+
+def test_small_deltas():
+
+    bold_red = styles.style(1, None, styles.BOLD)
+
+    assert sgr(bold_red, styles.style(2, None, styles.BOLD)) == '\x1b[32m'
+    assert sgr(bold_red, styles.style(1)) == '\x1b[22m'
+    assert sgr(styles.style(1, None, styles.BOLD | styles.DIM),
+               styles.style(1, None, styles.DIM)) == '\x1b[22;2m'
+
+
+def test_runs():
+
+    row = np.array([0, 0, 5, 5, 5, 0, 7], dtype=np.uint32)
+
+    assert runs(row, 7) == [0, 2, 5, 6, 7]
+    assert runs(row, 1) == [0, 1]
+    assert runs(row, 0) == [0]
+
+
+def _emitter():
+
+    writes = []
+    info = TermInfo('test', {'cup': b'\x1b[%i%p1%d;%p2%dH'}, {}, {})
+
+    return Emitter(info, writes.append), writes
+
+
+def test_styled_emits_one_sgr_per_run():
+
+    emitter, writes = _emitter()
+    red = styles.style(1)
+
+    emitter.styled('ab cd', np.array([0, 0, red, red, 0], dtype=np.uint32))
+    emitter.styled('ef', np.array([0, 0], dtype=np.uint32))
+    emitter.flush()
+
+    assert writes == [b'\x1b[0mab\x1b[31m c\x1b[0mdef']
+
+
+def test_styled_pads_trailing_style():
+
+    emitter, writes = _emitter()
+    red = styles.style(None, 1)
+
+    emitter.styled('a', np.array([0, red, red, 0], dtype=np.uint32))
+    emitter.flush()
+
+    assert writes == [b'\x1b[0ma\x1b[41m  ']
+
+
+def test_hold_batches_writes():
+
+    emitter, writes = _emitter()
+
+    emitter.hold()
+    emitter.cap('cup', 2, 3)
+    emitter.text('x\0y')
+    emitter.flush()
+
+    assert writes == []
+
+    emitter.release()
+
+    assert writes == [b'\x1b[3;4Hx y']
+
+    emitter.invalidate()
+    emitter.style(styles.DEFAULT)
+    emitter.flush()
+
+    assert writes[-1] == b'\x1b[0m'
@@ -0,0 +1,253 @@
+#!/usr/bin/env python3
+
+import asyncio
+import threading
+
+import pytest
+
+from ezconsole import Console, GUI, MultiProgress, events
+from ezconsole.abstract.headless import HeadlessConsole
+from ezconsole.elements import _Element
+
+
+def _gui(element, rows: int = 4, cols: int = 40, **kwargs) -> GUI:
+
+    backend = HeadlessConsole(rows, cols)
+    return GUI(element, console=Console('numpy', backend=backend), **kwargs)
+
+
+def _lines(gui: GUI):
+
+    return gui.console._abstract_console.lines
+
+
+def test_posted_updates_coalesce_by_key():
+
+    async def main():
+
+        gui = _gui(MultiProgress(['a', 'b'], [100, 100]))
+        applied = []
+
+        def update(index, value):
+            applied.append((index, value))
+            gui.element.update(index, value)
+
+        def work():
+            for value in range(1, 101):
+                gui.post(('done', 0), update, 0, value)
+                gui.post(('done', 1), update, 1, value // 2)
+
+        thread = threading.Thread(target=work)
+        thread.start()
+        thread.join()
+
+        await asyncio.sleep(0.05)
+        return applied, _lines(gui)
+
+    applied, lines = asyncio.run(main())
+
+    assert len(applied) <= 4
+    assert applied[-2:] == [(0, 100), (1, 50)]
+    assert '100%' in lines[0]
+    assert ' 50%' in lines[1]
+
+
+def test_failing_update_does_not_block_others(caplog):
+
+    async def main():
+
+        gui = _gui(MultiProgress(['a'], [10]))
+
+        def fail():
+            raise RuntimeError("boom")
+
+        gui.post('fail', fail)
+        gui.post('done', gui.element.update, 0, 5)
+
+        await asyncio.sleep(0.05)
+        return _lines(gui)
+
+    lines = asyncio.run(main())
+
+    assert ' 50%' in lines[0]
+    assert "posted update" in caplog.text
+
+
+class _Fill(_Element):
+
+    def __init__(self, char: str, rows: int, cols: int) -> None:
+
+        super().__init__()
+
+        self.char = char
+        self.renders = 0
+        self.events = []
+
+        self._def = rows, cols
+
+    def set(self, char: str) -> None:
+
+        self.char = char
+        self.invalidate()
+
+    def render(self, cells) -> None:
+
+        self.renders += 1
+
+        cells[...] = self.char
+        self._needs_refresh = False
+
+    def handle_event(self, event) -> bool:
+
+        self.events.append(event)
+        return True
+
+
+def _run_layers(steps):
+
+    async def main():
+
+        base = _Fill('.', 4, 6)
+        gui = _gui(base, rows=4, cols=6, frame_rate=0)
+        await asyncio.sleep(0.01)
+
+        snapshots = []
+
+        for step in steps:
+            step(gui, base)
+            await asyncio.sleep(0.01)
+            snapshots.append((list(_lines(gui)), base.renders))
+
+        return base, snapshots
+
+    return asyncio.run(main())
+
+
+def test_popup_layer_is_composited_and_removed():
+
+    popup = _Fill('#', 2, 2)
+
+    base, (shown, moved, removed) = _run_layers([
+        lambda gui, base: gui.push_layer(popup),
+        lambda gui, base: gui.move_layer(popup, 0, 0),
+        lambda gui, base: gui.remove_layer(popup),
+    ])
+
+    assert shown == (['......', '..##..', '..##..', '......'], 1)
+    assert moved == (['##....', '##....', '......', '......'], 2)
+    assert removed == (['......'] * 4, 2)
+
+
+def test_covered_base_is_not_rendered():
+
+    cover = _Fill('#', 4, 6)
+
+    def update(gui, base):
+        base.set(':')
+
+    base, (covered, updated, uncovered) = _run_layers([
+        lambda gui, base: gui.push_layer(cover),
+        update,
+        lambda gui, base: gui.remove_layer(cover),
+    ])
+
+    assert covered == (['######'] * 4, 1)
+    assert updated == (['######'] * 4, 1)
+    assert uncovered == (['::::::'] * 4, 2)
+
+
+def test_events_go_to_top_layer():
+
+    popup = _Fill('#', 1, 1)
+
+    def send(gui, base):
+        gui._dispatch(events.DownNavEvent(), quit_signal=None)
+
+    base, _ = _run_layers([
+        lambda gui, base: gui.push_layer(popup),
+        send,
+        lambda gui, base: gui.remove_layer(popup),
+        send,
+    ])
+
+    assert len(popup.events) == 1
+    assert len(base.events) == 1
+
+
+def test_layer_errors():
+
+    popup = _Fill('#', 1, 1)
+
+    def check(gui, base):
+
+        with pytest.raises(ValueError):
+            gui.push_layer(base)
+
+        gui.push_layer(popup)
+
+        with pytest.raises(ValueError):
+            gui.push_layer(popup)
+
+        gui.remove_layer(popup)
+
+        with pytest.raises(ValueError):
+            gui.remove_layer(popup)
+
+    _run_layers([check])
+
+
+def test_fullscreen_gui_fills_window():
+
+    async def main():
+
+        backend = HeadlessConsole(6, 30)
+        console = Console('numpy', backend=backend, fullscreen=True)
+        gui = GUI(MultiProgress(['a']), console=console, fullscreen=True)
+
+        await asyncio.sleep(0.05)
+        return gui.console._cells.shape, len(backend.lines)
+
+    assert asyncio.run(main()) == ((6, 30), 6)
+
+
+def test_fullscreen_gui_requires_fullscreen_console():
+
+    async def main():
+
+        with pytest.raises(ValueError):
+            _gui(MultiProgress(['a']), fullscreen=True)
+
+    asyncio.run(main())
+
+
+def test_gui_on_explicit_loop():
+
+    loop = asyncio.new_event_loop()
+
+    try:
+        progress = MultiProgress(['a'], [10])
+        gui = _gui(progress, loop=loop)
+
+        def work():
+            for value in range(1, 11):
+                gui.post('done', progress.update, 0, value)
+
+        thread = threading.Thread(target=work)
+        thread.start()
+        thread.join()
+
+        loop.run_until_complete(asyncio.sleep(0.05))
+
+    finally:
+        loop.close()
+
+    assert '100%' in _lines(gui)[0]
+
+    progress.update(0, 5)
+    gui.post('done', progress.update, 0, 1)
+
+
+def test_gui_without_loop_outside_coroutine():
+
+    with pytest.raises(RuntimeError):
+        _gui(MultiProgress(['a']))
@@ -0,0 +1,154 @@
+#!/usr/bin/env python3
+
+import asyncio
+import threading
+
+import numpy as np
+import pytest
+
+from ezconsole import Console, GUI, LogView
+from ezconsole.abstract.headless import HeadlessConsole
+
+
+def _lines(view: LogView, rows: int, cols: int = 10):
+
+    cells = np.zeros((rows, cols), dtype='=U1')
+    view.render(cells)
+
+    return [''.join(row) for row in cells]
+
+
+def test_tail_of_ring():
+
+    view = LogView(capacity=4, width=10)
+    view.extend(f"line {i}" for i in range(6))
+
+    assert len(view) == 4
+    assert _lines(view, 3) == ['line 3', 'line 4', 'line 5']
+    assert _lines(view, 6) == ['line 2', 'line 3', 'line 4', 'line 5', '', '']
+
+
+def test_batch_larger_than_capacity():
+
+    view = LogView(capacity=3, width=10)
+    view.append('first')
+    view.extend(str(i) for i in range(5))
+
+    assert _lines(view, 3) == ['2', '3', '4']
+
+
+def test_scroll_and_follow():
+
+    view = LogView(capacity=10, width=10)
+    view.extend(str(i) for i in range(8))
+
+    view.scroll(2)
+    assert _lines(view, 2) == ['4', '5']
+
+    view.append('8')
+    assert _lines(view, 2) == ['4', '5']
+
+    view.scroll(100)
+    assert _lines(view, 2) == ['0', '']
+
+    view.follow()
+    assert _lines(view, 2) == ['7', '8']
+
+
+def test_truncates_to_width():
+
+    view = LogView(capacity=2, width=4)
+    view.append('abcdefgh')
+
+    assert _lines(view, 1, 6) == ['abcd']
+    assert _lines(view, 1, 2) == ['ab']
+
+
+def test_rejects_bad_arguments():
+
+    with pytest.raises(ValueError):
+        LogView(capacity=0)
+
+    with pytest.raises(ValueError):
+        LogView(width=0)
+
+
+def test_appends_from_worker_threads():
+
+    async def main():
+
+        backend = HeadlessConsole(3, 20)
+        view = LogView(capacity=100, width=20)
+        GUI(view, console=Console('numpy', backend=backend), frame_rate=0)
+        await asyncio.sleep(0.02)
+
+        def work(name):
+            for i in range(50):
+                view.append(f"{name} {i}")
+
+        threads = [threading.Thread(target=work, args=(name,))
+                   for name in 'ab']
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        await asyncio.sleep(0.05)
+        return len(view), backend.lines
+
+    count, lines = asyncio.run(main())
+
+    assert count == 100
+    assert all(lines)
+    assert lines[-1] in ('a 49', 'b 49')
+
+
+class _FrameCounter(HeadlessConsole):
+
+    frames = 0
+
+    def end_frame(self) -> None:
+
+        self.frames += 1
+
+
+def test_frame_rate_limits_redraws():
+
+    async def main():
+
+        backend = _FrameCounter(3, 20)
+        view = LogView(capacity=100, width=20)
+        GUI(view, console=Console('numpy', backend=backend), frame_rate=10)
+
+        for i in range(20):
+            view.append(str(i))
+            await asyncio.sleep(0.005)
+
+        await asyncio.sleep(0.15)
+        return backend.frames, backend.lines
+
+    frames, lines = asyncio.run(main())
+
+    assert 1 <= frames <= 4
+    assert lines == ['17', '18', '19']
+
+
+def test_lines_appended_before_attach_are_shown():
+
+    view = LogView(capacity=10, width=10)
+    thread = threading.Thread(target=view.extend, args=(['x', 'y'],))
+    thread.start()
+    thread.join()
+
+    async def main():
+
+        backend = HeadlessConsole(2, 10)
+        GUI(view, console=Console('numpy', backend=backend))
+        await asyncio.sleep(0.02)
+
+        view.append('z')
+        await asyncio.sleep(0.05)
+
+        return backend.lines
+
+    assert asyncio.run(main()) == ['y', 'z']
@@ -0,0 +1,152 @@
+#!/usr/bin/env python3
+
+import asyncio
+import time
+
+from concurrent.futures import Executor, Future, ProcessPoolExecutor
+
+from ezconsole import Console, GUI, LogView, Offload, Stack, offload
+from ezconsole.abstract.headless import HeadlessConsole
+from ezconsole.elements import _Element, _registry
+
+
+class _Slow(_Element):
+
+    def __init__(self, delay: float) -> None:
+
+        super().__init__()
+
+        self.delay = delay
+        self.value = 0
+
+        self._def = 1, 20
+
+    def set(self, value: int) -> None:
+
+        self.value = value
+        self.invalidate()
+
+    def render(self, cells) -> None:
+
+        text = f"value={self.value}"
+        time.sleep(self.delay)
+
+        cells[...] = ''
+        cells[0, :len(text)] = list(text)
+        self._needs_refresh = False
+
+
+def _run(child: _Slow, updates, frame_rate: float = 60.0) -> str:
+
+    async def main():
+
+        backend = HeadlessConsole(1, 20)
+        GUI(Offload(child), console=Console('numpy', backend=backend),
+            frame_rate=frame_rate)
+
+        for delay, value in updates:
+            await asyncio.sleep(delay)
+            child.set(value)
+
+        await asyncio.sleep(0.5)
+        return backend.lines[0].rstrip()
+
+    return asyncio.run(main())
+
+
+def test_offloaded_render():
+
+    assert _run(_Slow(0.0), ()) == 'value=0'
+
+
+def test_update_during_slow_render():
+
+    assert _run(_Slow(0.1), [(0.02, 1)]) == 'value=1'
+
+
+def test_update_before_next_frame():
+
+    assert _run(_Slow(0.1), [(0.02, 1)], frame_rate=5.0) == 'value=1'
+
+
+def test_render_uses_snapshot():
+
+    child = _Slow(0.1)
+
+    assert _run(child, [(0.02, 1), (0.02, 2)]) == 'value=2'
+    assert not child.is_dirty()
+
+
+def _lines(element, rows: int = 2, cols: int = 20, executor=None):
+
+    async def main():
+
+        backend = HeadlessConsole(rows, cols)
+        GUI(Offload(element, executor=executor),
+            console=Console('numpy', backend=backend))
+
+        await asyncio.sleep(0.1)
+        return backend.lines
+
+    return asyncio.run(main())
+
+
+def test_thread_pool_does_not_pickle(monkeypatch):
+
+    def dumps(*args, **kwargs):
+        raise AssertionError("pickled on the loop thread")
+
+    monkeypatch.setattr(offload._pickle, 'dumps', dumps)
+
+    view = LogView(capacity=10, width=20)
+    view.extend(['one', 'two'])
+
+    assert _lines(view) == ['one', 'two']
+
+
+def test_unpicklable_child_renders_inline(caplog):
+
+    view = LogView(capacity=10, width=20)
+    view.extend(['one', 'two'])
+
+    with ProcessPoolExecutor(max_workers=1) as executor:
+        assert _lines(view, executor=executor) == ['one', 'two']
+
+    assert "rendering it inline" in caplog.text
+
+
+class _Manual(Executor):
+
+    def __init__(self) -> None:
+
+        self.jobs = []
+
+    def submit(self, fn, *args, **kwargs):
+
+        future = Future()
+        self.jobs.append((future, fn, args))
+        return future
+
+
+def test_job_finishing_after_loop_closed(caplog):
+
+    executor = _Manual()
+
+    _lines(_Slow(0.0), executor=executor)
+
+    future, fn, args = executor.jobs[0]
+    fn(*args)
+    future.set_result(None)
+
+    assert "exception calling callback" not in caplog.text
+
+
+def test_clear_subtree_leaves_other_elements_dirty():
+
+    inner, outer = _Slow(0.0), _Slow(0.0)
+    wrapper = Offload(Stack([inner]))
+
+    _registry.clear_subtree(wrapper)
+
+    assert not inner.is_dirty() and not wrapper.is_dirty()
+    assert outer.is_dirty()
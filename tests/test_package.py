@@ -1,3 +1,67 @@
 #!/usr/bin/env python3
 
+import os
+import subprocess
+import sys
+
 import ezconsole
+
+
+_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+_IMPORT_BUDGET_US = 50000
+
+
+def _python(*args: str) -> subprocess.CompletedProcess:
+
+    return subprocess.run([sys.executable, *args], cwd=_ROOT, check=True,
+                          capture_output=True, text=True)
+
+
+def test_import_is_lazy():
+
+    loaded = set(_python('-c', "import sys, ezconsole; "
+                               "print(*sys.modules)").stdout.split())
+
+    assert not loaded & {
+        'numpy',
+        'curses',
+        'ezconsole.abstract.posix',
+        'ezconsole.abstract.win32',
+        'ezconsole.console',
+        'ezconsole.elements',
+        'ezconsole.gui',
+    }
+
+
+def test_import_time_budget():
+
+    stderr = _python('-X', 'importtime', '-c', "import ezconsole").stderr
+
+    for line in stderr.splitlines():
+        *_, cumulative, module = line.split('|')
+
+        if module.strip() == 'ezconsole':
+            assert int(cumulative) < _IMPORT_BUDGET_US
+            break
+
+    else:
+        raise AssertionError("no import time reported for ezconsole")
+
+
+def test_lazy_attributes():
+
+    assert set(ezconsole.__all__) <= set(dir(ezconsole))
+    assert ezconsole.Choice.__module__ == 'ezconsole.elements'
+
+
+def test_small_dialog_is_numpy_free():
+
+    loaded = set(_python('-c', "import sys\n"
+                               "from ezconsole import Choice\n"
+                               "from ezconsole.buffer import ArrayBuffer\n"
+                               "buffer = ArrayBuffer(3, 20)\n"
+                               "Choice(['a', 'b']).render(buffer.get_cells())\n"
+                               "print(*sys.modules)").stdout.split())
+
+    assert 'numpy' not in loaded
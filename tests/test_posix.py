@@ -0,0 +1,135 @@
+#!/usr/bin/env python3
+
+import os
+import select
+import subprocess
+import sys
+import time
+
+import pytest
+
+termios = pytest.importorskip('termios')
+
+import fcntl  # noqa: E402
+import pty  # noqa: E402
+import struct  # noqa: E402
+
+from ezconsole.abstract import _terminfo  # noqa: E402
+from ezconsole.abstract._vtinput import (  # noqa: E402
+    SYNC_BEGIN,
+    SYNC_END,
+    SYNC_QUERY,
+)
+
+
+_TERM = 'xterm-256color'
+
+_FULLSCREEN = '''
+from ezconsole import Console
+from ezconsole.buffer import write_lines
+
+console = Console('array', fullscreen=True)
+console.resize_buffer(3, 20)
+write_lines(console.get_buffer(), ['one', 'two', 'three'])
+console.flush()
+console.resize_buffer(1, 20)
+console.flush()
+console.close()
+'''
+
+
+def _run(script: str, reply: bytes = b'', rows: int = 10,
+         cols: int = 40) -> bytes:
+
+    if _terminfo.find_source(_TERM) is None:
+        pytest.skip(f"no terminfo entry for {_TERM}")
+
+    master, slave = pty.openpty()
+    fcntl.ioctl(slave, termios.TIOCSWINSZ,
+                struct.pack('HHHH', rows, cols, 0, 0))
+
+    process = subprocess.Popen([sys.executable, '-c', script], stdin=slave,
+                               stdout=slave, stderr=subprocess.PIPE,
+                               env=dict(os.environ, TERM=_TERM))
+    os.close(slave)
+
+    output = b''
+    deadline = time.monotonic() + 10
+
+    try:
+        while time.monotonic() < deadline:
+
+            if not select.select([master], [], [], 0.05)[0]:
+                if process.poll() is not None:
+                    break
+                continue
+
+            try:
+                data = os.read(master, 4096)
+            except OSError:
+                break
+
+            if not data:
+                break
+
+            output += data
+
+            if reply and b'\x1b[c' in output:
+                os.write(master, reply)
+                reply = b''
+
+    finally:
+        os.close(master)
+
+    assert process.wait(5) == 0, process.stderr.read().decode()
+    return output
+
+
+def test_fullscreen_uses_alternate_screen():
+
+    info = _terminfo.load(_TERM)
+    output = _run(_FULLSCREEN)
+
+    smcup, rmcup = info.get('smcup'), info.get('rmcup')
+
+    assert output.startswith(smcup)
+    assert output.endswith(rmcup)
+
+    for y, text in enumerate((b'one', b'two', b'three')):
+        assert info.param('cup', y, 0) + text in output
+
+    tail = output[output.index(b'three'):output.index(rmcup)]
+
+    assert info.param('cup', 1, 0) + info.get('el') in tail
+    assert info.param('cup', 2, 0) + info.get('el') in tail
+    assert b'\r\n' not in output
+
+
+_INLINE = '''
+from ezconsole import Console
+from ezconsole.buffer import write_lines
+
+console = Console('array')
+console.resize_buffer(2, 20)
+write_lines(console.get_buffer(), ['one', 'two'])
+console.flush()
+console.close()
+'''
+
+
+def test_sync_probe_enables_synchronized_frames():
+
+    output = _run(_INLINE, reply=b'\x1b[?2026;2$y\x1b[?64;1c')
+    frame = output[output.index(SYNC_BEGIN):]
+
+    assert output.index(SYNC_QUERY) < output.index(SYNC_BEGIN)
+    assert frame.index(b'one') < frame.index(b'two') < frame.index(SYNC_END)
+    assert output.count(SYNC_BEGIN) == 1
+
+
+def test_unanswered_probe_leaves_frames_unwrapped():
+
+    output = _run(_INLINE, reply=b'\x1b[?64;1c')
+
+    assert SYNC_QUERY in output and b'two' in output
+    assert SYNC_BEGIN not in output
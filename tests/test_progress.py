@@ -0,0 +1,119 @@
+#!/usr/bin/env python3
+
+import numpy as np
+import pytest
+
+from ezconsole import MultiProgress
+
+
+def _lines(progress: MultiProgress, rows: int, cols: int):
+
+    cells = np.zeros((rows, cols), dtype='=U1')
+    progress.render(cells)
+
+    return [''.join(row) for row in cells]
+
+
+def test_bars():
+
+    progress = MultiProgress(['alpha', 'beta', 'gamma'], [8, 8, 0],
+                             label_width=5)
+    progress.update([0, 1], [8, 3])
+
+    assert _lines(progress, 3, 30) == [
+        'alpha [████████] 100% 00:00:00',
+        'beta  [███     ]  37% --:--:--',
+        'gamma [        ]   0% 00:00:00',
+    ]
+
+
+def test_rate_follows_updates_not_frames():
+
+    now = [0.0]
+    progress = MultiProgress(['a'], [100], label_width=1, smoothing=0,
+                             time=lambda: now[0])
+
+    progress.update(0, 0)
+    now[0] = 10.0
+    progress.update(0, 20)
+
+    assert progress._rate[0] == pytest.approx(2.0)
+
+    for _ in range(5):
+        _lines(progress, 1, 30)
+
+    assert _lines(progress, 1, 30)[0].endswith('00:00:40')
+
+    now[0] = 20.0
+    progress.update(0, 10)
+
+    assert progress._rate[0] == 0
+    assert _lines(progress, 1, 30)[0].endswith('--:--:--')
+
+
+def test_smoothed_rate():
+
+    now = [0.0]
+    progress = MultiProgress(['a'], [100], label_width=1, smoothing=1,
+                             time=lambda: now[0])
+
+    progress.update(0, 0)
+    now[0] = 1.0
+    progress.advance(0, 10)
+
+    assert progress._rate[0] == pytest.approx(10 * (1 - np.exp(-1)))
+
+
+def test_partial_cells():
+
+    progress = MultiProgress(['x'], [64], label_width=1)
+    progress.update(0, 3)
+
+    assert _lines(progress, 1, 26)[0][:12] == 'x [▍       ]'
+
+
+def test_advance_and_scroll():
+
+    progress = MultiProgress([str(i) for i in range(5)], [10] * 5,
+                             label_width=1)
+    progress.advance([1, 1, 3], 5)
+
+    assert [line[:1] for line in _lines(progress, 2, 30)] == ['0', '1']
+    assert '100%' in _lines(progress, 2, 30)[1]
+
+    progress.scroll(3)
+    lines = _lines(progress, 2, 30)
+
+    assert [line[:1] for line in lines] == ['3', '4']
+    assert ' 50%' in lines[0]
+
+
+def test_add_and_extend():
+
+    progress = MultiProgress(label_width=4)
+
+    assert progress.add('one', 2) == 0
+    assert progress.extend(['two', 'six'], [4, 6]).tolist() == [1, 2]
+    assert len(progress) == 3
+
+
+def test_empty_and_narrow():
+
+    progress = MultiProgress(label_width=4)
+
+    assert _lines(progress, 2, 30) == ['', '']
+
+    progress.add('task', 1)
+
+    assert _lines(progress, 1, 5) == ['t    ']
+
+
+def test_rejects_bad_index():
+
+    progress = MultiProgress(['a'])
+
+    with pytest.raises(IndexError):
+        progress.update(1, 1)
+
+    with pytest.raises(ValueError):
+        MultiProgress(label_width=-1)
@@ -0,0 +1,260 @@
+#!/usr/bin/env python3
+
+import io
+import random
+
+import numpy as np
+import pytest
+
+from ezconsole import Console, Player, Recorder
+from ezconsole.abstract.headless import HeadlessConsole
+from ezconsole.buffer import write_lines
+from ezconsole.recorder import MAGIC, _diff_span
+
+
+def _script(n: int):
+
+    rng = random.Random(0)
+    lines = ['']
+    previous = None
+
+    for _ in range(n):
+
+        rows = min(max(len(lines) + rng.choice((-1, 0, 0, 1)), 1), 6)
+        lines = (lines + [''] * rows)[:rows]
+
+        y = rng.randrange(rows)
+        x = rng.randint(0, 12)
+        word = ''.join(rng.choices('abcé─ ', k=rng.randint(0, 6)))
+        line = (lines[y].ljust(x) + word)[:20]
+
+        if lines[:y] + [line] + lines[y + 1:] == previous:
+            line = line[:19] + ('-' if line.endswith('+') else '+')
+
+        lines[y] = line
+        previous = list(lines)
+
+        yield previous
+
+
+def _record(n: int, keyframe_interval: int = 8, **kwargs):
+
+    stream = io.BytesIO()
+    now = [0.0]
+    recorder = Recorder(stream, keyframe_interval=keyframe_interval,
+                        time=lambda: now[0], **kwargs)
+
+    backend = HeadlessConsole(10, 20)
+    console = Console('numpy', backend=backend)
+    recorder.attach(console)
+
+    frames = []
+
+    for lines in _script(n):
+
+        now[0] += 0.25
+        console.resize_buffer(len(lines), 20)
+        write_lines(console.get_buffer(), lines)
+        console.flush()
+
+        frames.append((now[0], list(backend.lines)))
+
+    recorder.close()
+    assert console.recorder is None
+
+    return stream, frames
+
+
+def _visible(lines):
+
+    return [line.replace('\0', ' ').rstrip() for line in lines]
+
+
+def test_diff_span():
+
+    def cells(text):
+        return np.array(list(text.ljust(6, '\0')), dtype='=U1')
+
+    plain = np.zeros(6, dtype=np.uint32)
+    styled = plain.copy()
+    styled[4] = 7
+
+    assert _diff_span(cells('abcdef'), cells('abXYef'), plain, plain) == \
+        (2, 4)
+    assert _diff_span(cells('aaa'), cells('aaaa'), plain, plain) == (3, 4)
+    assert _diff_span(cells('abc'), cells(''), plain, plain) == (0, 3)
+    assert _diff_span(cells('same'), cells('same'), plain, plain) == (0, 0)
+    assert _diff_span(cells('aXc'), cells('abc'), plain, styled) == (1, 5)
+
+
+def test_round_trip():
+
+    stream, frames = _record(60)
+    player = Player(stream)
+
+    played = list(player.frames())
+
+    assert len(played) == len(frames)
+    assert player.keyframes() == [frames[i][0] for i in range(0, 60, 9)]
+
+    for (time, lines), (stamp, cols, recorded, styles) in zip(frames,
+                                                              played):
+        assert stamp == time and cols == 20 and styles is None
+        assert _visible(recorded) == [line.rstrip() for line in lines]
+
+
+def test_seek_and_partial_playback():
+
+    stream, frames = _record(40)
+    player = Player(stream)
+
+    for i in (0, 8, 9, 10, 23, 39):
+
+        time, lines = frames[i]
+        stamp, _, recorded, _ = player.seek(time + 0.1)
+
+        assert stamp == time
+        assert _visible(recorded) == [line.rstrip() for line in lines]
+
+    assert [stamp for stamp, _, _, _ in player.frames(5.0)] == \
+        [time for time, _ in frames if time >= 5.0]
+
+    with pytest.raises(ValueError):
+        player.seek(0.1)
+
+
+def test_missing_index_is_rebuilt():
+
+    stream, frames = _record(20)
+    data = stream.getvalue()
+
+    indexed = Player(io.BytesIO(data))
+    offset = indexed._index[-1][1]
+
+    truncated = Player(io.BytesIO(data[:offset + 5]))
+
+    assert truncated.keyframes() == indexed.keyframes()[:-1]
+    assert len(list(truncated.frames())) == 18
+
+    with pytest.raises(ValueError):
+        Player(io.BytesIO(b'nope'))
+
+
+def test_replay_into_headless_console():
+
+    stream, frames = _record(30)
+    backend = HeadlessConsole(10, 20)
+    delays = []
+
+    count = Player(stream).replay(backend, speed=2.0, sleep=delays.append,
+                                  clock=lambda: 0.0)
+
+    assert count == 30
+    assert delays == pytest.approx([time / 2.0 - 0.125
+                                    for time, _ in frames[1:]])
+    assert backend.lines == frames[-1][1]
+
+    with pytest.raises(ValueError):
+        Player(stream).replay(backend, speed=0)
+
+
+def test_attach_rules():
+
+    recorder = Recorder(io.BytesIO())
+    console = Console('numpy', backend=HeadlessConsole(2, 10))
+
+    recorder.attach(console)
+
+    with pytest.raises(ValueError):
+        Recorder(io.BytesIO()).attach(console)
+
+    recorder.close()
+    recorder.close()
+
+    with pytest.raises(ValueError):
+        recorder.attach(console)
+
+    with pytest.raises(ValueError):
+        Recorder(io.BytesIO(), keyframe_interval=0)
+
+
+def test_styles_are_recorded_and_replayed():
+
+    stream = io.BytesIO()
+    now = [0.0]
+    recorder = Recorder(stream, keyframe_interval=3, time=lambda: now[0])
+    console = Console('numpy', backend=HeadlessConsole(4, 10))
+    recorder.attach(console)
+
+    expected = []
+
+    for i in range(7):
+
+        now[0] += 1.0
+        console.resize_buffer(2, 10)
+        write_lines(console.get_buffer(), ['row %d' % i, 'fixed'])
+
+        if i >= 2:
+            styles = console.get_style_buffer()
+            styles[:] = 0
+            styles[i % 2, 1:4] = i
+
+        expected.append(None if i < 2 else
+                        console.get_style_buffer().copy())
+        console.flush()
+
+    recorder.close()
+
+    player = Player(stream)
+    frames = list(player.frames())
+
+    assert len(frames) == 7
+
+    for (_, _, lines, styles), (i, wanted) in zip(frames,
+                                                  enumerate(expected)):
+        assert lines == ['row %d' % i, 'fixed']
+
+        if wanted is None:
+            assert styles is None
+
+        else:
+            assert np.array_equal(styles, wanted)
+
+    assert np.array_equal(player.seek(4.5)[3], expected[3])
+
+    target = Console('numpy', backend=HeadlessConsole(4, 10))
+    player.replay(target, sleep=lambda delay: None)
+
+    assert np.array_equal(target.get_style_buffer(), expected[-1])
+
+
+def test_crashed_recording_uses_flushed_index():
+
+    stream, frames = _record(60, index_interval=2)
+    data = stream.getvalue()
+
+    indexed = Player(io.BytesIO(data))
+    assert indexed.keyframes() == [frames[i][0] for i in range(0, 60, 9)]
+
+    offset = indexed._index[-1][1]
+    truncated = Player(io.BytesIO(data[:offset + 5]))
+    starts = []
+    records = truncated._records
+
+    def spy(start):
+        starts.append(start)
+        return records(start)
+
+    truncated._records = spy
+    truncated._index = truncated._read_index()
+
+    assert truncated.keyframes() == indexed.keyframes()[:-1]
+    assert truncated._index == indexed._index[:-1]
+    assert starts and starts[0] > len(MAGIC)
+
+    stamp, _, recorded, _ = truncated.seek(frames[40][0])
+    assert stamp == frames[40][0]
+    assert _visible(recorded) == [line.rstrip() for line in frames[40][1]]
+
+    with pytest.raises(ValueError):
+        Recorder(io.BytesIO(), index_interval=0)
@@ -0,0 +1,149 @@
+#!/usr/bin/env python3
+
+import asyncio
+import threading
+
+from ezconsole import Console, GUI, MultiProgress, Stack
+from ezconsole.abstract.headless import HeadlessConsole
+from ezconsole.elements import _QUEUED, _registry
+
+
+def _gui(element) -> GUI:
+
+    return GUI(element, console=Console('numpy',
+                                        backend=HeadlessConsole(4, 40)))
+
+
+def test_unattached_element_is_not_queued():
+
+    element = MultiProgress(['a'])
+
+    assert element._needs_refresh
+    assert not _registry.flags[element._id] & _QUEUED
+    assert element._id not in _registry._pending
+
+
+def test_refresh_from_other_thread():
+
+    async def main():
+
+        gui = _gui(MultiProgress(['a'], [10]))
+        await asyncio.sleep(0.05)
+
+        errors = []
+
+        def work():
+
+            try:
+                for i in range(50):
+                    MultiProgress([str(i)])
+
+                gui.element.update(0, 5)
+
+            except Exception as e:
+                errors.append(e)
+
+        thread = threading.Thread(target=work)
+        thread.start()
+        thread.join()
+
+        await asyncio.sleep(0.05)
+
+        return errors, gui.console._abstract_console.lines[0]
+
+    errors, line = asyncio.run(main(), debug=True)
+
+    assert errors == []
+    assert '50%' in line
+
+
+def test_marks_only_wake_own_root():
+
+    async def main():
+
+        first = _gui(MultiProgress(['a'], [10]))
+        second = _gui(MultiProgress(['b'], [10]))
+        await asyncio.sleep(0.05)
+
+        first.element.update(0, 5)
+        assert second._frame_handle is None
+        assert first._frame_handle is not None
+
+        await asyncio.sleep(0.05)
+
+    asyncio.run(main())
+
+
+def test_collect_returns_only_dirty_subtrees():
+
+    async def main():
+
+        leaves = [MultiProgress([str(i)], [10]) for i in range(200)]
+        stacks = [Stack(leaves[i:i + 20]) for i in range(0, 200, 20)]
+        gui = _gui(Stack(stacks))
+        await asyncio.sleep(0.05)
+
+        leaves[5].update(0, 1)
+        leaves[150].update(0, 1)
+        leaves[150].update(0, 2)
+
+        targets = _registry.collect(gui)
+        _registry.finish()
+
+        return targets, leaves
+
+    targets, leaves = asyncio.run(main())
+
+    assert targets == [leaves[5], leaves[150]]
+
+
+def test_released_ids_are_reused():
+
+    element = MultiProgress(['a'])
+    node_id = element._id
+    del element
+
+    assert MultiProgress(['b'])._id == node_id
+
+
+def test_repeated_invalidations_skip_root_walk(monkeypatch):
+
+    async def main():
+
+        leaf = MultiProgress(['a'], [10])
+        _gui(Stack([Stack([leaf])]))
+        await asyncio.sleep(0.05)
+
+        walks = []
+        root_of = _registry._root_of
+
+        def counting(node_id):
+            walks.append(node_id)
+            return root_of(node_id)
+
+        monkeypatch.setattr(_registry, '_root_of', counting)
+
+        for value in range(10):
+            leaf.update(0, value)
+
+        await asyncio.sleep(0.05)
+        return walks
+
+    assert len(asyncio.run(main())) == 1
+
+
+def test_release_from_other_thread():
+
+    elements = [MultiProgress([str(i)]) for i in range(500)]
+
+    def release():
+        del elements[:]
+
+    thread = threading.Thread(target=release)
+    thread.start()
+
+    created = [MultiProgress(['x'])._id for _ in range(500)]
+    thread.join()
+
+    assert len(_registry._free) == len(set(_registry._free))
+    assert all(_registry.nodes[node_id] is None for node_id in created)
@@ -0,0 +1,243 @@
+#!/usr/bin/env python3
+
+import asyncio
+
+import pytest
+
+from ezconsole import MultiProgress, Server
+from ezconsole.elements import _Element
+from ezconsole.server import _TelnetFilter, _nearest
+
+
+def _naws(rows: int, cols: int) -> bytes:
+
+    return bytes((255, 250, 31, cols >> 8, cols & 255, rows >> 8, rows & 255,
+                  255, 240))
+
+
+def test_telnet_filter_extracts_size():
+
+    telnet = _TelnetFilter()
+
+    data, size = telnet.feed(b'ab' + _naws(24, 80)[:4])
+    assert (data, size) == (b'ab', None)
+
+    data, size = telnet.feed(_naws(24, 80)[4:] + b'\xff\xffc')
+    assert (data, size) == (b'\xffc', (24, 80))
+
+
+def test_nearest_shape():
+
+    shapes = [(24, 80), (10, 40), (50, 200)]
+
+    assert _nearest((8, 30), shapes) == (10, 40)
+    assert _nearest((30, 100), shapes) == (50, 200)
+    assert _nearest((60, 100), shapes) == (50, 200)
+
+
+def test_session_survives_shrinking():
+
+    async def main():
+
+        server = Server(MultiProgress(['task'], [10]), frame_rate=0)
+        listener = await server.serve_tcp('127.0.0.1')
+        port = listener.sockets[0].getsockname()[1]
+
+        reader, writer = await asyncio.open_connection('127.0.0.1', port)
+
+        try:
+            for rows, cols in ((10, 80), (10, 40), (5, 20), (10, 60)):
+
+                writer.write(_naws(rows, cols))
+                await writer.drain()
+                await asyncio.sleep(0.05)
+
+                session, = server.get_sessions()
+                assert session.shape == (rows, cols)
+                assert session.console.get_buffer().shape[1] == cols
+
+                server.element.advance(0)
+                await asyncio.sleep(0.05)
+
+            output = await asyncio.wait_for(reader.read(1 << 16), 1.0)
+            assert b'task' in output
+            assert len(server.get_sessions()) == 1
+
+        finally:
+            writer.close()
+            server.close()
+
+    asyncio.run(main())
+
+
+def test_split_escape_sequence_keeps_session():
+
+    async def main():
+
+        server = Server(MultiProgress(['task'], [10]), frame_rate=0)
+        listener = await server.serve_tcp('127.0.0.1')
+        port = listener.sockets[0].getsockname()[1]
+
+        reader, writer = await asyncio.open_connection('127.0.0.1', port)
+
+        try:
+            writer.write(_naws(10, 40) + b'\x1b')
+            await writer.drain()
+            await asyncio.sleep(0.02)
+
+            writer.write(b'[B')
+            await writer.drain()
+            await asyncio.sleep(0.2)
+
+            assert len(server.get_sessions()) == 1
+
+            writer.write(b'\x1b')
+            await writer.drain()
+            await asyncio.sleep(0.2)
+
+            assert server.get_sessions() == []
+
+        finally:
+            writer.close()
+            server.close()
+
+    asyncio.run(main())
+
+
+class _Recorder(_Element):
+
+    def __init__(self) -> None:
+
+        super().__init__()
+
+        self.events = []
+        self.renders = 0
+
+        self._def = 2, 20
+
+    def handle_event(self, event) -> bool:
+
+        self.events.append(event.key)
+        return True
+
+    def render(self, cells) -> None:
+
+        self.renders += 1
+
+        cells[...] = 'x'
+        self._needs_refresh = False
+
+
+async def _connect(server: Server, rows: int, cols: int):
+
+    listener = await server.serve_tcp('127.0.0.1')
+    port = listener.sockets[0].getsockname()[1]
+
+    reader, writer = await asyncio.open_connection('127.0.0.1', port)
+    writer.write(_naws(rows, cols))
+    await writer.drain()
+
+    return reader, writer
+
+
+def test_input_is_shared_by_default():
+
+    async def main():
+
+        element = _Recorder()
+        server = Server(element, frame_rate=0)
+
+        try:
+            _, first = await _connect(server, 5, 20)
+            _, second = await _connect(server, 5, 20)
+
+            first.write(b'a')
+            second.write(b'b')
+            await asyncio.sleep(0.1)
+
+        finally:
+            server.close()
+
+        return element.events
+
+    assert sorted(asyncio.run(main())) == ['a', 'b']
+
+
+def test_sessions_can_have_own_input_targets():
+
+    async def main():
+
+        element = _Recorder()
+        private = []
+
+        def target(session):
+
+            if private:
+                return None
+
+            own = _Recorder()
+            private.append(own)
+            return own
+
+        server = Server(element, frame_rate=0, input_target=target)
+
+        try:
+            _, owner = await _connect(server, 5, 20)
+            await asyncio.sleep(0.05)
+            _, viewer = await _connect(server, 5, 20)
+
+            owner.write(b'a')
+            viewer.write(b'b')
+            await asyncio.sleep(0.1)
+
+            sessions = server.get_sessions()
+
+        finally:
+            server.close()
+
+        return element.events, private[0].events, sessions
+
+    shared, own, sessions = asyncio.run(main())
+
+    assert shared == []
+    assert own == ['a']
+    assert len(sessions) == 2 and sessions[1].target is None
+
+
+def test_distinct_shapes_are_limited():
+
+    async def main():
+
+        element = _Recorder()
+        server = Server(element, frame_rate=0, max_shapes=1)
+
+        try:
+            connections = [await _connect(server, 6, 30),
+                           await _connect(server, 3, 10)]
+            await asyncio.sleep(0.1)
+
+            element.renders = 0
+            element.invalidate()
+            await asyncio.sleep(0.1)
+
+            shapes = [session.console.get_buffer().shape
+                      for session in server.get_sessions()]
+
+        finally:
+            server.close()
+
+        assert len(connections) == 2
+        return element.renders, shapes
+
+    renders, shapes = asyncio.run(main())
+
+    assert renders == 1
+    assert sorted(shapes) == [(3, 10), (6, 30)]
+
+    with pytest.raises(ValueError):
+        asyncio.run(_server(max_shapes=0))
+
+
+async def _server(**kwargs) -> Server:
+
+    return Server(_Recorder(), **kwargs)
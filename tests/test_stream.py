@@ -0,0 +1,57 @@
+#!/usr/bin/env python3
+
+from ezconsole import Console, events
+from ezconsole.abstract._vtinput import SYNC_BEGIN, SYNC_END, SYNC_QUERY
+from ezconsole.abstract.stream import StreamConsole
+from ezconsole.buffer import write_lines
+
+
+def _console():
+
+    writes = []
+    backend = StreamConsole(writes.append, rows=5, cols=20)
+    console = Console('array', backend=backend)
+
+    return console, backend, writes
+
+
+def _frame(console: Console, lines) -> None:
+
+    console.resize_buffer(len(lines), 20)
+    write_lines(console.get_buffer(), lines)
+    console.flush()
+
+
+def test_each_frame_is_one_write():
+
+    console, backend, writes = _console()
+
+    assert writes[-1].endswith(SYNC_QUERY)
+
+    _frame(console, ['ab', 'cd', 'ef'])
+    _frame(console, ['ab', 'cx', 'ey'])
+    _frame(console, ['ab', 'cx', 'ey'])
+
+    assert writes[1:] == [
+        b'\x1b[1;1Hab\x1b[2;1Hcd\x1b[3;1Hef',
+        b'\x1b[2;1Hcx\x1b[3;1Hey',
+    ]
+
+
+def test_frames_are_synchronized_once_supported():
+
+    console, backend, writes = _console()
+    seen = []
+
+    backend.register_input_callback(seen.append)
+    backend.dispatch(events.ModeReportEvent(2026, 2))
+
+    _frame(console, ['ab'])
+
+    assert writes[-1] == SYNC_BEGIN + b'\x1b[1;1Hab' + SYNC_END
+    assert seen == []
+
+    backend.dispatch(events.ModeReportEvent(2026, 0))
+    _frame(console, ['ac'])
+
+    assert writes[-1] == b'\x1b[1;1Hac'
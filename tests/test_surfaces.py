@@ -0,0 +1,106 @@
+#!/usr/bin/env python3
+
+import asyncio
+
+import numpy as np
+
+from ezconsole import Console, GUI, Stack
+from ezconsole.abstract.headless import HeadlessConsole
+from ezconsole.elements import _Element
+
+
+class _Text(_Element):
+
+    def __init__(self, text: str, **kwargs) -> None:
+
+        super().__init__(**kwargs)
+
+        self.text = text
+        self.renders = 0
+
+        self._def = 1, len(text)
+
+    def set(self, text: str) -> None:
+
+        self.text = text
+        self.invalidate()
+
+    def render(self, cells) -> None:
+
+        self.renders += 1
+
+        cells[...] = ''
+        cells[0, :len(self.text)] = list(self.text)
+        self._needs_refresh = False
+
+
+def _lines(cells: np.ndarray):
+
+    return [''.join(row) for row in cells]
+
+
+def test_cached_element_renders_once():
+
+    element = _Text('abc', cached=True)
+    cells = np.zeros((1, 5), dtype='=U1')
+
+    element.draw(cells)
+    cells[...] = 'x'
+    element.draw(cells)
+
+    assert element.renders == 1
+    assert _lines(cells) == ['abc']
+
+    element.set('de')
+    element.draw(cells)
+
+    assert element.renders == 2
+    assert _lines(cells) == ['de']
+
+
+def test_cached_element_restores_region():
+
+    element = _Text('abcd', cached=True)
+    cells = np.zeros((1, 4), dtype='=U1')
+
+    element.draw(cells)
+    cells[0, 1:3] = '#'
+
+    assert element.restore(cells, slice(0, 1), slice(1, 3))
+    assert _lines(cells) == ['abcd']
+
+    element.set('wxyz')
+    assert not element.restore(cells, slice(0, 1), slice(0, 4))
+
+
+def test_stack_lays_out_children():
+
+    stack = Stack([_Text('one'), _Text('two'), _Text('six')])
+    cells = np.zeros((4, 5), dtype='=U1')
+    cells[...] = 'x'
+
+    stack.draw(cells)
+
+    assert stack.get_def() == (3, 3)
+    assert _lines(cells) == ['one', 'two', 'six', '']
+
+
+def test_stack_redraws_only_dirty_child():
+
+    async def main():
+
+        children = [_Text('one'), _Text('two', cached=True), _Text('six')]
+        backend = HeadlessConsole(3, 10)
+        GUI(Stack(children), console=Console('numpy', backend=backend),
+            frame_rate=0)
+        await asyncio.sleep(0.02)
+
+        children[2].set('ten')
+        await asyncio.sleep(0.02)
+
+        return [child.renders for child in children], backend.lines
+
+    renders, lines = asyncio.run(main())
+
+    assert renders == [1, 1, 2]
+    assert lines == ['one', 'two', 'ten']
@@ -0,0 +1,69 @@
+#!/usr/bin/env python3
+
+import numpy as np
+import pytest
+
+from ezconsole import Table
+
+
+def _lines(table: Table, rows: int, cols: int):
+
+    cells = np.zeros((rows, cols), dtype='=U1')
+    table.render(cells)
+
+    return [''.join(row).rstrip() for row in cells]
+
+
+def _data() -> np.ndarray:
+
+    return np.array([(1, 2.5, 'one'), (22, -0.125, 'two'), (333, 1e9, 'six')],
+                    dtype=[('id', int), ('value', float), ('name', 'U3')])
+
+
+def test_render_aligns_columns():
+
+    lines = _lines(Table(_data()), 4, 30)
+
+    assert lines == [
+        ' id│ value│name',
+        '  1│   2.5│one',
+        ' 22│-0.125│two',
+        '333│ 1e+09│six',
+    ]
+
+
+def test_empty_table():
+
+    table = Table(np.zeros((0, 2)), headers=['a', 'b'])
+
+    assert _lines(table, 3, 10) == ['a│b', '', '']
+
+
+def test_header_only_area():
+
+    assert _lines(Table(_data()), 1, 30) == [' id│ value│name']
+
+
+def test_scrolled_past_end():
+
+    table = Table(_data())
+    table.scroll(rows=10)
+
+    assert _lines(table, 3, 30)[1:] == [' 22│-0.125│two', '333│ 1e+09│six']
+
+
+def test_horizontal_scroll_and_clip():
+
+    table = Table(_data())
+    table.scroll(columns=1)
+
+    assert _lines(table, 2, 8) == [' value│n', '   2.5│o']
+
+
+def test_rejects_bad_data():
+
+    with pytest.raises(ValueError):
+        Table(np.zeros(3))
+
+    with pytest.raises(ValueError):
+        Table(np.zeros((2, 2)), headers=['a'])
@@ -0,0 +1,175 @@
+#!/usr/bin/env python3
+
+import json
+import subprocess
+import sys
+
+import pytest
+
+from ezconsole.abstract import _terminfo
+from ezconsole.abstract._terminfo import TermInfo, tparm
+
+
+_TERMS = ('xterm-256color', 'screen', 'linux', 'vt100')
+
+_CALLS = (
+    ('cup', (0, 0)),
+    ('cup', (4, 9)),
+    ('cup', (120, 300)),
+    ('csr', (0, 23)),
+    ('cub', (7,)),
+    ('hpa', (12,)),
+    ('vpa', (3,)),
+    ('ech', (5,)),
+    ('setaf', (1,)),
+    ('setaf', (12,)),
+    ('setaf', (200,)),
+    ('setab', (9,)),
+    ('setab', (255,)),
+    ('sgr', (1, 0, 1, 0, 0, 1, 0, 0, 0)),
+    ('sgr', (0, 1, 0, 1, 1, 0, 1, 0, 1)),
+)
+
+_REFERENCE = '''
+import curses, json, sys
+
+curses.setupterm(sys.argv[1], 1)
+results = []
+
+for name, params in json.loads(sys.argv[2]):
+    template = curses.tigetstr(name)
+    if template:
+        results.append([name, params, template.decode('latin-1'),
+                        curses.tparm(template, *params).decode('latin-1')])
+
+print(json.dumps(results))
+'''
+
+
+def _reference(term: str):
+
+    if _terminfo.find_source(term) is None:
+        pytest.skip(f"no terminfo entry for {term}")
+
+    result = subprocess.run([sys.executable, '-c', _REFERENCE, term,
+                             json.dumps(_CALLS)],
+                            capture_output=True, text=True)
+    if result.returncode:
+        pytest.skip(f"curses cannot set up {term}")
+
+    return json.loads(result.stdout)
+
+
+@pytest.mark.parametrize('term', _TERMS)
+def test_tparm_matches_curses(term):
+
+    reference = _reference(term)
+    assert reference
+
+    for name, params, template, expected in reference:
+
+        actual = tparm(template.encode('latin-1'), *params)
+        assert actual == expected.encode('latin-1'), (name, params)
+
+
+@pytest.mark.parametrize('template, params, expected', [
+    (b'%p1%d;%p2%d', (3, 4), b'3;4'),
+    (b'%i%p1%d;%p2%d', (3, 4), b'4;5'),
+    (b'%p1%02d|%p1%3d|%p1%x|%p1%X|%p1%o', (10,), b'10| 10|a|A|12'),
+    (b'%p1%:-3d|', (7,), b'7  |'),
+    (b'%p1%{10}%+%d %p1%{3}%*%d %p1%{4}%/%d %p1%{4}%m%d', (9,),
+     b'19 27 2 1'),
+    (b'%?%p1%{8}%<%t3%p1%d%e%p1%{16}%<%t9%p1%{8}%-%d%e38;5;%p1%d%;',
+     (5,), b'35'),
+    (b'%?%p1%{8}%<%t3%p1%d%e%p1%{16}%<%t9%p1%{8}%-%d%e38;5;%p1%d%;',
+     (12,), b'94'),
+    (b'%?%p1%{8}%<%t3%p1%d%e%p1%{16}%<%t9%p1%{8}%-%d%e38;5;%p1%d%;',
+     (99,), b'38;5;99'),
+    (b'%p1%Pa%p2%Pb%gb%ga%-%d', (2, 7), b'5'),
+    (b"%'A'%c%p1%c", (66,), b'AB'),
+    (b'%p1%l%d', (12345,), b'5'),
+    (b'%p1%s', (42,), b'42'),
+    (b'%p1%p2%&%d %p1%p2%|%d %p1%p2%^%d', (6, 3), b'2 7 5'),
+    (b'%p1%!%d%p1%~%d', (0,), b'1-1'),
+    (b'%p1%p2%A%d%p1%p2%O%d', (1, 0), b'01'),
+    (b'100%%', (), b'100%'),
+])
+def test_tparm(template, params, expected):
+
+    assert tparm(template, *params) == expected
+
+
+def test_json_round_trip():
+
+    info = TermInfo('test', {'cup': b'\x1b[%i%p1%d;%p2%dH', 'bel': None,
+                             'smso': b'\xff'},
+                    {'colors': 256}, {'am': True})
+
+    copy = TermInfo.from_json(json.loads(json.dumps(info.to_json())))
+
+    assert copy.get('cup') == info.get('cup')
+    assert copy.get('smso') == b'\xff'
+    assert not copy.has('bel')
+    assert copy.num('colors') == 256
+    assert copy.num('lines') == -1
+    assert copy.flag('am') and not copy.flag('bce')
+    assert copy.param('cup', 1, 2) == b'\x1b[2;3H'
+    assert copy.param('bel') == b''
+
+
+def test_load_does_not_persist_by_default(tmp_path, monkeypatch):
+
+    monkeypatch.setenv('XDG_CACHE_HOME', str(tmp_path))
+    monkeypatch.setattr(_terminfo, '_loaded', {})
+
+    _terminfo.load('xterm-256color')
+
+    assert list(tmp_path.iterdir()) == []
+
+
+def test_param_cache_is_bounded(monkeypatch):
+
+    monkeypatch.setattr(_terminfo, '_PARAM_CACHE_SIZE', 4)
+    info = TermInfo('test', {'cup': b'\x1b[%i%p1%d;%p2%dH'}, {}, {})
+
+    for y in range(10):
+        assert info.param('cup', y, 0) == f'\x1b[{y + 1};1H'.encode()
+
+    assert list(info._params) == [('cup', (y, 0)) for y in range(6, 10)]
+
+
+def test_load_uses_persistent_cache(tmp_path, monkeypatch):
+
+    term = 'xterm-256color'
+    if _terminfo.find_source(term) is None:
+        pytest.skip(f"no terminfo entry for {term}")
+
+    monkeypatch.setenv('XDG_CACHE_HOME', str(tmp_path))
+    monkeypatch.setattr(_terminfo, '_loaded', {})
+
+    compiled = []
+    compile_ = _terminfo._compile
+
+    def counting(*args):
+        compiled.append(args)
+        return compile_(*args)
+
+    monkeypatch.setattr(_terminfo, '_compile', counting)
+
+    first = _terminfo.load(term, persist=True)
+    assert (tmp_path / 'ezconsole' / 'terminfo' / f'{term}.json').exists()
+    assert _terminfo.load(term, persist=True) is first
+
+    monkeypatch.setattr(_terminfo, '_loaded', {})
+    second = _terminfo.load(term, persist=True)
+
+    assert len(compiled) == 1
+    assert second is not first
+    assert second.to_json() == first.to_json()
+
+    monkeypatch.setattr(_terminfo, '_loaded', {})
+    monkeypatch.setattr(_terminfo, 'find_source',
+                        lambda name: ('/elsewhere', 0))
+    _terminfo.load(term, persist=True)
+
+    assert len(compiled) == 2
@@ -0,0 +1,123 @@
+#!/usr/bin/env python3
+
+import random
+
+import numpy as np
+
+from ezconsole import TextArea, TextInput, events
+from ezconsole.textinput import _GapBuffer
+
+
+def _lines(cells: np.ndarray):
+
+    return [''.join(row) for row in cells]
+
+
+def _type(element, *keys) -> None:
+
+    for key in keys:
+
+        if isinstance(key, events.Event):
+            element.handle_event(key)
+        elif len(key) == 1:
+            element.handle_event(events.KeyEvent(key, key))
+        else:
+            element.handle_event(events.KeyEvent(key))
+
+
+def test_gap_buffer_matches_string():
+
+    rng = random.Random(0)
+    buffer = _GapBuffer('hello', gap=2)
+    model = 'hello'
+
+    for _ in range(2000):
+
+        pos = rng.randint(0, len(model))
+
+        if rng.random() < 0.6:
+            text = ''.join(rng.choices('abcü ', k=rng.randint(0, 9)))
+            buffer.insert(pos, text)
+            model = model[:pos] + text + model[pos:]
+
+        else:
+            n = rng.randint(0, 5)
+            buffer.delete(pos, n)
+            model = model[:pos] + model[pos + n:]
+
+        assert len(buffer) == len(model)
+
+        start = rng.randint(0, len(model))
+        stop = rng.randint(start, len(model))
+        assert buffer.slice(start, stop) == model[start:stop]
+
+    assert buffer.text() == model
+
+
+def test_text_input_editing():
+
+    element = TextInput('ab')
+
+    _type(element, 'c', events.LeftNavEvent(), events.LeftNavEvent(), 'X',
+          'end', 'backspace', 'home', 'delete')
+
+    assert element.value == 'Xb'
+    assert element.get_cursor() == 0
+
+    element.handle_event(events.PasteEvent('1\r\n2\n3'))
+
+    assert element.value == '1 2 3Xb'
+    assert element.get_cursor() == 5
+    assert not element.handle_event(events.KeyEvent('f1'))
+
+
+def test_text_input_scrolls_to_cursor():
+
+    element = TextInput('abcdefghij', width=4)
+    cells = np.zeros((1, 4), dtype='=U1')
+
+    element.draw(cells)
+    assert _lines(cells) == ['hij█']
+
+    _type(element, 'home')
+    element.draw(cells)
+    assert _lines(cells) == ['█bcd']
+
+
+def test_text_area_lines():
+
+    element = TextArea('one\ntwo')
+
+    _type(element, 'end', 'enter', 'x', events.DownNavEvent(), 'y')
+    assert element.value == 'one\nx\ntywo'
+    assert element.get_cursor() == (2, 2)
+
+    _type(element, 'home', 'backspace')
+    assert element.value == 'one\nxtywo'
+    assert element.get_cursor() == (1, 1)
+
+    _type(element, events.UpNavEvent(), 'end', 'delete')
+    assert element.value == 'onextywo'
+    assert element.line_count() == 1
+
+    element.handle_event(events.PasteEvent('a\r\nb\rc'))
+    assert element.value == 'onea\nb\ncxtywo'
+    assert element.get_cursor() == (2, 1)
+
+
+def test_text_area_renders_visible_window():
+
+    element = TextArea('\n'.join(str(i) for i in range(10)), rows=3, width=4)
+    cells = np.zeros((3, 4), dtype='=U1')
+
+    element.draw(cells)
+    assert _lines(cells) == ['█', '1', '2']
+
+    _type(element, 'pagedown', 'pagedown')
+    element.draw(cells)
+    assert _lines(cells) == ['2', '3', '█']
+
+    _type(element, events.LeftNavEvent())
+    element.draw(cells)
+    assert element.get_cursor() == (3, 1)
+    assert _lines(cells) == ['2', '3█', '4']
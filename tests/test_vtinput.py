@@ -0,0 +1,157 @@
+#!/usr/bin/env python3
+
+from ezconsole import events
+from ezconsole.abstract import _vtinput
+from ezconsole.abstract._vtinput import VTInputParser
+
+
+def _describe(event: events.Event):
+
+    if isinstance(event, events.KeyEvent):
+        return 'key', event.key, event.text
+
+    if isinstance(event, events.PasteEvent):
+        return 'paste', event.text, event.final
+
+    if isinstance(event, events.ModeReportEvent):
+        return 'mode', event.mode, event.state
+
+    return type(event).__name__
+
+
+def _feed(parser: VTInputParser, *chunks: bytes):
+
+    return [_describe(event)
+            for chunk in chunks for event in parser.feed(chunk)]
+
+
+def test_keys():
+
+    assert _feed(VTInputParser(), 'aé\r\t\x7f\x01'.encode()) == [
+        ('key', 'a', 'a'),
+        ('key', 'é', 'é'),
+        ('key', 'enter', ''),
+        ('key', 'tab', ''),
+        ('key', 'backspace', ''),
+        ('key', 'ctrl-a', ''),
+    ]
+
+
+def test_escape_sequences():
+
+    assert _feed(VTInputParser(), b'\x1b[A\x1bOB\x1b[3~\x1b[H\x1bx') == [
+        'UpNavEvent',
+        'DownNavEvent',
+        ('key', 'delete', ''),
+        ('key', 'home', ''),
+        ('key', 'alt-x', ''),
+    ]
+
+
+def test_sequence_split_across_reads():
+
+    parser = VTInputParser()
+
+    assert _feed(parser, b'a\x1b') == [('key', 'a', 'a')]
+    assert parser.has_escape()
+    assert _feed(parser, b'[') == []
+    assert not parser.has_escape()
+    assert _feed(parser, b'1;5C') == ['RightNavEvent']
+    assert parser.flush() == []
+
+
+def test_trailing_escape_is_resolved_by_flush():
+
+    parser = VTInputParser()
+
+    assert _feed(parser, b'\x1b') == []
+    assert [_describe(event) for event in parser.flush()] == ['QuitEvent']
+    assert not parser.has_escape()
+    assert _feed(parser, b'q') == [('key', 'q', 'q')]
+
+
+def test_split_utf8():
+
+    parser = VTInputParser()
+    data = 'ü'.encode()
+
+    assert _feed(parser, data[:1], data[1:]) == [('key', 'ü', 'ü')]
+
+
+def test_bracketed_paste_across_reads():
+
+    parser = VTInputParser()
+
+    assert _feed(parser, b'\x1b[200~one\r\x1b', b'two\x1b[20',
+                 b'1~x') == [
+        ('paste', 'one\r\x1btwo', True),
+        ('key', 'x', 'x'),
+    ]
+
+
+def test_reports():
+
+    assert _feed(VTInputParser(), b'\x1b[?2026;2$y\x1b[?64;1c') == [
+        ('mode', 2026, 2),
+        'DeviceAttributesEvent',
+    ]
+
+
+def test_long_paste_is_delivered_in_chunks(monkeypatch):
+
+    monkeypatch.setattr(_vtinput, 'PASTE_CHUNK', 8)
+    parser = VTInputParser()
+
+    assert _feed(parser, b'\x1b[200~abcdefghij', b'kl\x1b[201~') == [
+        ('paste', 'abcdefghij', False),
+        ('paste', 'kl', True),
+    ]
+
+
+def test_paste_chunks_do_not_split_characters(monkeypatch):
+
+    monkeypatch.setattr(_vtinput, 'PASTE_CHUNK', 4)
+    parser = VTInputParser()
+    data = 'aüüü'.encode()
+
+    events = parser.feed(b'\x1b[200~' + data[:4])
+    events += parser.feed(data[4:] + b'\x1b[201~')
+
+    assert ''.join(event.text for event in events) == 'aüüü'
+    assert [event.final for event in events][-1]
+
+
+def test_escape_before_non_printable_is_kept():
+
+    assert _feed(VTInputParser(), b'\x1b\x1bx') == [
+        ('key', 'escape', ''),
+        ('key', 'alt-x', ''),
+    ]
+
+    assert _feed(VTInputParser(), b'\x1b ') == [
+        ('key', 'escape', ''),
+        ('key', ' ', ' '),
+    ]
+
+    assert _feed(VTInputParser(), b'\x1b\x01\x1b\x7f\x1b\r') == [
+        ('key', 'escape', ''),
+        ('key', 'ctrl-a', ''),
+        ('key', 'escape', ''),
+        ('key', 'backspace', ''),
+        ('key', 'escape', ''),
+        ('key', 'enter', ''),
+    ]
+
+    assert _feed(VTInputParser(), '\x1bé'.encode()) == [
+        ('key', 'escape', ''),
+        ('key', 'é', 'é'),
+    ]
+
+
+def test_double_escape_then_timeout():
+
+    parser = VTInputParser()
+
+    assert _feed(parser, b'\x1b\x1b') == [('key', 'escape', '')]
+    assert parser.has_escape()
+    assert [_describe(event) for event in parser.flush()] == ['QuitEvent']
@@ -0,0 +1,104 @@
+#!/usr/bin/env python3
+
+from types import SimpleNamespace
+
+import pytest
+
+from ezconsole import events
+
+win32 = pytest.importorskip('ezconsole.abstract.win32', exc_type=ImportError)
+
+
+def _record(char: str = '', vk: int = 0, state: int = 0, down: bool = True,
+            repeat: int = 1):
+
+    return SimpleNamespace(EventType=0x0001, KeyEvent=SimpleNamespace(
+        bKeyDown=down,
+        wRepeatCount=repeat,
+        wVirtualKeyCode=vk,
+        wVirtualScanCode=0,
+        UnicodeChar=char,
+        dwControlKeyState=state,
+    ))
+
+
+def _typed(text: str):
+
+    records = []
+
+    for char in text:
+        vk = 0x0d if char == '\r' else ord(char.upper())
+        records.append(_record(char, vk))
+        records.append(_record(char, vk, down=False))
+
+    return records
+
+
+def _describe(event: events.Event):
+
+    if isinstance(event, events.KeyEvent):
+        return event.key
+
+    if isinstance(event, events.PasteEvent):
+        return 'paste', event.text, event.final
+
+    return type(event).__name__
+
+
+def _translate(records, final: bool = True):
+
+    paste = win32._is_paste(records)
+    return [_describe(event)
+            for event in win32._translate(records, paste, final)]
+
+
+def test_fast_typing_is_not_a_paste():
+
+    assert _translate(_typed('hello')) == ['h', 'e', 'l', 'l', 'o']
+
+
+def test_key_repeat_is_not_a_paste():
+
+    assert _translate([_record('x', 0x58, repeat=3)]) == ['x', 'x', 'x']
+
+
+def test_enter_and_tab_are_keys():
+
+    assert _translate(_typed('a\r')) == ['a', 'enter']
+
+
+def test_multiline_batch_is_a_paste():
+
+    assert _translate(_typed('first line\rsecond'), final=False) == [
+        ('paste', 'first line\nsecond', False),
+    ]
+
+
+def test_navigation_keys():
+
+    assert _translate([_record(vk=0x26), _record(vk=0x2e),
+                       _record('\x1b', 0x1b)]) == [
+        'UpNavEvent',
+        'delete',
+        'QuitEvent',
+    ]
+
+
+def test_modified_keys_match_vt_names():
+
+    from ezconsole.abstract._vtinput import VTInputParser
+
+    left_ctrl, left_alt, right_alt = 0x0008, 0x0002, 0x0001
+
+    keys = _translate([
+        _record('\x18', 0x58, left_ctrl),
+        _record('\x13', 0x53, left_ctrl),
+        _record('f', 0x46, left_alt),
+        _record(' ', 0x20, left_ctrl),
+        _record('@', 0x51, left_ctrl | right_alt),
+    ])
+    expected = [_describe(event)
+                for event in VTInputParser().feed(b'\x18\x13\x1bf\x00@')]
+
+    assert keys == expected == ['ctrl-x', 'ctrl-s', 'alt-f', 'ctrl-space',
+                                '@']